@@ -3,8 +3,9 @@ Ce module contient la classe AerodynamicsAnalyzer qui permet d'analyser les perf
 Il comprend des méthodes pour générer et tracer les coordonnées du profil d'aile ainsi que pour tracer les polaires aérodynamiques.
 """
 
-import numpy as np
-import matplotlib.pyplot as plt
+from instrumentation import profiled, stage
+from naca_geometry import coordonnees_symetriques, grille
+from polar_interpolation import PolarInterpolator
 
 
 class AerodynamicsAnalyzer:
@@ -30,28 +31,35 @@ class AerodynamicsAnalyzer:
 
         :return: Tableau numpy de valeurs réparties uniformément de 0 à 1
         """
-        return np.linspace(0, 1, 100)  # Répartition uniforme avec 100 points le long de la corde
+        return grille(100, 'uniforme').copy()  # Répartition uniforme avec 100 points le long de la corde
 
+    @profiled
     def calculer_coordonnees(self, t):
         """
         Calcule les coordonnées du profil d'aile basé sur les équations NACA.
 
-        :param t: Épaisseur relative de l'aile (en pourcentage)
+        :param t: Épaisseur relative de l'aile (en pourcentage), scalaire ou tableau d'épaisseurs
         :return: Coordonnées x et y pour l'extrados et l'intrados
         """
-        xc = self.generer_xc()
-        # Calcul des coordonnées y basées sur la formule NACA pour une épaisseur relative donnée
-        yt = 5 * t * (0.2969 * np.sqrt(xc) - 0.1260 * xc - 0.3516 * xc ** 2 + 0.2843 * xc ** 3 - 0.1036 * xc ** 4)
-        xup = xc * self.corde
-        yup = yt * self.corde
-        xdown = xc * self.corde
-        ydown = -yt * self.corde
-        return xup, yup, xdown, ydown
+        # Calcul des coordonnées y basées sur la formule NACA, loi d'épaisseur mémorisée pour la grille de 100 points
+        return coordonnees_symetriques(t, self.corde, n_points=100, espacement='uniforme')
 
+    @profiled
+    def interpolateur(self, methode='pchip'):
+        """
+        Construit l'interpolateur de la polaire, à conserver pour les requêtes répétées.
+
+        :param methode: 'pchip' (spline monotone) ou 'lineaire'
+        :return: PolarInterpolator construit à partir de alpha_data, cl_data et cd_data
+        """
+        return PolarInterpolator(self.alpha_data, self.cl_data, self.cd_data, methode=methode)
+
+    @profiled
     def tracer_profil(self):
         """
         Trace le profil de l'aile NACA basé sur les chiffres fournis.
         """
+        import matplotlib.pyplot as plt  # Import différé : matplotlib n'est chargé que pour tracer
         t = int(self.profil_aile) / 100  # Convertir le profil d'aile en épaisseur relative
         xup, yup, xdown, ydown = self.calculer_coordonnees(t)
         plt.figure(figsize=(10, 5))
@@ -64,12 +72,15 @@ class AerodynamicsAnalyzer:
         plt.axvline(0, color='black', linewidth=0.5)
         plt.grid(color='gray', linestyle='--', linewidth=0.5)
         plt.legend()
-        plt.show()
+        with stage('AerodynamicsAnalyzer.show'):  # Attente de la fermeture de la fenêtre
+            plt.show()
 
+    @profiled
     def plot_polar_cl_alpha(self):
         """
         Trace la polaire aérodynamique C_L vs α.
         """
+        import matplotlib.pyplot as plt  # Import différé : matplotlib n'est chargé que pour tracer
         if len(self.alpha_data) != len(self.cl_data):
             raise ValueError("alpha_data and cl_data must have the same length.")
         plt.figure(figsize=(8, 6))
@@ -79,12 +90,15 @@ class AerodynamicsAnalyzer:
         plt.grid(True)
         plt.legend()
         plt.title(f'Polaire C_L vs α pour le profil d\'aile NACA00{self.profil_aile}')
-        plt.show()
+        with stage('AerodynamicsAnalyzer.show'):  # Attente de la fermeture de la fenêtre
+            plt.show()
 
+    @profiled
     def plot_polar_cl_cd(self):
         """
         Trace la polaire aérodynamique C_L vs C_D.
         """
+        import matplotlib.pyplot as plt  # Import différé : matplotlib n'est chargé que pour tracer
         if len(self.cl_data) != len(self.cd_data):
             raise ValueError("cl_data and cd_data must have the same length.")
         plt.figure(figsize=(8, 6))
@@ -94,4 +108,5 @@ class AerodynamicsAnalyzer:
         plt.grid(True)
         plt.legend()
         plt.title(f'Polaire C_D vs C_L pour le profil d\'aile NACA00{self.profil_aile}')
-        plt.show()
+        with stage('AerodynamicsAnalyzer.show'):  # Attente de la fermeture de la fenêtre
+            plt.show()
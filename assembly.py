@@ -0,0 +1,344 @@
+"""
+Ce module contient la classe AssemblyTree qui décrit l'avion comme un arbre d'ensembles, de sous-ensembles
+et de pièces, plutôt que comme une liste plate de composants.
+
+Chaque nœud conserve son poids propre et sa position, ainsi que le poids total et les moments de tout son
+sous-arbre. Lorsqu'une pièce est modifiée, seuls les nœuds du chemin vers la racine sont mis à jour (coût
+proportionnel à la profondeur) ; le centre de gravité de n'importe quel ensemble s'obtient ensuite en temps
+constant.
+
+Format CSV : colonnes component, parent, position_x, position_y, position_z, poids. Un parent vide désigne un
+ensemble de premier niveau ; les positions d'un ensemble sans poids propre peuvent être laissées vides.
+"""
+
+import numpy as np
+
+from center_of_gravity import CenterOfGravityCalculator
+
+# Types explicites des colonnes du fichier d'arbre, pour éviter l'inférence de types par pandas
+ASSEMBLY_DTYPES = {
+    'component': str,
+    'parent': str,
+    'position_x': np.float64,
+    'position_y': np.float64,
+    'position_z': np.float64,
+    'poids': np.float64,
+}
+
+
+class _Noeud:
+    __slots__ = ('nom', 'parent', 'enfants', 'poids', 'position', 'total', 'moments')
+
+    def __init__(self, nom, parent, position, poids):
+        """
+        Nœud de l'arbre : pièce ou ensemble.
+
+        :param nom: Nom du nœud
+        :param parent: Nom du nœud parent, ou None pour un ensemble de premier niveau
+        :param position: Position [x, y, z] du poids propre
+        :param poids: Poids propre (hors enfants)
+        """
+        self.nom = nom
+        self.parent = parent
+        self.enfants = []
+        self.poids = poids
+        self.position = position
+        self.total = 0.0  # Poids du sous-arbre
+        self.moments = [0.0, 0.0, 0.0]  # Moments du sous-arbre autour des axes x, y, z
+
+
+class AssemblyTree:
+    def __init__(self, records=()):
+        """
+        Construit l'arbre à partir d'une liste de nœuds, dans un ordre quelconque.
+
+        :param records: Itérable de tuples (component, parent, position, poids), parent None (ou '') pour un ensemble
+                        de premier niveau et position None pour un ensemble sans poids propre
+        """
+        self._noeuds = {}
+        self.racines = []  # Ensembles de premier niveau
+        self.total_weight = 0.0  # Poids total de l'avion
+        self.moments = [0.0, 0.0, 0.0]  # Moments de l'avion autour des axes x, y, z
+        for component, parent, position, poids in records:
+            if component in self._noeuds:
+                raise ValueError(f"Duplicate component: {component!r}")
+            self._noeuds[component] = _Noeud(component, parent or None, self._position(component, position, poids),
+                                             float(poids))
+        for noeud in self._noeuds.values():
+            if noeud.parent is None:
+                self.racines.append(noeud.nom)
+            elif noeud.parent not in self._noeuds:
+                raise ValueError(f"Unknown parent {noeud.parent!r} of component {noeud.nom!r}")
+            else:
+                self._noeuds[noeud.parent].enfants.append(noeud.nom)
+        self.resync()
+
+    @staticmethod
+    def _position(component, position, poids):
+        """
+        Vérifie la position d'un nœud ; un ensemble sans poids propre peut ne pas en avoir.
+        """
+        if position is None or any(v != v for v in position):  # Position absente ou incomplète (NaN)
+            if poids:
+                raise ValueError(f"Component {component!r} has a weight but no position.")
+            return [0.0, 0.0, 0.0]
+        return [float(v) for v in position]
+
+    @classmethod
+    def from_csv(cls, filepath):
+        """
+        Charge un arbre depuis un fichier CSV (colonnes component, parent, position_x, position_y, position_z, poids).
+
+        :param filepath: Chemin du fichier CSV
+        :return: AssemblyTree
+        """
+        import pandas as pd  # Import différé : pandas n'est chargé que pour lire un fichier
+        df = pd.read_csv(filepath, dtype=ASSEMBLY_DTYPES, keep_default_na=False,
+                         na_values={c: [''] for c in ('position_x', 'position_y', 'position_z', 'poids')})
+        positions = df[['position_x', 'position_y', 'position_z']].to_numpy().tolist()
+        poids = df['poids'].fillna(0.0).tolist()
+        return cls(zip(df['component'].tolist(), df['parent'].tolist(), positions, poids))
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Construit un arbre à un seul niveau à partir des composants au format habituel.
+
+        :param data: Dictionnaire ou ComponentTable contenant les positions et poids des composants
+        :return: AssemblyTree
+        """
+        return cls((component, None, properties['position'], properties['poids'])
+                   for component, properties in data.items())
+
+    def __contains__(self, component):
+        return component in self._noeuds
+
+    def __len__(self):
+        return len(self._noeuds)
+
+    def parent(self, component):
+        """
+        :return: Nom de l'ensemble parent, ou None pour un ensemble de premier niveau
+        """
+        return self._noeuds[component].parent
+
+    def children(self, component=None):
+        """
+        :param component: Nom de l'ensemble (None : ensembles de premier niveau)
+        :return: Liste des noms des enfants directs
+        """
+        return list(self.racines if component is None else self._noeuds[component].enfants)
+
+    def path(self, component):
+        """
+        :return: Liste des noms du nœud jusqu'à son ensemble de premier niveau inclus
+        """
+        chemin = []
+        while component is not None:
+            chemin.append(component)
+            component = self._noeuds[component].parent
+        return chemin
+
+    def subtree(self, component):
+        """
+        :return: Liste des noms du sous-arbre, en profondeur d'abord (chaque ensemble suivi de ses descendants)
+        """
+        noms = []
+        pile = [component]
+        while pile:
+            nom = pile.pop()
+            noms.append(nom)
+            pile.extend(reversed(self._noeuds[nom].enfants))
+        return noms
+
+    def weight(self, component=None):
+        """
+        Poids d'un sous-arbre, en temps constant.
+
+        :param component: Nom du nœud (None : avion complet)
+        :return: Poids total du sous-arbre
+        """
+        return self.total_weight if component is None else self._noeuds[component].total
+
+    def cg(self, component=None):
+        """
+        Centre de gravité d'un sous-arbre, en temps constant à partir des moments conservés.
+
+        :param component: Nom du nœud (None : avion complet)
+        :return: Tuple contenant les coordonnées du centre de gravité (cg_x, cg_y, cg_z)
+        """
+        if component is None:
+            if not self._noeuds:
+                raise ZeroDivisionError("Total weight is zero, the center of gravity is undefined.")
+            total, moments = self.total_weight, self.moments
+        else:
+            noeud = self._noeuds[component]
+            total, moments = noeud.total, noeud.moments
+        if total == 0:
+            raise ZeroDivisionError("Total weight is zero, the center of gravity is undefined.")
+        return tuple(moment / total for moment in moments)
+
+    def _propager(self, component, poids, moments):
+        """
+        Ajoute un écart de poids et de moments au nœud et à tous ses ancêtres, puis à l'avion complet.
+        """
+        mx, my, mz = moments
+        noeuds = self._noeuds
+        while component is not None:
+            noeud = noeuds[component]
+            noeud.total += poids
+            m = noeud.moments
+            m[0] += mx
+            m[1] += my
+            m[2] += mz
+            component = noeud.parent
+        self.total_weight += poids
+        self.moments[0] += mx
+        self.moments[1] += my
+        self.moments[2] += mz
+
+    def _cg_defini(self):
+        # Un avion vide n'a pas de centre de gravité, quel que soit le résidu d'arrondi (voir remove)
+        return bool(self._noeuds) and self.total_weight != 0
+
+    def _cg_ou_none(self):
+        return self.cg() if self._cg_defini() else None
+
+    def _deplacement(self, ancien_cg):
+        """
+        :return: Déplacement (dx, dy, dz) du centre de gravité de l'avion, ou None s'il n'est pas défini
+        """
+        if ancien_cg is None or not self._cg_defini():
+            return None
+        return tuple(nouveau - ancien for nouveau, ancien in zip(self.cg(), ancien_cg))
+
+    def update(self, component, poids=None, position=None):
+        """
+        Modifie le poids propre et/ou la position d'un nœud ; seuls ses ancêtres sont mis à jour.
+
+        :param component: Nom du nœud
+        :param poids: Nouveau poids propre (inchangé si None)
+        :param position: Nouvelle position [x, y, z] (inchangée si None)
+        :return: Déplacement (dx, dy, dz) du centre de gravité de l'avion
+        """
+        noeud = self._noeuds[component]
+        ancien_cg = self._cg_ou_none()
+        nouveau_poids = noeud.poids if poids is None else float(poids)
+        nouvelle_position = noeud.position if position is None else [float(v) for v in position]
+        ecart_moments = [nouveau_poids * nouvelle_position[axe] - noeud.poids * noeud.position[axe]
+                         for axe in range(3)]
+        ecart_poids = nouveau_poids - noeud.poids
+        noeud.poids, noeud.position = nouveau_poids, nouvelle_position
+        self._propager(component, ecart_poids, ecart_moments)
+        return self._deplacement(ancien_cg)
+
+    def add(self, component, parent, position, poids):
+        """
+        Ajoute une pièce (ou un ensemble vide) sous un ensemble existant.
+
+        :param component: Nom du nouveau nœud
+        :param parent: Nom de l'ensemble parent, ou None pour un ensemble de premier niveau
+        :param position: Position [x, y, z]
+        :param poids: Poids propre
+        :return: Déplacement (dx, dy, dz) du centre de gravité de l'avion
+        """
+        if component in self._noeuds:
+            raise KeyError(f"Component '{component}' already exists, use update() instead.")
+        if parent is not None and parent not in self._noeuds:
+            raise ValueError(f"Unknown parent {parent!r} of component {component!r}")
+        ancien_cg = self._cg_ou_none()
+        noeud = _Noeud(component, parent, self._position(component, position, poids), float(poids))
+        self._noeuds[component] = noeud
+        (self.racines if parent is None else self._noeuds[parent].enfants).append(component)
+        self._propager(component, noeud.poids, [noeud.poids * v for v in noeud.position])
+        return self._deplacement(ancien_cg)
+
+    def _detacher(self, component):
+        """
+        Retire le sous-arbre des totaux de ses ancêtres et de la liste des enfants de son parent.
+        """
+        noeud = self._noeuds[component]
+        self._propager(noeud.parent, -noeud.total, [-m for m in noeud.moments])
+        (self.racines if noeud.parent is None else self._noeuds[noeud.parent].enfants).remove(component)
+
+    def remove(self, component):
+        """
+        Retire un nœud et tout son sous-arbre.
+
+        :param component: Nom du nœud
+        :return: Déplacement (dx, dy, dz) du centre de gravité de l'avion
+        """
+        ancien_cg = self._cg_ou_none()
+        self._detacher(component)
+        for nom in self.subtree(component):
+            del self._noeuds[nom]
+        if not self._noeuds:
+            # Arbre vide : remise à zéro exacte plutôt qu'un résidu d'arrondi
+            self.total_weight = 0.0
+            self.moments = [0.0, 0.0, 0.0]
+        return self._deplacement(ancien_cg)
+
+    def move(self, component, parent):
+        """
+        Rattache un sous-arbre à un autre ensemble (le centre de gravité de l'avion est inchangé).
+
+        :param component: Nom du nœud déplacé
+        :param parent: Nom du nouvel ensemble parent, ou None pour le premier niveau
+        """
+        if parent is not None:
+            if parent not in self._noeuds:
+                raise ValueError(f"Unknown parent {parent!r} of component {component!r}")
+            if component in self.path(parent):
+                raise ValueError(f"Moving {component!r} under {parent!r} would create a cycle.")
+        noeud = self._noeuds[component]
+        self._detacher(component)
+        noeud.parent = parent
+        (self.racines if parent is None else self._noeuds[parent].enfants).append(component)
+        self._propager(parent, noeud.total, list(noeud.moments))
+
+    def resync(self):
+        """
+        Recalcule entièrement les poids et moments de tous les sous-arbres, des feuilles vers les racines.
+        Vérifie au passage l'absence de cycle dans les relations parent/enfant.
+        """
+        ordre = list(self.racines)
+        for nom in ordre:
+            ordre.extend(self._noeuds[nom].enfants)
+        if len(ordre) != len(self._noeuds):
+            cycle = sorted(set(self._noeuds) - set(ordre))
+            raise ValueError(f"Parent/child cycle between components: {', '.join(map(repr, cycle))}")
+
+        for noeud in self._noeuds.values():
+            noeud.total = noeud.poids
+            noeud.moments = [noeud.poids * v for v in noeud.position]
+        for nom in reversed(ordre):
+            noeud = self._noeuds[nom]
+            if noeud.parent is not None:
+                parent = self._noeuds[noeud.parent]
+                parent.total += noeud.total
+                for axe in range(3):
+                    parent.moments[axe] += noeud.moments[axe]
+        self.total_weight = sum(self._noeuds[nom].total for nom in self.racines)
+        self.moments = [sum(self._noeuds[nom].moments[axe] for nom in self.racines) for axe in range(3)]
+
+    def to_dict(self, component=None):
+        """
+        Liste à plat des nœuds de poids propre non nul, au format utilisé par CenterOfGravityCalculator.
+
+        :param component: Limiter au sous-arbre de ce nœud (None : avion complet)
+        :return: Dictionnaire {nom: {'position': [x, y, z], 'poids': w}}
+        """
+        noms = self.subtree(component) if component is not None else list(self._noeuds)
+        return {nom: {'position': list(self._noeuds[nom].position), 'poids': self._noeuds[nom].poids}
+                for nom in noms if self._noeuds[nom].poids != 0}
+
+    def check_consistency(self, rtol=1e-9, atol=1e-9):
+        """
+        Compare le centre de gravité conservé à un recalcul complet par CenterOfGravityCalculator.
+
+        :param rtol: Tolérance relative
+        :param atol: Tolérance absolue
+        :return: True si les deux calculs concordent à la tolérance près
+        """
+        reference = CenterOfGravityCalculator(self.to_dict()).calculate()
+        return bool(np.allclose(self.cg(), reference, rtol=rtol, atol=atol))
@@ -0,0 +1,4 @@
+"""
+Scripts de mesure des performances du programme.
+Chaque module s'exécute depuis la racine du projet, par exemple : python -m benchmarks.bench_cg_batch
+"""
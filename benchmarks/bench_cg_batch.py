@@ -0,0 +1,60 @@
+"""
+Compare le calcul vectorisé calculate_batch à une boucle d'appels à CenterOfGravityCalculator.calculate
+sur un grand nombre de configurations de chargement.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from center_of_gravity import CenterOfGravityCalculator, calculate_batch
+from data_import import DataImporter
+
+
+def generer_configurations(n_configs, data, seed=0):
+    """
+    Génère des configurations de chargement en faisant varier le poids de chaque composant de ±20 %.
+
+    :param n_configs: Nombre de configurations à générer
+    :param data: Dictionnaire des composants de référence
+    :param seed: Graine du générateur aléatoire
+    :return: Tuple (noms, matrice des poids (n_configs, N), positions (N, 3))
+    """
+    noms, poids, positions = CenterOfGravityCalculator(data).to_arrays()
+    rng = np.random.default_rng(seed)
+    facteurs = rng.uniform(0.8, 1.2, size=(n_configs, len(noms)))
+    return noms, poids * facteurs, positions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--configs', type=int, default=20000, help="Nombre de configurations de chargement")
+    args = parser.parse_args()
+
+    data = DataImporter().default_components_data()
+    noms, matrice_poids, positions = generer_configurations(args.configs, data)
+
+    # Référence : un appel à calculate() par configuration, dictionnaires construits hors chronométrage
+    configs = [{nom: {'position': positions[i].tolist(), 'poids': float(ligne[i])} for i, nom in enumerate(noms)}
+               for ligne in matrice_poids]
+    debut = time.perf_counter()
+    cg_boucle = [CenterOfGravityCalculator(config).calculate() for config in configs]
+    duree_boucle = time.perf_counter() - debut
+
+    # Calcul vectorisé de toutes les configurations en un seul appel
+    debut = time.perf_counter()
+    cg_batch, _ = calculate_batch(matrice_poids, positions)
+    duree_batch = time.perf_counter() - debut
+
+    if not np.allclose(cg_batch, np.array(cg_boucle), rtol=1e-12, atol=1e-12):
+        raise AssertionError("calculate_batch and calculate() disagree.")
+
+    print(f"Configurations      : {args.configs}")
+    print(f"Boucle calculate()  : {duree_boucle:.4f} s")
+    print(f"calculate_batch     : {duree_batch:.4f} s")
+    print(f"Accélération        : x{duree_boucle / duree_batch:.0f}")
+
+
+if __name__ == "__main__":
+    main()
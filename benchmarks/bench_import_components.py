@@ -0,0 +1,82 @@
+"""
+Mesure l'import d'un gros fichier de composants : chemin vectorisé data_component, lecture par blocs
+component_moments et, sur un échantillon, l'ancienne construction ligne par ligne avec iterrows.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from center_of_gravity import CenterOfGravityCalculator, cg_from_moments
+from data_import import DataImporter
+from benchmarks.generators import write_components_csv as generer_fichier
+
+
+def mesurer(fonction):
+    """
+    Exécute fonction en mesurant la durée et le pic de mémoire alloué.
+
+    :return: Tuple (résultat, durée en secondes, pic mémoire en Mo)
+    """
+    tracemalloc.start()
+    debut = time.perf_counter()
+    resultat = fonction()
+    duree = time.perf_counter() - debut
+    _, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultat, duree, pic / 1e6
+
+
+def iterrows_component(filepath):
+    """
+    Ancienne implémentation de data_component, conservée pour comparaison.
+    """
+    data = {}
+    for _, row in pd.read_csv(filepath).iterrows():
+        data[row['component']] = {'position': [row['position_x'], row['position_y'], row['position_z']],
+                                  'poids': row['poids']}
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=10_000_000, help="Nombre de lignes du fichier généré")
+    parser.add_argument('--chunksize', type=int, default=1_000_000, help="Taille des blocs en lecture par blocs")
+    parser.add_argument('--iterrows-rows', type=int, default=100_000,
+                        help="Nombre de lignes utilisées pour mesurer l'ancienne implémentation")
+    args = parser.parse_args()
+
+    importer = DataImporter()
+    with tempfile.TemporaryDirectory() as dossier:
+        filepath = os.path.join(dossier, 'components.csv')
+        debut = time.perf_counter()
+        generer_fichier(filepath, args.rows)
+        print(f"Fichier de {args.rows} lignes généré en {time.perf_counter() - debut:.1f} s "
+              f"({os.path.getsize(filepath) / 1e6:.0f} Mo)")
+
+        (poids_total, moments), duree, pic = mesurer(lambda: importer.component_moments(filepath, args.chunksize))
+        cg_stream = cg_from_moments(poids_total, moments)
+        print(f"component_moments : {duree:.2f} s, pic mémoire {pic:.0f} Mo, CG {cg_stream}")
+
+        table, duree, pic = mesurer(lambda: importer.data_component(filepath))
+        cg_table = CenterOfGravityCalculator(table).calculate()
+        print(f"data_component    : {duree:.2f} s, pic mémoire {pic:.0f} Mo, CG {cg_table}")
+
+        if not np.allclose(cg_stream, cg_table):
+            raise AssertionError("Streaming and in-memory imports disagree.")
+
+        echantillon = os.path.join(dossier, 'echantillon.csv')
+        generer_fichier(echantillon, args.iterrows_rows)
+        _, duree_iterrows, _ = mesurer(lambda: iterrows_component(echantillon))
+        _, duree_rapide, _ = mesurer(lambda: importer.data_component(echantillon))
+        print(f"iterrows ({args.iterrows_rows} lignes) : {duree_iterrows:.2f} s, "
+              f"data_component : {duree_rapide:.3f} s (x{duree_iterrows / duree_rapide:.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Mesure le débit des requêtes vectorisées de PolarInterpolator (points évalués par seconde).
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from aerodynamics import AerodynamicsAnalyzer
+from data_import import DataImporter
+
+
+def debit(fonction, valeurs, repetitions):
+    """
+    Retourne le nombre de points évalués par seconde par fonction.
+    """
+    debut = time.perf_counter()
+    for _ in range(repetitions):
+        fonction(valeurs)
+    return repetitions * len(valeurs) / (time.perf_counter() - debut)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--points', type=int, default=1_000_000, help="Nombre de points par requête")
+    parser.add_argument('--repetitions', type=int, default=10, help="Nombre de requêtes chronométrées")
+    args = parser.parse_args()
+
+    analyzer = AerodynamicsAnalyzer(*DataImporter().default_profil_data())
+    rng = np.random.default_rng(0)
+    for methode in ('lineaire', 'pchip'):
+        debut = time.perf_counter()
+        polaire = analyzer.interpolateur(methode)
+        construction = time.perf_counter() - debut
+        alpha = rng.uniform(min(analyzer.alpha_data), max(analyzer.alpha_data), args.points)
+        cl = rng.uniform(min(analyzer.cl_data), polaire.cl_max, args.points)
+        print(f"[{methode}] construction : {construction * 1e3:.2f} ms")
+        for nom, fonction, valeurs in (('C_L(alpha)', polaire.cl, alpha), ('C_D(C_L)', polaire.cd, cl),
+                                       ('L/D(alpha)', polaire.finesse, alpha)):
+            print(f"[{methode}] {nom:<11}: {debit(fonction, valeurs, args.repetitions) / 1e6:8.1f} M points/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Mesure le nombre de figures rendues par seconde : création d'une figure pyplot par configuration
+(comportement de Visualization3D) comparée au rendu hors écran avec figure réutilisée, en série et en parallèle.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt  # noqa: E402
+
+from center_of_gravity import CenterOfGravityCalculator  # noqa: E402
+from data_import import DataImporter  # noqa: E402
+import rendering  # noqa: E402
+
+
+def generer_configurations(n_configs):
+    """
+    Génère n_configs configurations en déplaçant le moteur le long de l'axe X.
+
+    :return: Liste de tuples (nom, data, cg)
+    """
+    configurations = []
+    for i in range(n_configs):
+        data = DataImporter().default_components_data()
+        data['moteurs']['position'][0] = 3 + 4 * i / max(n_configs - 1, 1)
+        configurations.append((f"config_{i:05d}", data, CenterOfGravityCalculator(data).calculate()))
+    return configurations
+
+
+def rendu_pyplot(configurations, dossier):
+    """
+    Référence : une nouvelle figure pyplot par configuration, comme Visualization3D.plot_aircraft.
+    """
+    for nom, data, cg in configurations:
+        fig = plt.figure()
+        ax = fig.add_subplot(111, projection='3d')
+        for component, properties in data.items():
+            ax.scatter(*properties['position'], label=component.capitalize())
+        ax.scatter(*cg, color='green', s=100, label='Centre de Gravité')
+        ax.legend()
+        fig.savefig(os.path.join(dossier, f"{nom}.png"))
+        plt.close(fig)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--configs', type=int, default=200, help="Nombre de configurations")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Nombre de processus de rendu")
+    args = parser.parse_args()
+
+    configurations = generer_configurations(args.configs)
+    with tempfile.TemporaryDirectory() as dossier:
+        mesures = [
+            ('pyplot, une figure par configuration', lambda: rendu_pyplot(configurations, dossier)),
+            ('Agg, figure réutilisée', lambda: rendering.render_cg_batch(configurations, dossier, 'png', 1)),
+            (f'Agg, figure réutilisée, {args.workers} processus',
+             lambda: rendering.render_cg_batch(configurations, dossier, 'png', args.workers)),
+            ('PDF multipage', lambda: rendering.render_cg_pdf(configurations, os.path.join(dossier, 'lot.pdf'))),
+        ]
+        for nom, fonction in mesures:
+            debut = time.perf_counter()
+            fonction()
+            duree = time.perf_counter() - debut
+            print(f"{nom:<45}: {args.configs / duree:7.1f} figures/s")
+
+
+if __name__ == "__main__":
+    main()
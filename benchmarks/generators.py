@@ -0,0 +1,97 @@
+"""
+Générateurs de jeux de données synthétiques (composants et polaires) pour les mesures de performance,
+de 10 à plusieurs millions de lignes.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def components_dataframe(n_lignes, debut=0, seed=0):
+    """
+    Génère un DataFrame de composants au format de components_data.csv.
+
+    :param n_lignes: Nombre de composants
+    :param debut: Numéro du premier composant (pour générer un fichier bloc par bloc)
+    :param seed: Graine du générateur aléatoire
+    :return: DataFrame avec les colonnes component, position_x, position_y, position_z, poids
+    """
+    rng = np.random.default_rng([seed, debut])
+    return pd.DataFrame({
+        'component': np.char.add('piece_', np.arange(debut, debut + n_lignes).astype(str)),
+        'position_x': rng.uniform(0, 30, n_lignes).round(3),
+        'position_y': rng.uniform(-15, 15, n_lignes).round(3),
+        'position_z': rng.uniform(-2, 4, n_lignes).round(3),
+        'poids': rng.uniform(0.1, 50, n_lignes).round(3),
+    })
+
+
+def components_dict(n_composants, seed=0):
+    """
+    Génère des composants au format dictionnaire utilisé par CenterOfGravityCalculator.
+
+    :param n_composants: Nombre de composants
+    :param seed: Graine du générateur aléatoire
+    :return: Dictionnaire {nom: {'position': [x, y, z], 'poids': w}}
+    """
+    df = components_dataframe(n_composants, seed=seed)
+    positions = df[['position_x', 'position_y', 'position_z']].to_numpy().tolist()
+    return {nom: {'position': position, 'poids': poids}
+            for nom, position, poids in zip(df['component'], positions, df['poids'].tolist())}
+
+
+def write_components_csv(filepath, n_lignes, taille_bloc=1_000_000, seed=0):
+    """
+    Écrit un fichier de composants synthétique de n_lignes lignes, bloc par bloc (mémoire bornée).
+
+    :param filepath: Chemin du fichier CSV à créer
+    :param n_lignes: Nombre de composants
+    :param taille_bloc: Nombre de lignes générées et écrites à la fois
+    :param seed: Graine du générateur aléatoire
+    """
+    for debut in range(0, max(n_lignes, 1), taille_bloc):
+        bloc = components_dataframe(min(taille_bloc, n_lignes - debut), debut, seed)
+        bloc.to_csv(filepath, mode='w' if debut == 0 else 'a', header=debut == 0, index=False)
+
+
+def polar_arrays(n_polaires, n_points=30, seed=0):
+    """
+    Génère des polaires plausibles : portance linéaire jusqu'au décrochage, traînée parabolique.
+
+    :param n_polaires: Nombre de polaires
+    :param n_points: Nombre de points par polaire
+    :param seed: Graine du générateur aléatoire
+    :return: Tuple (profil_aile (N,), reynolds (N,), corde (N,), alpha (N, L), cl (N, L), cd (N, L))
+    """
+    rng = np.random.default_rng(seed)
+    profil_aile = rng.integers(6, 25, n_polaires)
+    reynolds = rng.choice([2e5, 5e5, 1e6, 3e6, 6e6], n_polaires) + np.arange(n_polaires)
+    corde = rng.uniform(0.5, 3.0, n_polaires).round(3)
+    alpha = np.linspace(-10, 20, n_points)[np.newaxis, :].repeat(n_polaires, axis=0)
+    pente = rng.uniform(0.09, 0.11, n_polaires)[:, np.newaxis]
+    cl = pente * alpha - 0.0015 * np.maximum(alpha - 12, 0) ** 2 * 10
+    cd = rng.uniform(0.006, 0.012, n_polaires)[:, np.newaxis] + 0.01 * cl ** 2
+    return profil_aile, reynolds, corde, alpha.round(4), cl.round(5), cd.round(5)
+
+
+def write_polars_csv(filepath, n_polaires, n_points=30, format='historique', seed=0):
+    """
+    Écrit un fichier de polaires synthétique.
+
+    :param filepath: Chemin du fichier CSV à créer
+    :param n_polaires: Nombre de polaires
+    :param n_points: Nombre de points par polaire
+    :param format: 'historique' (listes sous forme de texte, une ligne par polaire) ou 'long' (une ligne par point)
+    :param seed: Graine du générateur aléatoire
+    """
+    profil_aile, reynolds, corde, alpha, cl, cd = polar_arrays(n_polaires, n_points, seed)
+    if format == 'long':
+        lignes = np.repeat(np.arange(n_polaires), n_points)
+        df = pd.DataFrame({'profil_aile': profil_aile[lignes], 'reynolds': reynolds[lignes],
+                           'corde': corde[lignes], 'alpha': alpha.ravel(), 'cl': cl.ravel(), 'cd': cd.ravel()})
+    else:
+        def en_texte(tableau):
+            return ['[' + ', '.join(map(repr, ligne)) + ']' for ligne in tableau.tolist()]
+        df = pd.DataFrame({'profil_aile': profil_aile, 'reynolds': reynolds, 'corde': corde,
+                           'alpha_data': en_texte(alpha), 'cl_data': en_texte(cl), 'cd_data': en_texte(cd)})
+    df.to_csv(filepath, index=False)
@@ -0,0 +1,314 @@
+"""
+Suite de mesures de référence des chemins principaux du programme, pour détecter les régressions de performance.
+
+Chaque cas (import des composants et des polaires, calcul du centre de gravité, géométrie du profil, tracés)
+est mesuré sur des jeux de données synthétiques de tailles croissantes. Les résultats sont écrits au format JSON
+avec la description de la machine, puis comparés à un fichier de référence :
+
+    python -m benchmarks.harness run --sizes 10,1000,100000 --output courant.json
+    python -m benchmarks.harness compare reference.json courant.json --threshold 0.2
+
+La comparaison se termine avec le code de retour 1 si un cas est plus lent que la référence au-delà du seuil.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime, timezone
+
+import numpy as np
+
+from benchmarks.generators import components_dict, polar_arrays, write_components_csv, write_polars_csv
+
+# Taille maximale des cas de tracé : au-delà, une figure par composant n'a plus de sens
+MAX_PLOT_SIZE = 100
+
+
+def _cas_data_component(n, dossier):
+    """
+    Import d'un fichier de composants de n lignes (sans cache).
+    """
+    from data_import import DataImporter
+    chemin = os.path.join(dossier, f"components_{n}.csv")
+    if not os.path.exists(chemin):
+        write_components_csv(chemin, n)
+    importer = DataImporter()
+    return lambda: importer.data_component(chemin)
+
+
+def _cas_data_profil(n, dossier):
+    """
+    Import d'un fichier de n polaires au format historique (listes sous forme de texte).
+    """
+    from data_import import DataImporter
+    chemin = os.path.join(dossier, f"polars_{n}.csv")
+    if not os.path.exists(chemin):
+        write_polars_csv(chemin, n)
+    importer = DataImporter()
+    return lambda: importer.data_profil(chemin)
+
+
+def _cas_calculate_dict(n, dossier):
+    """
+    Centre de gravité de n composants décrits par un dictionnaire.
+    """
+    from center_of_gravity import CenterOfGravityCalculator
+    data = components_dict(n)
+    return lambda: CenterOfGravityCalculator(data).calculate()
+
+
+def _cas_calculate_table(n, dossier):
+    """
+    Centre de gravité de n composants stockés dans une ComponentTable.
+    """
+    from center_of_gravity import CenterOfGravityCalculator
+    from component_table import ComponentTable
+    table = ComponentTable.from_dict(components_dict(n))
+    return lambda: CenterOfGravityCalculator(table).calculate()
+
+
+def _cas_calculer_coordonnees(n, dossier):
+    """
+    Coordonnées de n profils d'épaisseurs différentes en un seul appel.
+    """
+    from aerodynamics import AerodynamicsAnalyzer
+    analyzer = AerodynamicsAnalyzer(12, 1.5)
+    epaisseurs = np.linspace(0.06, 0.24, n)
+    return lambda: analyzer.calculer_coordonnees(epaisseurs)
+
+
+def _rasteriser_figures():
+    """
+    Produit l'image PNG (en mémoire) de chaque figure pyplot ouverte puis les ferme : sans ce rendu, un tracé
+    pyplot sur le moteur Agg ne fait que construire les objets, alors que render_cg écrit une image.
+    """
+    import matplotlib.pyplot as plt
+    for numero in plt.get_fignums():
+        plt.figure(numero).savefig(io.BytesIO(), format='png')
+    plt.close('all')
+
+
+def _cas_plot_aircraft(n, dossier):
+    """
+    Visualisation 3D pyplot de n composants (moteur Agg, figure rendue en PNG puis fermée après chaque tracé).
+    """
+    from visualization import Visualization3D
+    data = components_dict(n)
+    visualisation = Visualization3D(data, (15.0, 0.0, 1.0))
+
+    def tracer():
+        visualisation.plot_aircraft()
+        _rasteriser_figures()
+    return tracer
+
+
+def _cas_plot_polars(n, dossier):
+    """
+    Profil et polaires pyplot de n profils (moteur Agg, figures rendues en PNG puis fermées après chaque tracé).
+    """
+    from aerodynamics import AerodynamicsAnalyzer
+    profil_aile, _, corde, alpha, cl, cd = polar_arrays(n)
+    analyzers = [AerodynamicsAnalyzer(int(p), c, a, l, d)
+                 for p, c, a, l, d in zip(profil_aile, corde, alpha.tolist(), cl.tolist(), cd.tolist())]
+
+    def tracer():
+        for analyzer in analyzers:
+            analyzer.tracer_profil()
+            analyzer.plot_polar_cl_alpha()
+            analyzer.plot_polar_cl_cd()
+            _rasteriser_figures()
+    return tracer
+
+
+def _cas_render_cg(n, dossier):
+    """
+    Rendu hors écran (figure réutilisée) de n composants au format PNG.
+    """
+    from rendering import CGRenderer
+    data = components_dict(n)
+    renderer = CGRenderer()
+    chemin = os.path.join(dossier, 'render_cg.png')
+
+    def rendre():
+        renderer.update(data, (15.0, 0.0, 1.0))
+        renderer.save(chemin)
+    return rendre
+
+
+# Nom du cas -> (préparation, taille maximale ou None)
+CASES = {
+    'data_component': (_cas_data_component, None),
+    'data_profil': (_cas_data_profil, None),
+    'calculate_dict': (_cas_calculate_dict, None),
+    'calculate_table': (_cas_calculate_table, None),
+    'calculer_coordonnees': (_cas_calculer_coordonnees, None),
+    'plot_aircraft': (_cas_plot_aircraft, MAX_PLOT_SIZE),
+    'plot_polars': (_cas_plot_polars, MAX_PLOT_SIZE),
+    'render_cg': (_cas_render_cg, MAX_PLOT_SIZE),
+}
+
+
+def machine_metadata():
+    """
+    Décrit la machine et l'environnement logiciel de la mesure.
+
+    :return: Dictionnaire sérialisable en JSON
+    """
+    versions = {}
+    for module in ('numpy', 'pandas', 'matplotlib'):
+        try:
+            versions[module] = __import__(module).__version__
+        except ImportError:
+            versions[module] = None
+    try:
+        revision = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                  check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'versions': versions,
+        'git_revision': revision,
+    }
+
+
+def chronometrer(fonction, repetitions, budget):
+    """
+    Exécute fonction plusieurs fois (après un appel de mise en route) et retourne les durées mesurées.
+
+    :param fonction: Fonction sans argument à mesurer
+    :param repetitions: Nombre maximal de mesures
+    :param budget: Durée totale au-delà de laquelle on arrête les mesures (au moins une mesure est faite)
+    :return: Liste des durées en secondes
+    """
+    fonction()
+    durees = []
+    debut = time.perf_counter()
+    while len(durees) < repetitions:
+        t0 = time.perf_counter()
+        fonction()
+        durees.append(time.perf_counter() - t0)
+        if time.perf_counter() - debut > budget:
+            break
+    return durees
+
+
+def run(tailles, cas, repetitions=5, budget=2.0, dossier=None, verbose=True):
+    """
+    Mesure chaque cas pour chaque taille.
+
+    :param tailles: Liste des tailles de jeux de données
+    :param cas: Liste des noms de cas (clés de CASES)
+    :param repetitions: Nombre maximal de mesures par cas et par taille
+    :param budget: Durée maximale consacrée aux mesures d'un cas pour une taille
+    :param dossier: Répertoire des fichiers générés (temporaire par défaut)
+    :param verbose: Afficher chaque résultat sur la sortie d'erreur
+    :return: Dictionnaire {'metadata': ..., 'results': {'cas/taille': {...}}}
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Tracés hors écran : plt.show() ne bloque pas
+    resultats = {}
+    with tempfile.TemporaryDirectory() as temporaire, warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # plt.show() avertit que le moteur Agg n'affiche rien
+        dossier = dossier or temporaire
+        os.makedirs(dossier, exist_ok=True)
+        for nom in cas:
+            preparer, taille_max = CASES[nom]
+            for n in tailles:
+                if taille_max is not None and n > taille_max:
+                    continue
+                durees = chronometrer(preparer(n, dossier), repetitions, budget)
+                cle = f"{nom}/{n}"
+                resultats[cle] = {'case': nom, 'size': n, 'repeats': len(durees), 'min': min(durees),
+                                  'median': statistics.median(durees), 'max': max(durees)}
+                if verbose:
+                    print(f"{cle:32s} min {min(durees):.6f} s  médiane {statistics.median(durees):.6f} s",
+                          file=sys.stderr)
+    return {'metadata': machine_metadata(), 'results': resultats}
+
+
+def compare(reference, courant, seuil=0.2, statistique='min'):
+    """
+    Compare deux séries de mesures cas par cas.
+
+    :param reference: Résultats de référence (sortie de run)
+    :param courant: Résultats à comparer
+    :param seuil: Ralentissement relatif toléré (0.2 : 20 %)
+    :param statistique: 'min' ou 'median'
+    :return: Liste de tuples (cas/taille, durée de référence, durée courante, rapport, régression)
+    """
+    lignes = []
+    for cle, mesure in courant['results'].items():
+        if cle not in reference['results']:
+            continue
+        avant, apres = reference['results'][cle][statistique], mesure[statistique]
+        rapport = apres / avant if avant > 0 else float('inf')
+        lignes.append((cle, avant, apres, rapport, rapport > 1 + seuil))
+    return lignes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sous_commandes = parser.add_subparsers(dest='commande', required=True)
+
+    mesure = sous_commandes.add_parser('run', help="Exécuter les mesures")
+    mesure.add_argument('--sizes', default='10,1000,100000',
+                        help="Tailles des jeux de données, séparées par des virgules (jusqu'à 10000000)")
+    mesure.add_argument('--cases', default=','.join(CASES), help="Cas à mesurer, séparés par des virgules")
+    mesure.add_argument('--repeats', type=int, default=5, help="Nombre maximal de mesures par cas")
+    mesure.add_argument('--budget', type=float, default=2.0, help="Durée maximale de mesure par cas (s)")
+    mesure.add_argument('--data-dir', default=None, help="Conserver les fichiers générés dans ce répertoire")
+    mesure.add_argument('--output', '-o', default=None, help="Fichier JSON de résultats (sortie standard par défaut)")
+
+    comparaison = sous_commandes.add_parser('compare', help="Comparer à une référence")
+    comparaison.add_argument('baseline', help="Fichier JSON de référence")
+    comparaison.add_argument('current', help="Fichier JSON à comparer")
+    comparaison.add_argument('--threshold', type=float, default=0.2, help="Ralentissement toléré (0.2 : 20 %%)")
+    comparaison.add_argument('--statistic', choices=['min', 'median'], default='min', help="Durée comparée")
+    args = parser.parse_args(argv)
+
+    if args.commande == 'run':
+        cas = [c for c in args.cases.split(',') if c]
+        inconnus = [c for c in cas if c not in CASES]
+        if inconnus:
+            parser.error(f"unknown cases: {', '.join(inconnus)}")
+        tailles = [int(t) for t in args.sizes.split(',') if t]
+        resultats = run(tailles, cas, args.repeats, args.budget, args.data_dir)
+        texte = json.dumps(resultats, indent=2, ensure_ascii=False) + '\n'
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(texte)
+        else:
+            sys.stdout.write(texte)
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        reference = json.load(f)
+    with open(args.current, encoding='utf-8') as f:
+        courant = json.load(f)
+    lignes = compare(reference, courant, args.threshold, args.statistic)
+    for cle, avant, apres, rapport, regression in lignes:
+        etat = 'RÉGRESSION' if regression else 'ok'
+        print(f"{cle:32s} {avant:.6f} s -> {apres:.6f} s  x{rapport:.2f}  {etat}")
+    n_regressions = sum(regression for *_, regression in lignes)
+    if n_regressions:
+        print(f"{n_regressions} regression(s) beyond {args.threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,39 @@
 """
 Ce module contient la classe CenterOfGravityCalculator qui permet de calculer le centre de gravité d'un avion en fonction des données fournies.
+Il fournit également une version vectorisée du calcul pour traiter un grand nombre de configurations de chargement en un seul appel.
 """
+
+import numpy as np
+
+from component_table import ComponentTable
+from instrumentation import profiled
+
+
 class CenterOfGravityCalculator:
     def __init__(self, data):
         """
         Initialisation de la classe avec les données fournies.
 
-        :param data: Dictionnaire contenant les propriétés des composants de l'avion (poids et position)
+        :param data: Dictionnaire ou ComponentTable contenant les propriétés des composants de l'avion (poids et position)
         """
         self.data = data
 
+    @profiled
     def calculate(self):
         """
         Calcule le centre de gravité de l'avion.
 
         :return: Tuple contenant les coordonnées du centre de gravité (cg_x, cg_y, cg_z)
         """
+        if isinstance(self.data, ComponentTable):
+            # Stockage en colonnes : calcul vectorisé directement sur les tableaux, sans copie
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cg, poids_total = calculate_batch(self.data.poids, self.data.positions)
+            if poids_total[0] == 0:
+                # Même comportement que le calcul sur un dictionnaire (table vide ou poids nuls)
+                raise ZeroDivisionError("Total weight is zero, the center of gravity is undefined.")
+            return tuple(cg[0].tolist())
+
         total_weight = 0  # Poids total de l'avion
         moment_x, moment_y, moment_z = 0, 0, 0  # Moments autour des axes x, y, z
 
@@ -33,3 +51,280 @@ class CenterOfGravityCalculator:
         cg_z = moment_z / total_weight
 
         return cg_x, cg_y, cg_z  # Retourner les coordonnées du centre de gravité
+
+    def to_arrays(self):
+        """
+        Convertit les données des composants en tableaux numpy utilisables par calculate_batch.
+
+        :return: Tuple (noms, poids, positions) avec poids de forme (N,) et positions de forme (N, 3)
+        """
+        if isinstance(self.data, ComponentTable):
+            return self.data.names, self.data.poids, self.data.positions
+        noms = list(self.data.keys())
+        poids = np.array([self.data[nom]['poids'] for nom in noms], dtype=np.float64)
+        positions = np.array([self.data[nom]['position'] for nom in noms], dtype=np.float64).reshape(-1, 3)
+        return noms, poids, positions
+
+    def local_inertia_arrays(self):
+        """
+        Rassemble les inerties propres des composants, ramenées à l'unité de poids pour pouvoir être
+        réutilisées avec d'autres poids (calcul par lots).
+
+        Chaque composant peut préciser, en plus de 'position' et 'poids' :
+        - 'inertie' : tenseur 3x3 autour de son propre centre de gravité ;
+        - 'forme' : {'type': 'boite', 'dimensions': [a, b, c]}
+                    ou {'type': 'cylindre', 'rayon': r, 'longueur': l, 'axe': 0}.
+        Sans ces clés, le composant est traité comme une masse ponctuelle.
+
+        :return: Tableau de forme (N, 3, 3), ou None si tous les composants sont ponctuels
+        """
+        if isinstance(self.data, ComponentTable):
+            return None
+        inerties = np.zeros((len(self.data), 3, 3))
+        for i, properties in enumerate(self.data.values()):
+            if 'inertie' in properties:
+                inerties[i] = np.asarray(properties['inertie'], dtype=np.float64) / properties['poids']
+            elif 'forme' in properties:
+                inerties[i] = inertie_forme(properties['forme'])
+        return inerties if inerties.any() else None
+
+    @profiled
+    def calculate_mass_properties(self):
+        """
+        Calcule le poids total, le centre de gravité et le tenseur d'inertie de l'avion autour du centre de gravité.
+
+        :return: Tuple (poids_total, (cg_x, cg_y, cg_z), tenseur d'inertie de forme (3, 3))
+        """
+        _, poids, positions = self.to_arrays()
+        cg, poids_total, inertie = calculate_batch_mass_properties(poids, positions, self.local_inertia_arrays())
+        return float(poids_total[0]), tuple(cg[0].tolist()), inertie[0]
+
+
+def inertie_forme(forme):
+    """
+    Tenseur d'inertie par unité de poids d'une forme homogène, autour de son centre.
+
+    :param forme: {'type': 'boite', 'dimensions': [a, b, c]} ou {'type': 'cylindre', 'rayon': r, 'longueur': l, 'axe': 0}
+    :return: Tableau de forme (3, 3)
+    """
+    if forme['type'] == 'boite':
+        a, b, c = forme['dimensions']
+        return np.diag([b ** 2 + c ** 2, a ** 2 + c ** 2, a ** 2 + b ** 2]) / 12
+    if forme['type'] == 'cylindre':
+        r, longueur, axe = forme['rayon'], forme['longueur'], forme.get('axe', 0)
+        diagonale = np.full(3, (3 * r ** 2 + longueur ** 2) / 12)
+        diagonale[axe] = r ** 2 / 2
+        return np.diag(diagonale)
+    raise ValueError(f"Unknown shape type: {forme['type']!r}")
+
+
+class IncrementalCenterOfGravityCalculator:
+    def __init__(self, data=None):
+        """
+        Initialisation d'un calculateur qui conserve le poids total et les trois moments,
+        afin de mettre à jour le centre de gravité en temps constant à chaque modification.
+
+        :param data: Dictionnaire optionnel contenant les propriétés initiales des composants (poids et position)
+        """
+        self.data = {}
+        self.total_weight = 0.0  # Poids total de l'avion
+        self.moments = [0.0, 0.0, 0.0]  # Moments autour des axes x, y, z
+        for component, properties in (data or {}).items():
+            self.add(component, properties['position'], properties['poids'])
+
+    def cg(self):
+        """
+        Retourne le centre de gravité courant à partir des moments conservés.
+
+        :return: Tuple contenant les coordonnées du centre de gravité (cg_x, cg_y, cg_z)
+        """
+        if not self._cg_defini():
+            raise ZeroDivisionError("Total weight is zero, the center of gravity is undefined.")
+        return tuple(moment / self.total_weight for moment in self.moments)
+
+    def _cg_defini(self):
+        """
+        Le centre de gravité est défini s'il reste des composants et que leur poids total n'est pas nul
+        (un avion vide n'a pas de centre de gravité, quel que soit le résidu d'arrondi).
+        """
+        return bool(self.data) and self.total_weight != 0
+
+    def _appliquer(self, position, poids, signe):
+        """
+        Ajoute (signe=1) ou retire (signe=-1) la contribution d'un composant au poids total et aux moments.
+        """
+        self.total_weight += signe * poids
+        for axe in range(3):
+            self.moments[axe] += signe * poids * position[axe]
+
+    def _deplacement(self, ancien_cg):
+        """
+        Calcule le déplacement du centre de gravité par rapport à ancien_cg.
+
+        :return: Tuple (dx, dy, dz), ou None si le centre de gravité avant ou après la modification n'est pas défini
+        """
+        if ancien_cg is None or not self._cg_defini():
+            return None
+        return tuple(nouveau - ancien for nouveau, ancien in zip(self.cg(), ancien_cg))
+
+    def _cg_ou_none(self):
+        """
+        Retourne le centre de gravité courant, ou None s'il n'est pas défini.
+        """
+        return self.cg() if self._cg_defini() else None
+
+    def add(self, component, position, poids):
+        """
+        Ajoute un composant à l'avion.
+
+        :param component: Nom du composant
+        :param position: Position [x, y, z] du composant
+        :param poids: Poids du composant
+        :return: Déplacement (dx, dy, dz) du centre de gravité provoqué par l'ajout
+        """
+        if component in self.data:
+            raise KeyError(f"Component '{component}' already exists, use update() instead.")
+        ancien_cg = self._cg_ou_none()
+        position = list(position)
+        self.data[component] = {'position': position, 'poids': poids}
+        self._appliquer(position, poids, 1)
+        return self._deplacement(ancien_cg)
+
+    def remove(self, component):
+        """
+        Retire un composant de l'avion.
+
+        :param component: Nom du composant
+        :return: Déplacement (dx, dy, dz) du centre de gravité provoqué par le retrait
+        """
+        ancien_cg = self._cg_ou_none()
+        properties = self.data.pop(component)
+        if self.data:
+            self._appliquer(properties['position'], properties['poids'], -1)
+        else:
+            # Avion vide : remise à zéro exacte plutôt qu'un résidu d'arrondi
+            self.total_weight = 0.0
+            self.moments = [0.0, 0.0, 0.0]
+        return self._deplacement(ancien_cg)
+
+    def update(self, component, poids=None, position=None):
+        """
+        Modifie le poids et/ou la position d'un composant existant.
+
+        :param component: Nom du composant
+        :param poids: Nouveau poids du composant (inchangé si None)
+        :param position: Nouvelle position [x, y, z] du composant (inchangée si None)
+        :return: Déplacement (dx, dy, dz) du centre de gravité provoqué par la modification
+        """
+        properties = self.data[component]
+        ancien_cg = self._cg_ou_none()
+        self._appliquer(properties['position'], properties['poids'], -1)
+        if poids is not None:
+            properties['poids'] = poids
+        if position is not None:
+            properties['position'] = list(position)
+        self._appliquer(properties['position'], properties['poids'], 1)
+        return self._deplacement(ancien_cg)
+
+    def check_consistency(self, rtol=1e-9, atol=1e-9):
+        """
+        Compare le centre de gravité incrémental à un recalcul complet par CenterOfGravityCalculator.
+
+        :param rtol: Tolérance relative
+        :param atol: Tolérance absolue
+        :return: True si les deux calculs concordent à la tolérance près
+        """
+        reference = CenterOfGravityCalculator(self.data).calculate()
+        return bool(np.allclose(self.cg(), reference, rtol=rtol, atol=atol))
+
+    def resync(self):
+        """
+        Recalcule entièrement le poids total et les moments pour éliminer l'erreur d'arrondi accumulée
+        après un très grand nombre de modifications.
+        """
+        self.total_weight = 0.0
+        self.moments = [0.0, 0.0, 0.0]
+        for properties in self.data.values():
+            self._appliquer(properties['position'], properties['poids'], 1)
+
+
+def calculate_batch(poids, positions):
+    """
+    Calcule en un seul appel vectorisé le centre de gravité de plusieurs configurations de chargement.
+
+    Chaque ligne de la matrice des poids correspond à une configuration (carburant, charge utile, passagers...),
+    chaque colonne à un composant dont la position est donnée par la ligne correspondante de positions.
+
+    :param poids: Matrice des poids de forme (N_configs, N_composants), ou vecteur (N_composants,) pour une seule configuration
+    :param positions: Tableau des positions des composants de forme (N_composants, 3)
+    :return: Tuple (cg, poids_total) avec cg de forme (N_configs, 3) et poids_total de forme (N_configs,)
+    """
+    poids = np.asarray(poids, dtype=np.float64)
+    positions = np.asarray(positions, dtype=np.float64)
+    if positions.ndim != 2 or positions.shape[1] != 3:
+        raise ValueError("positions must have shape (N_components, 3).")
+
+    poids_2d = np.atleast_2d(poids)
+    if poids_2d.shape[1] != positions.shape[0]:
+        raise ValueError("poids and positions must have the same number of components.")
+
+    poids_total = poids_2d.sum(axis=1)  # Poids total de chaque configuration
+    moments = poids_2d @ positions  # Moments autour des axes x, y, z pour chaque configuration
+    cg = moments / poids_total[:, np.newaxis]
+
+    return cg, poids_total
+
+
+def calculate_batch_mass_properties(poids, positions, inertie_unitaire=None):
+    """
+    Calcule en un seul passage vectorisé le poids total, le centre de gravité et le tenseur d'inertie autour du
+    centre de gravité de plusieurs configurations de chargement.
+
+    Les moments d'ordre 1 et 2 et les inerties propres sont obtenus par un unique produit matriciel entre la
+    matrice des poids et une table par composant, puis le théorème de Huygens (axes parallèles) ramène
+    l'inertie de l'origine au centre de gravité.
+
+    :param poids: Matrice des poids de forme (N_configs, N_composants), ou vecteur (N_composants,)
+    :param positions: Tableau des positions des composants de forme (N_composants, 3)
+    :param inertie_unitaire: Inerties propres par unité de poids, forme (N_composants, 3, 3) (optionnel)
+    :return: Tuple (cg de forme (N_configs, 3), poids_total de forme (N_configs,), inertie de forme (N_configs, 3, 3))
+    """
+    poids_2d = np.atleast_2d(np.asarray(poids, dtype=np.float64))
+    positions = np.asarray(positions, dtype=np.float64)
+    if positions.ndim != 2 or positions.shape[1] != 3:
+        raise ValueError("positions must have shape (N_components, 3).")
+    if poids_2d.shape[1] != positions.shape[0]:
+        raise ValueError("poids and positions must have the same number of components.")
+
+    # Table par composant : 1, x, y, z, puis les 9 produits r_i r_j, puis l'inertie propre unitaire
+    n_composants = positions.shape[0]
+    produits = (positions[:, :, np.newaxis] * positions[:, np.newaxis, :]).reshape(n_composants, 9)
+    colonnes = [np.ones((n_composants, 1)), positions, produits]
+    if inertie_unitaire is not None:
+        colonnes.append(np.asarray(inertie_unitaire, dtype=np.float64).reshape(n_composants, 9))
+    sommes = poids_2d @ np.hstack(colonnes)
+
+    poids_total = sommes[:, 0]
+    cg = sommes[:, 1:4] / poids_total[:, np.newaxis]
+    # Moments d'ordre 2 autour du centre de gravité : S - M c c^T
+    second_ordre = sommes[:, 4:13].reshape(-1, 3, 3) - poids_total[:, np.newaxis, np.newaxis] * (
+        cg[:, :, np.newaxis] * cg[:, np.newaxis, :])
+    # I = trace(S) Id - S
+    trace = np.trace(second_ordre, axis1=1, axis2=2)
+    inertie = trace[:, np.newaxis, np.newaxis] * np.eye(3) - second_ordre
+    if inertie_unitaire is not None:
+        inertie += sommes[:, 13:22].reshape(-1, 3, 3)
+
+    return cg, poids_total, inertie
+
+
+def cg_from_moments(total_weight, moments):
+    """
+    Calcule le centre de gravité à partir du poids total et des moments cumulés,
+    par exemple ceux renvoyés par DataImporter.component_moments.
+
+    :param total_weight: Poids total de l'avion
+    :param moments: Tuple (moment_x, moment_y, moment_z)
+    :return: Tuple contenant les coordonnées du centre de gravité (cg_x, cg_y, cg_z)
+    """
+    return tuple(moment / total_weight for moment in moments)
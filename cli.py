@@ -0,0 +1,432 @@
+"""
+Interface en ligne de commande non interactive du programme, utilisable dans des chaînes de traitement.
+
+Exemples :
+    python main.py cg components_data.csv "exports/*.csv" --format csv --output cg.csv
+    python main.py cg --default
+    python main.py cg assembly_data.csv --assembly --format csv
+    python main.py aero aerodynamics_data.csv --plot
+    python main.py aero aerodynamics_data.csv --render-dir figures --render-format pdf
+    python main.py sweep --default --range moteurs.position_x=4:6:21 --range corde=1:3:5 --output sweep.csv
+    python main.py cg components_data.csv --profile trace.json
+    python main.py trim --surface-aile 16 --corde-moyenne 1.5 --surface-empennage 3.5 --format csv
+    python main.py serve --port 8080
+    python main.py uncertainty --tolerance moteurs.poids=normal:20 --tolerance ailes.position_x=uniform:0.05
+
+Les modules sont importés à la demande : un calcul de centre de gravité ne charge ni matplotlib ni,
+pour les données par défaut, pandas.
+"""
+
+import argparse
+import csv
+import glob
+import json
+import math
+import os
+import re
+import sys
+
+
+def _expand_inputs(patterns):
+    """
+    Développe les motifs glob des fichiers d'entrée, en conservant l'ordre donné.
+
+    :param patterns: Liste de chemins ou de motifs
+    :return: Liste de chemins
+    """
+    fichiers = []
+    for pattern in patterns:
+        correspondances = sorted(glob.glob(pattern))
+        if not correspondances:
+            raise FileNotFoundError(f"No input file matches {pattern!r}")
+        fichiers.extend(correspondances)
+    return fichiers
+
+
+def _valeur_json(valeur):
+    """
+    Remplace récursivement les flottants non finis (NaN, ±inf), qui ne sont pas du JSON valide, par None (null).
+    """
+    if isinstance(valeur, float):
+        return valeur if math.isfinite(valeur) else None
+    if isinstance(valeur, dict):
+        return {cle: _valeur_json(v) for cle, v in valeur.items()}
+    if isinstance(valeur, (list, tuple)):
+        return [_valeur_json(v) for v in valeur]
+    return valeur
+
+
+def _write_records(records, fmt, output):
+    """
+    Écrit les résultats au format JSON ou CSV, sur la sortie standard ou dans un fichier.
+    En JSON, les grandeurs non définies (NaN) sont écrites null.
+
+    :param records: Liste de dictionnaires
+    :param fmt: 'json' ou 'csv'
+    :param output: Chemin du fichier de sortie, ou None pour la sortie standard
+    """
+    f = open(output, 'w', newline='', encoding='utf-8') if output else sys.stdout
+    try:
+        if fmt == 'json':
+            json.dump(_valeur_json(records), f, indent=2, ensure_ascii=False, allow_nan=False)
+            f.write('\n')
+        else:
+            colonnes = list(dict.fromkeys(cle for record in records for cle in record))
+            writer = csv.DictWriter(f, fieldnames=colonnes)
+            writer.writeheader()
+            writer.writerows(records)
+    finally:
+        if output:
+            f.close()
+
+
+def _nom_fichier(source):
+    """
+    Transforme un chemin source en nom de fichier utilisable pour les images produites.
+    """
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', os.path.splitext(source)[0]).strip('_') or 'figure'
+
+
+def _cache(args):
+    """
+    Retourne le cache binaire demandé par les options, ou None.
+    """
+    if args.no_cache:
+        return None
+    from data_cache import DataCache
+    return DataCache(args.cache_dir)
+
+
+def _assembly_records(fichiers):
+    """
+    Poids et centre de gravité de chaque nœud des arbres d'ensembles, sous-arbre compris.
+    """
+    from assembly import AssemblyTree
+
+    records = []
+    for fichier in fichiers:
+        arbre = AssemblyTree.from_csv(fichier)
+        for racine in arbre.children():
+            for component in arbre.subtree(racine):
+                poids_total = arbre.weight(component)
+                cg = arbre.cg(component) if poids_total else (None, None, None)
+                records.append({'source': fichier, 'component': component, 'parent': arbre.parent(component),
+                                'profondeur': len(arbre.path(component)) - 1, 'poids_total': poids_total,
+                                'cg_x': cg[0], 'cg_y': cg[1], 'cg_z': cg[2]})
+    return records
+
+
+def run_cg(args):
+    """
+    Sous-commande cg : centre de gravité de chaque fichier de composants.
+    """
+    from center_of_gravity import CenterOfGravityCalculator, cg_from_moments
+    from data_import import DataImporter
+
+    if args.assembly:
+        _write_records(_assembly_records(_expand_inputs(args.inputs)), args.format, args.output)
+        return
+
+    importer = DataImporter(cache=_cache(args))
+    sources = [('default', importer.default_components_data())] if args.default else []
+    sources += [(fichier, None) for fichier in _expand_inputs(args.inputs)]
+    if not sources:
+        raise SystemExit("cg: give at least one input file or --default")
+
+    records = []
+    rendus = []
+    for source, data in sources:
+        if data is None and args.stream:
+            # Lecture par blocs à mémoire bornée, sans construire la table des composants
+            poids_total, moments = importer.component_moments(source, args.chunksize)
+            cg = cg_from_moments(poids_total, moments)
+        else:
+            if data is None:
+                data = importer.data_component(source)
+            calculateur = CenterOfGravityCalculator(data)
+            cg = calculateur.calculate()
+            poids_total = float(calculateur.to_arrays()[1].sum())
+            if args.plot:
+                from visualization import Visualization3D
+                Visualization3D(data, cg).plot_aircraft()
+            if args.render_dir:
+                rendus.append((_nom_fichier(source), data, cg))
+        records.append({'source': source, 'poids_total': poids_total,
+                        'cg_x': cg[0], 'cg_y': cg[1], 'cg_z': cg[2]})
+
+    if rendus:
+        import rendering
+        if args.render_format == 'pdf':
+            os.makedirs(args.render_dir, exist_ok=True)
+            rendering.render_cg_pdf(rendus, os.path.join(args.render_dir, 'cg.pdf'))
+        else:
+            rendering.render_cg_batch(rendus, args.render_dir, args.render_format, args.render_workers)
+    _write_records(records, args.format, args.output)
+
+
+def run_aero(args):
+    """
+    Sous-commande aero : grandeurs dérivées de chaque polaire des fichiers d'aérodynamique.
+    """
+    from aerodynamics import AerodynamicsAnalyzer
+    from data_import import DataImporter
+
+    importer = DataImporter(cache=_cache(args))
+    polaires = [('default', None, importer.default_profil_data())] if args.default else []
+    for fichier in _expand_inputs(args.inputs):
+        base = importer.data_polars(fichier)
+        polaires += [(fichier, base.reynolds[i], base.row(i)) for i in range(len(base))]
+    if not polaires:
+        raise SystemExit("aero: give at least one input file or --default")
+
+    records = []
+    rendus = []
+    for source, reynolds, (profil_aile, corde, alpha_data, cl_data, cd_data) in polaires:
+        analyzer = AerodynamicsAnalyzer(profil_aile, corde, alpha_data, cl_data, cd_data)
+        _, yup, _, ydown = analyzer.calculer_coordonnees(int(profil_aile) / 100)
+        record = {'source': source, 'profil_aile': int(profil_aile),
+                  'reynolds': None if reynolds is None or reynolds != reynolds else float(reynolds),
+                  'corde': float(corde), 'epaisseur_max': float((yup - ydown).max())}
+        record.update(analyzer.interpolateur(args.methode).derived())
+        records.append(record)
+        if args.plot:
+            analyzer.tracer_profil()
+            analyzer.plot_polar_cl_alpha()
+            analyzer.plot_polar_cl_cd()
+        if args.render_dir:
+            nom = f"{_nom_fichier(source)}_{len(rendus)}"
+            rendus.append((nom, (profil_aile, corde, alpha_data, cl_data, cd_data)))
+
+    if rendus:
+        import rendering
+        if args.render_format == 'pdf':
+            os.makedirs(args.render_dir, exist_ok=True)
+            rendering.render_aero_pdf(rendus, os.path.join(args.render_dir, 'aero.pdf'))
+        else:
+            rendering.render_aero_batch(rendus, args.render_dir, args.render_format, args.render_workers)
+    _write_records(records, args.format, args.output)
+
+
+def _parse_range(texte):
+    """
+    Décode une option --range 'paramètre=min:max:n' ou --values 'paramètre=v1,v2,...'.
+
+    :return: Tuple (paramètre, valeurs ou (min, max, n))
+    """
+    parametre, _, valeurs = texte.partition('=')
+    if not parametre or not valeurs:
+        raise argparse.ArgumentTypeError(f"Expected 'parameter=...', got {texte!r}")
+    return parametre, valeurs
+
+
+def run_sweep(args):
+    """
+    Sous-commande sweep : balayage parallèle de l'espace de conception.
+    """
+    import numpy as np
+
+    from data_import import DataImporter
+    from sweep import SweepRunner
+
+    importer = DataImporter(cache=_cache(args))
+    data = importer.data_component(args.components) if args.components else importer.default_components_data()
+    runner = SweepRunner(data, corde=args.corde, epaisseur=args.epaisseur, workers=args.workers,
+                         chunk_size=args.chunk_size, progress=not args.quiet)
+
+    if args.lhs:
+        bornes = {}
+        for parametre, valeurs in args.range:
+            bas, haut = valeurs.split(':')[:2]
+            bornes[parametre] = (float(bas), float(haut))
+        runner.run_latin_hypercube(bornes, args.lhs, args.output, seed=args.seed)
+    else:
+        grille = {}
+        for parametre, valeurs in args.range:
+            bas, haut, n = valeurs.split(':')
+            grille[parametre] = np.linspace(float(bas), float(haut), int(n))
+        for parametre, valeurs in args.values:
+            grille[parametre] = [float(v) for v in valeurs.split(',')]
+        if not grille:
+            raise SystemExit("sweep: give at least one --range or --values")
+        runner.run_grid(grille, args.output)
+
+
+def run_uncertainty(args):
+    """
+    Sous-commande uncertainty : dispersion du centre de gravité par Monte-Carlo.
+    """
+    from data_import import DataImporter
+    from uncertainty import CGUncertainty
+
+    importer = DataImporter(cache=_cache(args))
+    data = importer.data_component(args.components) if args.components else importer.default_components_data()
+    tolerances = {}
+    for parametre, loi in args.tolerance:
+        nom, *valeurs = loi.split(':')
+        tolerances[parametre] = (nom, *map(float, valeurs))
+    if not tolerances:
+        raise SystemExit("uncertainty: give at least one --tolerance")
+    resultat = CGUncertainty(data, tolerances).run(args.samples, seed=args.seed, taille_bloc=args.block_size,
+                                                   workers=args.workers)
+    _write_records(resultat.to_records(), args.format, args.output)
+
+
+def _parse_linspace(texte):
+    """
+    Décode une option 'min:max:n' en tableau de valeurs régulièrement espacées.
+    """
+    import numpy as np
+    try:
+        bas, haut, n = texte.split(':')
+        return np.linspace(float(bas), float(haut), int(n))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected 'min:max:n', got {texte!r}") from None
+
+
+def run_trim(args):
+    """
+    Sous-commande trim : équilibre et performances sur une grille de vitesses et d'altitudes.
+    """
+    from data_import import DataImporter
+    from performance import PerformanceSolver
+    from polar_interpolation import PolarInterpolator
+
+    importer = DataImporter(cache=_cache(args))
+    data = importer.data_component(args.components) if args.components else importer.default_components_data()
+    _, _, alpha_data, cl_data, cd_data = (importer.data_profil(args.polar) if args.polar
+                                          else importer.default_profil_data())
+    solver = PerformanceSolver(data, PolarInterpolator(alpha_data, cl_data, cd_data, methode=args.methode),
+                               surface_aile=args.surface_aile, corde_moyenne=args.corde_moyenne,
+                               surface_empennage=args.surface_empennage, x_foyer_aile=args.x_foyer_aile,
+                               x_foyer_empennage=args.x_foyer_empennage, cd0_supplementaire=args.cd0)
+    _write_records(solver.solve(args.vitesses, args.altitudes).to_records(), args.format, args.output)
+
+
+def run_serve(args):
+    """
+    Sous-commande serve : service HTTP/JSON de longue durée (voir le module server).
+    """
+    import server
+    server.main(['--host', args.host, '--port', str(args.port), '--batch-window', str(args.batch_window),
+                 '--max-batch', str(args.max_batch), '--cache-size', str(args.cache_size)])
+
+
+def build_parser():
+    """
+    Construit l'analyseur des arguments de la ligne de commande.
+
+    :return: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        description="Calcul du centre de gravité et analyse aérodynamique d'un avion, en mode non interactif.")
+    commun = argparse.ArgumentParser(add_help=False)
+    commun.add_argument('--cache-dir', default=None, help="Répertoire du cache binaire des fichiers CSV")
+    commun.add_argument('--no-cache', action='store_true', help="Ne pas utiliser le cache binaire")
+    commun.add_argument('--profile', nargs='?', const='-', default=None, metavar='TRACE.json',
+                        help="Mesurer la durée et la mémoire de chaque étape : tableau sur la sortie d'erreur, "
+                             "ou trace Chrome dans le fichier donné")
+    sortie = argparse.ArgumentParser(add_help=False)
+    sortie.add_argument('inputs', nargs='*', help="Fichiers CSV ou motifs glob")
+    sortie.add_argument('--default', action='store_true', help="Inclure les données par défaut")
+    sortie.add_argument('--format', choices=['json', 'csv'], default='json', help="Format de sortie")
+    sortie.add_argument('--output', '-o', default=None, help="Fichier de sortie (sortie standard par défaut)")
+    sortie.add_argument('--plot', action='store_true', help="Afficher les graphiques (charge matplotlib)")
+    sortie.add_argument('--render-dir', default=None, help="Écrire les graphiques hors écran dans ce répertoire")
+    sortie.add_argument('--render-format', choices=['png', 'svg', 'pdf'], default='png',
+                        help="Format des graphiques (pdf : un seul fichier de plusieurs pages)")
+    sortie.add_argument('--render-workers', type=int, default=1, help="Nombre de processus de rendu")
+
+    sous_commandes = parser.add_subparsers(dest='commande', required=True)
+
+    cg = sous_commandes.add_parser('cg', parents=[commun, sortie], help="Centre de gravité")
+    cg.add_argument('--stream', action='store_true',
+                    help="Lire les fichiers par blocs à mémoire bornée (chaque ligne est comptée)")
+    cg.add_argument('--chunksize', type=int, default=1_000_000, help="Taille des blocs en mode --stream")
+    cg.add_argument('--assembly', action='store_true',
+                    help="Fichiers d'arbres d'ensembles (colonne parent) : une ligne par ensemble et par pièce")
+    cg.set_defaults(fonction=run_cg)
+
+    aero = sous_commandes.add_parser('aero', parents=[commun, sortie], help="Analyse aérodynamique")
+    aero.add_argument('--methode', choices=['pchip', 'lineaire'], default='pchip', help="Interpolation des polaires")
+    aero.set_defaults(fonction=run_aero)
+
+    sweep = sous_commandes.add_parser('sweep', parents=[commun], help="Balayage de l'espace de conception")
+    sweep.add_argument('--components', default=None, help="Fichier des composants de référence")
+    sweep.add_argument('--default', action='store_true', help="Utiliser les composants par défaut")
+    sweep.add_argument('--range', type=_parse_range, action='append', default=[],
+                       help="paramètre=min:max:n (grille) ou paramètre=min:max (hypercube latin)")
+    sweep.add_argument('--values', type=_parse_range, action='append', default=[],
+                       help="paramètre=v1,v2,... (grille)")
+    sweep.add_argument('--lhs', type=int, default=0, help="Nombre d'échantillons par hypercube latin")
+    sweep.add_argument('--seed', type=int, default=0, help="Graine de l'hypercube latin")
+    sweep.add_argument('--corde', type=float, default=1.5, help="Corde de référence")
+    sweep.add_argument('--epaisseur', type=float, default=0.12, help="Épaisseur relative de référence")
+    sweep.add_argument('--workers', type=int, default=None, help="Nombre de processus")
+    sweep.add_argument('--chunk-size', type=int, default=1000, help="Configurations par bloc")
+    sweep.add_argument('--output', '-o', required=True, help="Fichier CSV de résultats (reprise s'il existe)")
+    sweep.add_argument('--quiet', action='store_true', help="Ne pas afficher la progression")
+    sweep.set_defaults(fonction=run_sweep)
+
+    incertitude = sous_commandes.add_parser('uncertainty', parents=[commun],
+                                            help="Dispersion du centre de gravité par Monte-Carlo")
+    incertitude.add_argument('--components', default=None,
+                             help="Fichier des composants nominaux (composants par défaut sinon)")
+    incertitude.add_argument('--tolerance', type=_parse_range, action='append', default=[],
+                             help="paramètre=normal:écart_type, paramètre=uniform:demi_largeur ou "
+                                  "paramètre=triangular:bas:haut (écarts à la valeur nominale)")
+    incertitude.add_argument('--samples', type=int, default=1_000_000, help="Nombre d'échantillons")
+    incertitude.add_argument('--seed', type=int, default=0, help="Graine des tirages")
+    incertitude.add_argument('--block-size', type=int, default=100_000, help="Échantillons tirés à la fois")
+    incertitude.add_argument('--workers', type=int, default=1, help="Nombre de processus")
+    incertitude.add_argument('--format', choices=['json', 'csv'], default='json', help="Format de sortie")
+    incertitude.add_argument('--output', '-o', default=None, help="Fichier de sortie (sortie standard par défaut)")
+    incertitude.set_defaults(fonction=run_uncertainty)
+
+    trim = sous_commandes.add_parser('trim', parents=[commun], help="Équilibre et performances en palier")
+    trim.add_argument('--components', default=None, help="Fichier des composants (composants par défaut sinon)")
+    trim.add_argument('--polar', default=None, help="Fichier de polaires (premier profil ; profil par défaut sinon)")
+    trim.add_argument('--methode', choices=['pchip', 'lineaire'], default='pchip', help="Interpolation de la polaire")
+    trim.add_argument('--surface-aile', type=float, required=True, help="Surface de l'aile (m²)")
+    trim.add_argument('--corde-moyenne', type=float, required=True, help="Corde aérodynamique moyenne (m)")
+    trim.add_argument('--surface-empennage', type=float, required=True, help="Surface de l'empennage horizontal (m²)")
+    trim.add_argument('--x-foyer-aile', type=float, default=None, help="Position X du foyer de l'aile")
+    trim.add_argument('--x-foyer-empennage', type=float, default=None, help="Position X du foyer de l'empennage")
+    trim.add_argument('--cd0', type=float, default=0.0, help="Traînée parasite supplémentaire")
+    trim.add_argument('--vitesses', type=_parse_linspace, default='30:90:13', help="Vitesses vraies min:max:n (m/s)")
+    trim.add_argument('--altitudes', type=_parse_linspace, default='0:6000:7', help="Altitudes min:max:n (m)")
+    trim.add_argument('--format', choices=['json', 'csv'], default='json', help="Format de sortie")
+    trim.add_argument('--output', '-o', default=None, help="Fichier de sortie (sortie standard par défaut)")
+    trim.set_defaults(fonction=run_trim)
+
+    serve = sous_commandes.add_parser('serve', help="Service HTTP/JSON local avec regroupement des requêtes")
+    serve.add_argument('--host', default='127.0.0.1', help="Adresse d'écoute")
+    serve.add_argument('--port', type=int, default=8080, help="Port d'écoute")
+    serve.add_argument('--batch-window', type=float, default=0.002, help="Durée d'accumulation des lots (s)")
+    serve.add_argument('--max-batch', type=int, default=1024, help="Taille maximale d'un lot")
+    serve.add_argument('--cache-size', type=int, default=4096, help="Nombre de réponses en cache")
+    serve.set_defaults(fonction=run_serve)
+    return parser
+
+
+def main(argv=None):
+    """
+    Point d'entrée de la ligne de commande.
+
+    :param argv: Arguments (par défaut sys.argv[1:])
+    :return: Code de retour
+    """
+    args = build_parser().parse_args(argv)
+    if getattr(args, 'profile', None):
+        import instrumentation
+        instrumentation.enable()
+        try:
+            args.fonction(args)
+        finally:
+            instrumentation.report(args.profile)
+    else:
+        args.fonction(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
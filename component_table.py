@@ -0,0 +1,215 @@
+"""
+Ce module contient la classe ComponentTable, un stockage en colonnes des composants de l'avion.
+Les positions x, y, z et les poids sont conservés dans des tableaux numpy float64 contigus, ce qui évite
+le coût mémoire d'un dictionnaire par composant tout en restant compatible avec l'ancien format
+{'nom': {'position': [x, y, z], 'poids': w}}.
+"""
+
+import sys
+from collections.abc import MutableMapping
+
+import numpy as np
+
+
+class ComponentTable(MutableMapping):
+    """
+    Table des composants, utilisable comme le dictionnaire {'nom': {'position': [x, y, z], 'poids': w}}.
+
+    ATTENTION : table[nom] retourne une COPIE des propriétés du composant. Modifier cette copie
+    (table[nom]['poids'] = w, table[nom]['position'][0] = x) est sans effet sur la table.
+    Pour modifier un composant, utiliser table[nom] = {'position': [x, y, z], 'poids': w},
+    table.set(nom, x, y, z, w), ou écrire dans les vues colonnes (table.poids[table.index_of(nom)] = w).
+    """
+    __slots__ = ('_noms', '_index', '_colonnes', '_taille')
+
+    def __init__(self, capacite=16):
+        """
+        Initialise une table vide.
+
+        :param capacite: Nombre de composants pouvant être stockés avant la première réallocation
+        """
+        self._noms = []  # Noms des composants, dans l'ordre d'insertion
+        self._index = {}  # Nom du composant -> numéro de ligne
+        # Une ligne par colonne (x, y, z, poids) : chaque colonne est contiguë en mémoire
+        self._colonnes = np.zeros((4, capacite), dtype=np.float64)
+        self._taille = 0
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Construit une table à partir du format dictionnaire utilisé dans le reste du programme.
+
+        :param data: Dictionnaire contenant les positions et poids des composants de l'avion
+        :return: Instance de ComponentTable
+        """
+        if isinstance(data, cls):
+            return data
+        noms = list(data.keys())
+        positions = np.array([data[nom]['position'] for nom in noms], dtype=np.float64).reshape(-1, 3)
+        poids = np.array([data[nom]['poids'] for nom in noms], dtype=np.float64)
+        return cls.from_arrays(noms, positions[:, 0], positions[:, 1], positions[:, 2], poids)
+
+    @classmethod
+    def from_arrays(cls, noms, x, y, z, poids):
+        """
+        Construit une table à partir de colonnes. Si un nom apparaît plusieurs fois, la dernière ligne
+        l'emporte, comme lors de la construction ligne par ligne d'un dictionnaire.
+
+        :param noms: Séquence des noms des composants
+        :param x: Positions X des composants
+        :param y: Positions Y des composants
+        :param z: Positions Z des composants
+        :param poids: Poids des composants
+        :return: Instance de ComponentTable
+        """
+        colonnes = np.vstack([np.asarray(col, dtype=np.float64) for col in (x, y, z, poids)])
+        return cls.from_columns(noms, colonnes)
+
+    @classmethod
+    def from_columns(cls, noms, colonnes):
+        """
+        Construit une table à partir d'un tableau (4, N) contenant les lignes x, y, z et poids.
+        Le tableau est adopté sans copie lorsqu'il est déjà en float64 et sans doublon de nom,
+        ce qui permet de travailler directement sur un tableau projeté en mémoire (np.load avec mmap_mode).
+
+        :param noms: Séquence des noms des composants
+        :param colonnes: Tableau de forme (4, N)
+        :return: Instance de ComponentTable
+        """
+        noms = list(map(sys.intern, map(str, noms)))
+        colonnes = np.asarray(colonnes, dtype=np.float64)
+        if colonnes.ndim != 2 or colonnes.shape != (4, len(noms)):
+            raise ValueError("colonnes must have shape (4, len(noms)).")
+
+        index = dict(zip(noms, range(len(noms))))
+        if len(index) != len(noms):
+            # Doublons : on conserve l'ordre de première apparition et les valeurs de la dernière
+            noms = list(dict.fromkeys(noms))
+            colonnes = colonnes[:, [index[nom] for nom in noms]]
+            index = dict(zip(noms, range(len(noms))))
+
+        table = cls(capacite=0)
+        table._noms = noms
+        table._index = index
+        table._colonnes = colonnes
+        table._taille = len(noms)
+        return table
+
+    def __len__(self):
+        return self._taille
+
+    def __iter__(self):
+        return iter(self._noms)
+
+    def __contains__(self, component):
+        return component in self._index
+
+    def __getitem__(self, component):
+        """
+        Retourne les propriétés d'un composant au format dictionnaire (recherche en O(1)).
+        Le dictionnaire retourné est une copie : le modifier ne modifie pas la table (voir la classe).
+        """
+        i = self._index[component]
+        return {'position': self._colonnes[:3, i].tolist(), 'poids': float(self._colonnes[3, i])}
+
+    def __setitem__(self, component, properties):
+        """
+        Ajoute ou remplace un composant à partir d'un dictionnaire {'position': [x, y, z], 'poids': w}.
+        """
+        x, y, z = properties['position']
+        self.set(component, x, y, z, properties['poids'])
+
+    def __delitem__(self, component):
+        """
+        Supprime un composant en temps constant en déplaçant la dernière ligne à sa place.
+        L'ordre des composants restants n'est donc pas conservé.
+        """
+        i = self._index.pop(component)
+        dernier = self._taille - 1
+        if i != dernier:
+            nom_dernier = self._noms[dernier]
+            self._noms[i] = nom_dernier
+            self._index[nom_dernier] = i
+            self._colonnes[:, i] = self._colonnes[:, dernier]
+        self._noms.pop()
+        self._taille = dernier
+
+    def __repr__(self):
+        return f"ComponentTable({len(self)} composants)"
+
+    def set(self, component, x, y, z, poids):
+        """
+        Ajoute ou remplace un composant sans passer par un dictionnaire intermédiaire.
+
+        :param component: Nom du composant
+        :param x: Position X
+        :param y: Position Y
+        :param z: Position Z
+        :param poids: Poids du composant
+        """
+        i = self._index.get(component)
+        if i is None:
+            if self._taille == self._colonnes.shape[1]:
+                # Doublement de la capacité pour un ajout en temps constant amorti
+                colonnes = np.zeros((4, max(2 * self._colonnes.shape[1], 16)), dtype=np.float64)
+                colonnes[:, :self._taille] = self._colonnes[:, :self._taille]
+                self._colonnes = colonnes
+            component = sys.intern(str(component))
+            i = self._taille
+            self._noms.append(component)
+            self._index[component] = i
+            self._taille += 1
+        self._colonnes[:, i] = (x, y, z, poids)
+
+    def index_of(self, component):
+        """
+        Retourne le numéro de ligne d'un composant dans les tableaux.
+
+        :param component: Nom du composant
+        :return: Indice entier
+        """
+        return self._index[component]
+
+    @property
+    def names(self):
+        """Liste des noms des composants, dans l'ordre des lignes."""
+        return list(self._noms)
+
+    @property
+    def x(self):
+        """Vue (sans copie) sur les positions X."""
+        return self._colonnes[0, :self._taille]
+
+    @property
+    def y(self):
+        """Vue (sans copie) sur les positions Y."""
+        return self._colonnes[1, :self._taille]
+
+    @property
+    def z(self):
+        """Vue (sans copie) sur les positions Z."""
+        return self._colonnes[2, :self._taille]
+
+    @property
+    def poids(self):
+        """Vue (sans copie) sur les poids."""
+        return self._colonnes[3, :self._taille]
+
+    @property
+    def colonnes(self):
+        """Vue (sans copie) de forme (4, N) sur les lignes x, y, z et poids."""
+        return self._colonnes[:, :self._taille]
+
+    @property
+    def positions(self):
+        """Vue (sans copie) de forme (N, 3) sur les positions, utilisable directement par calculate_batch."""
+        return self._colonnes[:3, :self._taille].T
+
+    def to_dict(self):
+        """
+        Convertit la table au format dictionnaire utilisé historiquement.
+
+        :return: Dictionnaire contenant les positions et poids des composants de l'avion
+        """
+        colonnes = self._colonnes[:, :self._taille].T.tolist()
+        return {nom: {'position': ligne[:3], 'poids': ligne[3]} for nom, ligne in zip(self._noms, colonnes)}
@@ -0,0 +1,186 @@
+"""
+Ce module contient la classe DataCache qui conserve sur disque, au format binaire .npy, les données déjà importées
+depuis les fichiers CSV. Une entrée est identifiée par le chemin du fichier source et le type de données,
+et n'est valide que tant que la date de modification et la taille du fichier source n'ont pas changé.
+Les tableaux sont relus par projection en mémoire (np.load avec mmap_mode), sans nouvelle analyse du texte.
+
+Utilisation en ligne de commande :
+    python data_cache.py info
+    python data_cache.py invalidate [fichier.csv ...]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+# Répertoire du cache par défaut, modifiable avec la variable d'environnement CG_CACHE_DIR
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'calcul_centre_gravite')
+# Taille maximale du cache par défaut, en octets
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class DataCache:
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialisation du cache.
+
+        :param cache_dir: Répertoire du cache (par défaut CG_CACHE_DIR ou ~/.cache/calcul_centre_gravite)
+        :param max_bytes: Taille totale maximale du cache ; les entrées les moins récemment utilisées sont supprimées au-delà
+        """
+        self.cache_dir = cache_dir or os.environ.get('CG_CACHE_DIR', DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes
+
+    def _entry_dir(self, filepath, kind):
+        """
+        Retourne le répertoire de l'entrée associée au fichier source et au type de données.
+        """
+        cle = f"{os.path.abspath(filepath)}\0{kind}".encode('utf-8')
+        return os.path.join(self.cache_dir, hashlib.sha1(cle).hexdigest())
+
+    @staticmethod
+    def _signature(filepath):
+        """
+        Retourne la date de modification (en ns) et la taille du fichier source.
+        """
+        stat = os.stat(filepath)
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, filepath, kind):
+        """
+        Charge les tableaux associés à un fichier source, s'ils sont présents et à jour.
+
+        :param filepath: Chemin du fichier source
+        :param kind: Type de données (par exemple 'component' ou 'profil')
+        :return: Dictionnaire {nom: tableau projeté en mémoire}, ou None si l'entrée est absente ou périmée
+        """
+        entry = self._entry_dir(filepath, kind)
+        meta_path = os.path.join(entry, 'meta.json')
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if (meta['mtime_ns'], meta['size']) != self._signature(filepath):
+            # Le fichier source a été modifié depuis la mise en cache
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+
+        # Mettre à jour la date d'accès utilisée pour l'éviction LRU
+        os.utime(meta_path)
+        # mmap_mode='c' : projection en copie sur écriture, les modifications éventuelles restent en mémoire
+        return {nom: np.load(os.path.join(entry, f"{nom}.npy"), mmap_mode='c', allow_pickle=False)
+                for nom in meta['arrays']}
+
+    def put(self, filepath, kind, arrays):
+        """
+        Enregistre les tableaux associés à un fichier source puis applique l'éviction si nécessaire.
+
+        :param filepath: Chemin du fichier source
+        :param kind: Type de données
+        :param arrays: Dictionnaire {nom: tableau numpy}, les chaînes étant stockées en unicode de taille fixe
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = self._entry_dir(filepath, kind)
+        mtime_ns, size = self._signature(filepath)
+
+        # Écriture dans un répertoire temporaire puis renommage, pour ne jamais exposer une entrée incomplète
+        tmp = tempfile.mkdtemp(dir=self.cache_dir, prefix='.tmp-')
+        try:
+            for nom, tableau in arrays.items():
+                tableau = np.asarray(tableau)
+                if tableau.dtype == object:
+                    tableau = tableau.astype(str)
+                np.save(os.path.join(tmp, f"{nom}.npy"), tableau, allow_pickle=False)
+            meta = {'source': os.path.abspath(filepath), 'kind': kind, 'mtime_ns': mtime_ns, 'size': size,
+                    'arrays': list(arrays)}
+            with open(os.path.join(tmp, 'meta.json'), 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            shutil.rmtree(entry, ignore_errors=True)
+            os.replace(tmp, entry)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+        self.evict()
+
+    def entries(self):
+        """
+        Liste les entrées du cache.
+
+        :return: Liste de tuples (répertoire, métadonnées, taille en octets, date du dernier accès)
+        """
+        resultats = []
+        if not os.path.isdir(self.cache_dir):
+            return resultats
+        for nom in os.listdir(self.cache_dir):
+            entry = os.path.join(self.cache_dir, nom)
+            meta_path = os.path.join(entry, 'meta.json')
+            try:
+                with open(meta_path, encoding='utf-8') as f:
+                    meta = json.load(f)
+                dernier_acces = os.stat(meta_path).st_mtime
+                taille = sum(e.stat().st_size for e in os.scandir(entry))
+            except (OSError, ValueError):
+                continue
+            resultats.append((entry, meta, taille, dernier_acces))
+        return resultats
+
+    def evict(self):
+        """
+        Supprime les entrées les moins récemment utilisées jusqu'à repasser sous max_bytes.
+        """
+        entrees = sorted(self.entries(), key=lambda e: e[3])
+        total = sum(e[2] for e in entrees)
+        for entry, _, taille, _ in entrees:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= taille
+
+    def invalidate(self, filepath=None):
+        """
+        Supprime les entrées d'un fichier source, ou tout le cache si aucun fichier n'est précisé.
+
+        :param filepath: Chemin du fichier source (optionnel)
+        :return: Nombre d'entrées supprimées
+        """
+        source = os.path.abspath(filepath) if filepath is not None else None
+        n = 0
+        for entry, meta, _, _ in self.entries():
+            if source is None or meta['source'] == source:
+                shutil.rmtree(entry, ignore_errors=True)
+                n += 1
+        return n
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gestion du cache binaire des fichiers CSV importés.")
+    parser.add_argument('--cache-dir', default=None, help="Répertoire du cache")
+    sous_commandes = parser.add_subparsers(dest='commande', required=True)
+    sous_commandes.add_parser('info', help="Afficher les entrées du cache")
+    invalidate = sous_commandes.add_parser('invalidate', help="Supprimer des entrées du cache")
+    invalidate.add_argument('fichiers', nargs='*', help="Fichiers sources à invalider (tout le cache si absent)")
+    args = parser.parse_args()
+
+    cache = DataCache(args.cache_dir)
+    if args.commande == 'info':
+        entrees = cache.entries()
+        for _, meta, taille, _ in entrees:
+            print(f"{meta['kind']:<10} {taille / 1e6:10.2f} Mo  {meta['source']}")
+        print(f"{len(entrees)} entrée(s), {sum(e[2] for e in entrees) / 1e6:.2f} Mo dans {cache.cache_dir}")
+    else:
+        if args.fichiers:
+            n = sum(cache.invalidate(fichier) for fichier in args.fichiers)
+        else:
+            n = cache.invalidate()
+        print(f"{n} entrée(s) supprimée(s)")
+
+
+if __name__ == "__main__":
+    main()
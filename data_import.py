@@ -3,11 +3,30 @@ Ce module contient la classe DataImporter qui permet d'importer et de traiter le
 Il inclut des méthodes pour entrer les données manuellement, les importer depuis une base de données et utiliser des données par défaut.
 """
 
-import pandas as pd
-import ast
+import numpy as np
+
+from component_table import ComponentTable
+from instrumentation import profiled
+
+# Types explicites des colonnes du fichier des composants, pour éviter l'inférence de types par pandas
+COMPONENT_DTYPES = {
+    'component': str,
+    'position_x': np.float64,
+    'position_y': np.float64,
+    'position_z': np.float64,
+    'poids': np.float64,
+}
 
 
 class DataImporter:
+    def __init__(self, cache=None):
+        """
+        Initialisation de l'importateur.
+
+        :param cache: DataCache optionnel ; les fichiers CSV déjà analysés sont alors relus depuis le cache binaire
+        """
+        self.cache = cache
+
     def manual_input(self):
         """
         Permet à l'utilisateur d'entrer manuellement les données des composants de l'avion.
@@ -58,6 +77,7 @@ class DataImporter:
             'train_atterrissage': train_atterrissage
         }
 
+    @profiled
     def from_database(self, filepath):
         """
         Importe les données depuis un fichier CSV.
@@ -65,47 +85,94 @@ class DataImporter:
         :param filepath: Chemin du fichier CSV
         :return: DataFrame contenant les données importées
         """
+        import pandas as pd  # Import différé : pandas n'est chargé que pour lire un fichier
         return pd.read_csv(filepath)
 
+    @profiled
     def data_component(self, filepath):
         """
-        Importe les données des composants depuis un fichier CSV et les organise sous forme de dictionnaire.
+        Importe les données des composants depuis un fichier CSV et les organise sous forme de table en colonnes.
 
         :param filepath: Chemin du fichier CSV
-        :return: Dictionnaire contenant les positions et poids des composants de l'avion
+        :return: ComponentTable (compatible dictionnaire) contenant les positions et poids des composants de l'avion
         """
-        df = self.from_database(filepath)
-
-        # Créer un dictionnaire pour stocker les données de chaque composant
-        data = {}
-        for index, row in df.iterrows():
-            component = row['component']
-            position = [row['position_x'], row['position_y'], row['position_z']]
-            poids = row['poids']
-            data[component] = {'position': position, 'poids': poids}
+        if self.cache is not None:
+            arrays = self.cache.get(filepath, 'component')
+            if arrays is not None:
+                return ComponentTable.from_columns(arrays['noms'], arrays['colonnes'])
+
+        import pandas as pd  # Import différé : pandas n'est chargé que pour lire un fichier
+        df = pd.read_csv(filepath, dtype=COMPONENT_DTYPES)
+
+        # Stocker les données de chaque composant dans une table en colonnes (sans parcours ligne par ligne)
+        table = ComponentTable.from_arrays(df['component'].to_numpy(), df['position_x'].to_numpy(),
+                                           df['position_y'].to_numpy(), df['position_z'].to_numpy(),
+                                           df['poids'].to_numpy())
+        if self.cache is not None:
+            self.cache.put(filepath, 'component', {'noms': table.names, 'colonnes': table.colonnes})
+        return table
+
+    @profiled
+    def component_moments(self, filepath, chunksize=1_000_000):
+        """
+        Lit un fichier de composants par blocs et cumule le poids total et les moments, sans jamais charger
+        le fichier entier en mémoire. Permet de calculer le centre de gravité de fichiers plus grands que la RAM.
 
-        # Retourner les données sous forme de dictionnaire
-        return data
+        Contrairement à data_component, chaque ligne est comptée : un composant présent plusieurs fois
+        contribue plusieurs fois au poids total.
 
+        :param filepath: Chemin du fichier CSV
+        :param chunksize: Nombre de lignes lues par bloc
+        :return: Tuple (poids_total, (moment_x, moment_y, moment_z))
+        """
+        import pandas as pd  # Import différé : pandas n'est chargé que pour lire un fichier
+        colonnes = ['position_x', 'position_y', 'position_z', 'poids']
+        dtypes = {col: COMPONENT_DTYPES[col] for col in colonnes}
+
+        total_weight = 0.0  # Poids total de l'avion
+        moments = np.zeros(3)  # Moments autour des axes x, y, z
+        with pd.read_csv(filepath, usecols=colonnes, dtype=dtypes, chunksize=chunksize) as lecteur:
+            for bloc in lecteur:
+                poids = bloc['poids'].to_numpy()
+                positions = bloc[colonnes[:3]].to_numpy()
+                total_weight += poids.sum()
+                moments += poids @ positions
+
+        return float(total_weight), tuple(moments.tolist())
+
+    @profiled
     def data_profil(self, filepath):
         """
-        Importe les données du profil d'aile depuis un fichier CSV et les extrait.
+        Importe les données du premier profil d'aile d'un fichier CSV et les extrait.
 
         :param filepath: Chemin du fichier CSV
         :return: Tuple contenant le profil d'aile, la corde, les angles d'attaque, les coefficients de portance et les coefficients de traînée
         """
-        data = self.from_database(filepath)
-
-        # Extraction des valeurs depuis le DataFrame
-        profil_aile = data['profil_aile'].iloc[0]
-        corde = data['corde'].iloc[0]
-        alpha_data = ast.literal_eval(data['alpha_data'].iloc[0])
-        cl_data = ast.literal_eval(data['cl_data'].iloc[0])
-        cd_data = ast.literal_eval(data['cd_data'].iloc[0])
+        # Extraction de la première polaire du fichier
+        profil_aile, corde, alpha_data, cl_data, cd_data = self.data_polars(filepath).row(0)
 
         # Retourner les valeurs extraites sous forme de tuple
         return profil_aile, corde, alpha_data, cl_data, cd_data
 
+    @profiled
+    def data_polars(self, filepath):
+        """
+        Importe en une seule passe toutes les polaires d'un fichier CSV (format historique ou format long).
+
+        :param filepath: Chemin du fichier CSV
+        :return: PolarDatabase indexée par profil d'aile et nombre de Reynolds
+        """
+        from polar_database import PolarDatabase  # Import différé : dépend de pandas
+        if self.cache is not None:
+            arrays = self.cache.get(filepath, 'polars')
+            if arrays is not None:
+                return PolarDatabase.from_arrays(arrays)
+
+        base = PolarDatabase.from_csv(filepath)
+        if self.cache is not None:
+            self.cache.put(filepath, 'polars', base.to_arrays())
+        return base
+
     def default_components_data(self):
         """
         Retourne des données par défaut pour les composants de l'avion.
@@ -0,0 +1,244 @@
+"""
+Ce module fournit une instrumentation légère du programme : durée, nombre d'appels et pic de mémoire
+(tracemalloc) de chaque étape (lecture des fichiers, calcul du centre de gravité, géométrie, tracés).
+
+Les étapes sont délimitées par le décorateur profiled ou le gestionnaire de contexte stage. Lorsque
+l'instrumentation est désactivée (cas par défaut), chaque appel instrumenté ne coûte qu'un test booléen.
+
+Activation :
+- variable d'environnement CG_PROFILE : '1' affiche un tableau récapitulatif sur la sortie d'erreur à la fin
+  du programme, un chemin de fichier '.json' y écrit une trace au format Chrome (chrome://tracing, Perfetto) ;
+  CG_PROFILE_MEMORY=0 désactive la mesure de la mémoire, qui ralentit sensiblement les allocations ;
+- option --profile de la ligne de commande (module cli) ;
+- par programme : enable(), puis format_summary() ou write_chrome_trace().
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+_actif = False  # Lu à chaque appel instrumenté : seul coût lorsque l'instrumentation est désactivée
+_memoire = False
+_demarrage_tracemalloc = False  # True si tracemalloc a été démarré par ce module
+_verrou = threading.Lock()
+_local = threading.local()  # Pile des étapes en cours, propre à chaque thread
+_statistiques = {}  # Nom de l'étape -> [appels, durée totale, durée min, durée max, pic mémoire max]
+_evenements = []  # Étapes terminées, pour la trace Chrome : (nom, début, durée, pic mémoire, thread)
+_origine = time.perf_counter()
+
+
+class _Etape:
+    __slots__ = ('nom', 'debut', 'memoire_debut', 'pic')
+
+    def __init__(self, nom):
+        """
+        Étape instrumentée en cours (gestionnaire de contexte).
+
+        :param nom: Nom de l'étape
+        """
+        self.nom = nom
+
+    def __enter__(self):
+        pile = getattr(_local, 'pile', None)
+        if pile is None:
+            pile = _local.pile = []
+        if _memoire:
+            courant, pic = tracemalloc.get_traced_memory()
+            # tracemalloc ne conserve qu'un seul pic : celui de l'étape parente est sauvegardé avant de le
+            # réinitialiser, et lui sera reporté à la sortie de cette étape
+            if pile:
+                pile[-1].pic = max(pile[-1].pic, pic)
+            tracemalloc.reset_peak()
+            self.memoire_debut = self.pic = courant
+        pile.append(self)
+        self.debut = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        duree = time.perf_counter() - self.debut
+        pile = _local.pile
+        pile.pop()
+        pic = 0
+        if _memoire:
+            pic_absolu = max(self.pic, tracemalloc.get_traced_memory()[1])
+            pic = pic_absolu - self.memoire_debut
+            if pile:
+                pile[-1].pic = max(pile[-1].pic, pic_absolu)
+        with _verrou:
+            stats = _statistiques.get(self.nom)
+            if stats is None:
+                _statistiques[self.nom] = [1, duree, duree, duree, pic]
+            else:
+                stats[0] += 1
+                stats[1] += duree
+                stats[2] = min(stats[2], duree)
+                stats[3] = max(stats[3], duree)
+                stats[4] = max(stats[4], pic)
+            _evenements.append((self.nom, self.debut - _origine, duree, pic, threading.get_ident()))
+        return False
+
+
+class _EtapeNulle:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_ETAPE_NULLE = _EtapeNulle()
+
+
+def stage(nom):
+    """
+    Délimite une étape instrumentée : with stage('lecture'): ...
+
+    :param nom: Nom de l'étape
+    :return: Gestionnaire de contexte (sans effet si l'instrumentation est désactivée)
+    """
+    return _Etape(nom) if _actif else _ETAPE_NULLE
+
+
+def profiled(fonction=None, nom=None):
+    """
+    Décorateur instrumentant chaque appel d'une fonction ou d'une méthode.
+    Utilisable sans argument (@profiled) ou avec un nom d'étape (@profiled(nom='lecture')).
+
+    :param fonction: Fonction décorée
+    :param nom: Nom de l'étape (par défaut le nom qualifié de la fonction, par exemple 'DataImporter.data_component')
+    :return: Fonction décorée
+    """
+    if fonction is None:
+        return functools.partial(profiled, nom=nom)
+    nom = nom or fonction.__qualname__
+
+    @functools.wraps(fonction)
+    def enveloppe(*args, **kwargs):
+        if not _actif:
+            return fonction(*args, **kwargs)
+        with _Etape(nom):
+            return fonction(*args, **kwargs)
+    return enveloppe
+
+
+def enable(memoire=True):
+    """
+    Active l'instrumentation.
+
+    :param memoire: Mesurer aussi le pic de mémoire de chaque étape (démarre tracemalloc si nécessaire)
+    """
+    global _actif, _memoire, _demarrage_tracemalloc
+    if memoire and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _demarrage_tracemalloc = True
+    _memoire = memoire
+    _actif = True
+
+
+def disable():
+    """
+    Désactive l'instrumentation ; les mesures déjà faites sont conservées.
+    """
+    global _actif, _memoire, _demarrage_tracemalloc
+    _actif = False
+    _memoire = False
+    if _demarrage_tracemalloc:
+        tracemalloc.stop()
+        _demarrage_tracemalloc = False
+
+
+def is_enabled():
+    """
+    :return: True si l'instrumentation est active
+    """
+    return _actif
+
+
+def reset():
+    """
+    Efface les mesures.
+    """
+    global _origine
+    with _verrou:
+        _statistiques.clear()
+        _evenements.clear()
+        _origine = time.perf_counter()
+
+
+def summary():
+    """
+    Récapitulatif des mesures, étapes triées par durée totale décroissante.
+
+    :return: Liste de dictionnaires (stage, calls, total, mean, min, max, peak_memory en octets)
+    """
+    with _verrou:
+        lignes = [{'stage': nom, 'calls': appels, 'total': total, 'mean': total / appels, 'min': minimum,
+                   'max': maximum, 'peak_memory': pic}
+                  for nom, (appels, total, minimum, maximum, pic) in _statistiques.items()]
+    return sorted(lignes, key=lambda ligne: ligne['total'], reverse=True)
+
+
+def format_summary():
+    """
+    Met en forme le récapitulatif sous forme de tableau texte.
+
+    :return: Chaîne de caractères
+    """
+    lignes = summary()
+    largeur = max([len('Étape')] + [len(ligne['stage']) for ligne in lignes])
+    texte = [f"{'Étape':<{largeur}}  {'Appels':>8}  {'Total (s)':>10}  {'Moyenne (s)':>11}  {'Max (s)':>10}"
+             f"  {'Pic mémoire':>12}"]
+    for ligne in lignes:
+        memoire = f"{ligne['peak_memory'] / 2 ** 20:.2f} Mo" if _memoire or ligne['peak_memory'] else '-'
+        texte.append(f"{ligne['stage']:<{largeur}}  {ligne['calls']:>8}  {ligne['total']:>10.4f}"
+                     f"  {ligne['mean']:>11.6f}  {ligne['max']:>10.4f}  {memoire:>12}")
+    return '\n'.join(texte)
+
+
+def write_chrome_trace(chemin):
+    """
+    Écrit les étapes mesurées au format Chrome Trace Event (événements complets 'X', en microsecondes).
+
+    :param chemin: Chemin du fichier JSON
+    """
+    pid = os.getpid()
+    with _verrou:
+        evenements = [{'name': nom, 'cat': nom.split('.')[0], 'ph': 'X', 'ts': debut * 1e6, 'dur': duree * 1e6,
+                       'pid': pid, 'tid': tid, 'args': {'peak_memory': pic}}
+                      for nom, debut, duree, pic, tid in _evenements]
+    with open(chemin, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': evenements, 'displayTimeUnit': 'ms'}, f)
+
+
+def report(destination):
+    """
+    Produit le rapport demandé : tableau sur la sortie d'erreur, ou trace Chrome si la destination est un fichier.
+
+    :param destination: '-' (ou '1') pour le tableau, sinon chemin du fichier de trace JSON
+    """
+    if destination in ('-', '1'):
+        print(format_summary(), file=sys.stderr)
+    else:
+        write_chrome_trace(destination)
+
+
+def configure_from_env():
+    """
+    Active l'instrumentation si la variable d'environnement CG_PROFILE est définie, et programme le rapport
+    à la fin du programme.
+    """
+    destination = os.environ.get('CG_PROFILE', '')
+    if destination in ('', '0'):
+        return
+    enable(memoire=os.environ.get('CG_PROFILE_MEMORY', '1') != '0')
+    atexit.register(report, destination)
+
+
+configure_from_env()
@@ -0,0 +1,246 @@
+"""
+Ce module traite le problème inverse du calcul du centre de gravité : où placer la charge (fret, lest,
+batteries) et en quelle quantité pour que le centre de gravité atteigne une position cible.
+
+Deux approches sont proposées :
+- LoadPlanner : poids et/ou positions continus dans des bornes, résolu par gradient projeté ; le centre de
+  gravité étant un rapport de moments, son gradient par rapport aux poids et positions est analytique ;
+- assign_slots : affectation d'objets à des emplacements discrets (un objet par emplacement), résolue par une
+  recherche locale vectorisée (déplacements et échanges évalués tous à la fois à chaque itération).
+"""
+
+import numpy as np
+
+from center_of_gravity import CenterOfGravityCalculator
+
+
+class LoadPlan:
+    def __init__(self, poids, positions, cg, poids_total, erreur, iterations, sensibilites, converge,
+                 emplacements=None):
+        """
+        Plan de chargement obtenu par l'optimisation.
+
+        :param poids: Dictionnaire {composant: poids} des composants mobiles
+        :param positions: Dictionnaire {composant: [x, y, z]} des composants mobiles
+        :param cg: Centre de gravité obtenu (cg_x, cg_y, cg_z)
+        :param poids_total: Poids total de l'avion
+        :param erreur: Écart pondéré au carré entre le centre de gravité obtenu et la cible
+        :param iterations: Nombre d'itérations effectuées
+        :param sensibilites: Dictionnaire {composant: {'poids': dcg/dpoids (3,), 'position': dcg_a/dposition_a}}
+        :param converge: True si le critère d'arrêt a été atteint
+        :param emplacements: Dictionnaire {objet: nom de l'emplacement retenu} (affectation discrète), sinon None
+        """
+        self.poids = poids
+        self.positions = positions
+        self.cg = cg
+        self.poids_total = poids_total
+        self.erreur = erreur
+        self.iterations = iterations
+        self.sensibilites = sensibilites
+        self.converge = converge
+        self.emplacements = emplacements
+
+
+class LoadPlanner:
+    def __init__(self, data, cible, ponderation=(1.0, 1.0, 1.0)):
+        """
+        Initialisation du problème de chargement.
+
+        :param data: Dictionnaire ou ComponentTable contenant les propriétés des composants (valeurs initiales)
+        :param cible: Centre de gravité visé (x, y, z) ; une coordonnée None n'est pas contrainte
+        :param ponderation: Poids de chaque axe dans l'écart à la cible
+        """
+        self.noms, poids, positions = CenterOfGravityCalculator(data).to_arrays()
+        self.poids = np.array(poids, dtype=np.float64)
+        self.positions = np.array(positions, dtype=np.float64)
+        self.cible = np.array([0.0 if c is None else c for c in cible], dtype=np.float64)
+        self.ponderation = np.array([0.0 if c is None else w for c, w in zip(cible, ponderation)], dtype=np.float64)
+        self._index = {nom: i for i, nom in enumerate(self.noms)}
+        self._bornes_poids = {}
+        self._bornes_positions = {}
+
+    def movable(self, component, poids=None, position=None):
+        """
+        Déclare un composant mobile.
+
+        :param component: Nom du composant
+        :param poids: Bornes (min, max) du poids, ou None si le poids est fixe
+        :param position: Bornes ((xmin, xmax), (ymin, ymax), (zmin, zmax)) de la position, ou None si elle est fixe ;
+                         des bornes égales fixent un axe
+        """
+        if component not in self._index:
+            raise KeyError(f"Unknown component: {component!r}")
+        if poids is not None:
+            self._bornes_poids[component] = poids
+        if position is not None:
+            self._bornes_positions[component] = position
+
+    def _gradient(self, poids, positions):
+        """
+        Calcule l'écart à la cible et son gradient analytique par rapport aux poids et positions.
+
+        :return: Tuple (erreur, gradient poids (N,), gradient positions (N, 3), cg, poids_total)
+        """
+        poids_total = poids.sum()
+        cg = poids @ positions / poids_total
+        ecart = self.ponderation * (cg - self.cible)
+        erreur = float(ecart @ (cg - self.cible))
+        # dcg/dpoids_i = (p_i - cg) / W et dcg_a/dp_ia = poids_i / W
+        gradient_poids = 2 * (positions - cg) @ ecart / poids_total
+        gradient_positions = 2 * poids[:, np.newaxis] * ecart / poids_total
+        return erreur, gradient_poids, gradient_positions, cg, poids_total
+
+    def solve(self, max_iterations=5000, tolerance=1e-12):
+        """
+        Résout le problème par gradient projeté avec pas de Barzilai-Borwein.
+
+        :param max_iterations: Nombre maximal d'itérations
+        :param tolerance: Arrêt lorsque l'écart ou le pas projeté devient inférieur à cette valeur
+        :return: LoadPlan
+        """
+        n = len(self.noms)
+        bas = np.concatenate([self.poids, self.positions.ravel()])
+        haut = bas.copy()
+        for component, (poids_min, poids_max) in self._bornes_poids.items():
+            i = self._index[component]
+            bas[i], haut[i] = poids_min, poids_max
+        for component, bornes in self._bornes_positions.items():
+            i = self._index[component]
+            for axe, (pos_min, pos_max) in enumerate(bornes):
+                bas[n + 3 * i + axe], haut[n + 3 * i + axe] = pos_min, pos_max
+        if np.any(bas > haut):
+            raise ValueError("Lower bounds must not exceed upper bounds.")
+
+        def evaluer(v):
+            erreur, g_poids, g_positions, cg, poids_total = self._gradient(v[:n], v[n:].reshape(n, 3))
+            return erreur, np.concatenate([g_poids, g_positions.ravel()]), cg, poids_total
+
+        v = np.clip(np.concatenate([self.poids, self.positions.ravel()]), bas, haut)
+        erreur, gradient, cg, poids_total = evaluer(v)
+        pas = 1.0 / max(np.abs(gradient).max(), 1e-12)
+        converge = False
+        iteration = 0
+        for iteration in range(1, max_iterations + 1):
+            if erreur <= tolerance:
+                converge = True
+                break
+            nouveau = np.clip(v - pas * gradient, bas, haut)
+            nouvelle_erreur, nouveau_gradient, nouveau_cg, nouveau_total = evaluer(nouveau)
+            if nouvelle_erreur > erreur:
+                # Pas trop grand : on le réduit sans accepter l'itéré
+                pas *= 0.5
+                continue
+            s, y = nouveau - v, nouveau_gradient - gradient
+            if np.abs(s).max() <= tolerance:
+                v, erreur, gradient, cg, poids_total = nouveau, nouvelle_erreur, nouveau_gradient, nouveau_cg, nouveau_total
+                converge = True
+                break
+            sy = s @ y
+            pas = (s @ s) / sy if sy > 0 else pas * 2
+            v, erreur, gradient, cg, poids_total = nouveau, nouvelle_erreur, nouveau_gradient, nouveau_cg, nouveau_total
+
+        poids, positions = v[:n], v[n:].reshape(n, 3)
+        mobiles = list(dict.fromkeys(list(self._bornes_poids) + list(self._bornes_positions)))
+        sensibilites = {}
+        for component in mobiles:
+            i = self._index[component]
+            sensibilites[component] = {'poids': ((positions[i] - cg) / poids_total).tolist(),
+                                       'position': float(poids[i] / poids_total)}
+        return LoadPlan(
+            poids={c: float(poids[self._index[c]]) for c in mobiles},
+            positions={c: positions[self._index[c]].tolist() for c in mobiles},
+            cg=tuple(cg.tolist()),
+            poids_total=float(poids_total),
+            erreur=erreur,
+            iterations=iteration,
+            sensibilites=sensibilites,
+            converge=converge,
+        )
+
+
+def assign_slots(data, objets, emplacements, cible, ponderation=(1.0, 1.0, 1.0), max_iterations=None):
+    """
+    Affecte chaque objet à un emplacement distinct pour rapprocher le centre de gravité de la cible.
+
+    Le poids total étant fixé, l'écart à la cible ne dépend que du moment des objets : on minimise
+    ||somme(m_i s_affectation(i)) - b||² par recherche locale, en évaluant à chaque itération, de façon vectorisée,
+    tous les déplacements d'un objet vers un emplacement libre et tous les échanges entre deux objets.
+
+    :param data: Dictionnaire ou ComponentTable des composants fixes
+    :param objets: Dictionnaire {objet: poids}
+    :param emplacements: Dictionnaire {emplacement: [x, y, z]}, au moins autant que d'objets
+    :param cible: Centre de gravité visé (x, y, z) ; une coordonnée None n'est pas contrainte
+    :param ponderation: Poids de chaque axe dans l'écart à la cible
+    :param max_iterations: Nombre maximal d'améliorations (par défaut 10 × nombre d'objets)
+    :return: LoadPlan (positions : coordonnées [x, y, z] de chaque objet, emplacements : nom de l'emplacement
+             retenu pour chaque objet, sensibilites : dcg/dpoids de chaque objet)
+    """
+    noms_objets = list(objets)
+    noms_emplacements = list(emplacements)
+    m = np.array([objets[o] for o in noms_objets], dtype=np.float64)
+    s = np.array([emplacements[e] for e in noms_emplacements], dtype=np.float64).reshape(-1, 3)
+    if len(s) < len(m):
+        raise ValueError("There must be at least as many slots as items.")
+    _, poids_fixes, positions_fixes = CenterOfGravityCalculator(data).to_arrays()
+    w = np.array([0.0 if c is None else p for c, p in zip(cible, ponderation)])
+    cible = np.array([0.0 if c is None else c for c in cible], dtype=np.float64)
+
+    poids_total = float(np.sum(poids_fixes) + m.sum())
+    b = poids_total * cible - np.asarray(poids_fixes) @ np.asarray(positions_fixes)
+
+    # Affectation initiale gloutonne : objets du plus lourd au plus léger, chacun sur l'emplacement libre
+    # qui réduit le plus l'écart courant
+    affectation = np.full(len(m), -1)
+    libres = np.ones(len(s), dtype=bool)
+    residu = -b
+    for i in np.argsort(-m):
+        candidats = residu + m[i] * s
+        couts = np.where(libres, (candidats ** 2) @ w, np.inf)
+        j = int(np.argmin(couts))
+        affectation[i], libres[j] = j, False
+        residu = candidats[j]
+
+    axes = np.flatnonzero(w)  # Seuls les axes contraints interviennent dans le coût
+    iteration = 0
+    converge = len(m) == 0
+    for iteration in range(1, (max_iterations or 10 * len(m)) + 1):
+        cout = (residu ** 2) @ w
+        s_actuels = s[affectation]
+        differences_masses = m[:, np.newaxis] - m[np.newaxis, :]
+        couts_deplacements = np.zeros((len(m), len(s)))
+        couts_echanges = np.zeros((len(m), len(m)))
+        for a in axes:
+            # Déplacement de l'objet i vers l'emplacement j : residu + m_i (s_j - s_affectation(i))
+            couts_deplacements += w[a] * (residu[a] + m[:, np.newaxis] * (s[np.newaxis, :, a] - s_actuels[:, a, np.newaxis])) ** 2
+            # Échange des objets i et k : residu + (m_i - m_k) (s_affectation(k) - s_affectation(i))
+            couts_echanges += w[a] * (residu[a] + differences_masses * (s_actuels[np.newaxis, :, a] - s_actuels[:, a, np.newaxis])) ** 2
+        couts_deplacements[:, ~libres] = np.inf
+
+        i_dep, j_dep = np.unravel_index(np.argmin(couts_deplacements), couts_deplacements.shape)
+        i_ech, k_ech = np.unravel_index(np.argmin(couts_echanges), couts_echanges.shape)
+        meilleur_deplacement, meilleur_echange = couts_deplacements[i_dep, j_dep], couts_echanges[i_ech, k_ech]
+        if min(meilleur_deplacement, meilleur_echange) >= cout * (1 - 1e-12):
+            converge = True  # Optimum local : aucun déplacement ni échange n'améliore l'écart
+            break
+        if meilleur_deplacement <= meilleur_echange:
+            residu = residu + m[i_dep] * (s[j_dep] - s_actuels[i_dep])
+            libres[affectation[i_dep]], libres[j_dep] = True, False
+            affectation[i_dep] = j_dep
+        else:
+            residu = residu + differences_masses[i_ech, k_ech] * (s_actuels[k_ech] - s_actuels[i_ech])
+            affectation[i_ech], affectation[k_ech] = affectation[k_ech], affectation[i_ech]
+
+    # residu = moment total - poids_total * cible
+    cg = cible + residu / poids_total
+    erreur = float(((cg - cible) ** 2) @ w)
+    return LoadPlan(
+        poids={o: float(m[i]) for i, o in enumerate(noms_objets)},
+        positions={o: s[affectation[i]].tolist() for i, o in enumerate(noms_objets)},
+        cg=tuple(cg.tolist()),
+        poids_total=poids_total,
+        erreur=erreur,
+        iterations=iteration,
+        sensibilites={o: ((s[affectation[i]] - cg) / poids_total).tolist() for i, o in enumerate(noms_objets)},
+        converge=converge,
+        emplacements={o: noms_emplacements[affectation[i]] for i, o in enumerate(noms_objets)},
+    )
@@ -1,9 +1,13 @@
 """
 Ce script principal permet de calculer le centre de gravité d'un avion et d'analyser les performances aérodynamiques des ailes.
 Il propose à l'utilisateur de choisir entre ces deux options et de saisir les données nécessaires de différentes manières.
+Lancé avec des arguments (python main.py cg|aero|sweep ...), il fonctionne sans interaction via le module cli.
 """
 
+import sys
+
 from data_import import DataImporter
+from data_cache import DataCache
 from center_of_gravity import CenterOfGravityCalculator
 from visualization import Visualization3D
 from aerodynamics import AerodynamicsAnalyzer
@@ -36,7 +40,7 @@ def main():
         elif data_choice == '2':
             # Utilisation de données depuis une base de données
             filepath = input("Entrez le chemin du fichier de la base de données: ")
-            data = DataImporter().data_component(filepath)
+            data = DataImporter(cache=DataCache()).data_component(filepath)
         elif data_choice == '3':
             # Utilisation de données par défaut
             data = DataImporter().default_components_data()
@@ -74,7 +78,7 @@ def main():
         elif data_choice == '2':
             # Utilisation de données depuis une base de données
             filepath = input("Entrez le chemin du fichier de la base de données: ")
-            profil_aile, corde, alpha_data, cl_data, cd_data = DataImporter().data_profil(filepath)
+            profil_aile, corde, alpha_data, cl_data, cd_data = DataImporter(cache=DataCache()).data_profil(filepath)
         elif data_choice == '3':
             # Utilisation de données par défaut
             profil_aile, corde, alpha_data, cl_data, cd_data = DataImporter().default_profil_data()
@@ -89,4 +93,8 @@ def main():
         aero_analyzer.plot_polar_cl_cd()
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Mode non interactif : sous-commandes cg, aero et sweep
+        from cli import main as cli_main
+        sys.exit(cli_main())
     main()
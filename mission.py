@@ -0,0 +1,143 @@
+"""
+Ce module contient la classe MissionCGTracker qui suit le centre de gravité au cours d'une mission :
+vidange des réservoirs, déplacement de la charge utile. Les séries temporelles de poids (et éventuellement
+de positions) sont traitées par blocs, de sorte que la mémoire reste bornée quelle que soit la durée de la
+mission ou la fréquence d'échantillonnage. Les sorties des limites avant/arrière du centre de gravité sont
+détectées, et le suivi peut s'arrêter au premier dépassement sans évaluer les échantillons suivants.
+"""
+
+import numpy as np
+
+from center_of_gravity import CenterOfGravityCalculator
+
+
+def fuel_burn_blocks(poids_initiaux, debits, dt, n_echantillons, taille_bloc=100_000, t0=0.0):
+    """
+    Génère par blocs les poids des composants lorsque certains se vident à débit donné (carburant).
+    Les poids sont obtenus par somme cumulée des consommations, reportée d'un bloc au suivant,
+    et ne descendent jamais sous zéro.
+
+    :param poids_initiaux: Poids des composants au début de la mission, forme (N,)
+    :param debits: Débit de consommation de chaque composant (poids par unité de temps), forme (N,) ou
+                   fonction (temps de forme (B,)) -> débits de forme (B, N)
+    :param dt: Pas de temps
+    :param n_echantillons: Nombre total d'échantillons
+    :param taille_bloc: Nombre d'échantillons par bloc
+    :param t0: Instant du premier échantillon
+    :return: Générateur de tuples (temps de forme (B,), poids de forme (B, N))
+    """
+    poids_courants = np.asarray(poids_initiaux, dtype=np.float64)
+    for debut in range(0, n_echantillons, taille_bloc):
+        temps = t0 + dt * np.arange(debut, min(debut + taille_bloc, n_echantillons))
+        debits_bloc = debits(temps) if callable(debits) else np.broadcast_to(debits, (len(temps), len(poids_courants)))
+        # Consommation cumulée depuis le début du bloc ; le premier échantillon du bloc n'a encore rien consommé
+        consommation = np.cumsum(debits_bloc * dt, axis=0) - debits_bloc * dt
+        poids = np.maximum(poids_courants - consommation, 0.0)
+        poids_courants = np.maximum(poids_courants - consommation[-1] - debits_bloc[-1] * dt, 0.0)
+        yield temps, poids
+
+
+class MissionResult:
+    def __init__(self):
+        """
+        Résultats du suivi du centre de gravité au cours d'une mission.
+        """
+        self.n_echantillons = 0  # Nombre d'échantillons évalués
+        self.premiere_violation = None  # Instant du premier dépassement des limites, ou None
+        self.n_violations = 0  # Nombre d'échantillons hors limites
+        self.cg_min = None  # Coordonnées minimales atteintes par le centre de gravité, par axe
+        self.cg_max = None  # Coordonnées maximales atteintes par le centre de gravité, par axe
+        self.temps = None  # Instants évalués, si la trajectoire est conservée
+        self.cg = None  # Trajectoire du centre de gravité de forme (T, 3), si elle est conservée
+        self.poids_total = None  # Poids total au cours du temps, si la trajectoire est conservée
+        self.arret_anticipe = False  # True si le suivi s'est arrêté au premier dépassement
+
+
+class MissionCGTracker:
+    def __init__(self, positions, limite_avant=None, limite_arriere=None, axe=0):
+        """
+        Initialisation du suivi.
+
+        :param positions: Positions des composants, forme (N, 3), ou dictionnaire / ComponentTable de référence
+        :param limite_avant: Limite avant du centre de gravité sur l'axe suivi (None : pas de limite)
+        :param limite_arriere: Limite arrière du centre de gravité sur l'axe suivi (None : pas de limite)
+        :param axe: Axe suivi (0 pour X, 1 pour Y, 2 pour Z)
+        """
+        if hasattr(positions, 'items'):
+            self.noms, _, positions = CenterOfGravityCalculator(positions).to_arrays()
+        else:
+            self.noms = None
+        self.positions = np.asarray(positions, dtype=np.float64)
+        self.limite_avant = -np.inf if limite_avant is None else limite_avant
+        self.limite_arriere = np.inf if limite_arriere is None else limite_arriere
+        self.axe = axe
+
+    def cg_block(self, poids, positions=None):
+        """
+        Calcule le centre de gravité de chaque échantillon d'un bloc.
+
+        :param poids: Poids des composants, forme (B, N)
+        :param positions: Positions variables dans le temps, forme (B, N, 3) (par défaut les positions fixes)
+        :return: Tuple (cg de forme (B, 3), poids_total de forme (B,)) ; ZeroDivisionError si un poids total est nul
+        """
+        poids = np.asarray(poids, dtype=np.float64)
+        poids_total = poids.sum(axis=1)
+        nuls = np.flatnonzero(poids_total == 0)
+        if len(nuls):
+            # Même comportement que CenterOfGravityCalculator plutôt qu'une ligne NaN silencieuse
+            raise ZeroDivisionError(f"Total weight is zero at sample {int(nuls[0])} of the block, "
+                                    f"the center of gravity is undefined.")
+        if positions is None:
+            moments = poids @ self.positions
+        else:
+            moments = np.einsum('bn,bnk->bk', poids, np.asarray(positions, dtype=np.float64))
+        return moments / poids_total[:, np.newaxis], poids_total
+
+    def track(self, blocs, arret_premiere_violation=False, conserver_trajectoire=False):
+        """
+        Suit le centre de gravité sur une suite de blocs d'échantillons.
+
+        :param blocs: Itérable de tuples (temps, poids) ou (temps, poids, positions), avec temps de forme (B,),
+                      poids de forme (B, N) et positions de forme (B, N, 3)
+        :param arret_premiere_violation: Arrêter le suivi au premier dépassement, sans consommer les blocs suivants
+        :param conserver_trajectoire: Conserver la trajectoire complète (mémoire proportionnelle à la durée)
+        :return: MissionResult
+        """
+        resultat = MissionResult()
+        trajectoire = {'temps': [], 'cg': [], 'poids_total': []}
+
+        for bloc in blocs:
+            temps, poids = bloc[0], bloc[1]
+            positions = bloc[2] if len(bloc) > 2 else None
+            cg, poids_total = self.cg_block(poids, positions)
+
+            coordonnee = cg[:, self.axe]
+            hors_limites = (coordonnee < self.limite_avant) | (coordonnee > self.limite_arriere)
+            n_evalues = len(temps)
+            if hors_limites.any():
+                premier = int(np.argmax(hors_limites))
+                if resultat.premiere_violation is None:
+                    resultat.premiere_violation = float(temps[premier])
+                if arret_premiere_violation:
+                    n_evalues = premier + 1
+                    cg, poids_total, temps = cg[:n_evalues], poids_total[:n_evalues], temps[:n_evalues]
+                    hors_limites = hors_limites[:n_evalues]
+                    resultat.arret_anticipe = True
+
+            resultat.n_echantillons += n_evalues
+            resultat.n_violations += int(hors_limites.sum())
+            bloc_min, bloc_max = cg.min(axis=0), cg.max(axis=0)
+            resultat.cg_min = bloc_min if resultat.cg_min is None else np.minimum(resultat.cg_min, bloc_min)
+            resultat.cg_max = bloc_max if resultat.cg_max is None else np.maximum(resultat.cg_max, bloc_max)
+            if conserver_trajectoire:
+                trajectoire['temps'].append(np.asarray(temps, dtype=np.float64))
+                trajectoire['cg'].append(cg)
+                trajectoire['poids_total'].append(poids_total)
+            if resultat.arret_anticipe:
+                break
+
+        if conserver_trajectoire and trajectoire['temps']:
+            resultat.temps = np.concatenate(trajectoire['temps'])
+            resultat.cg = np.concatenate(trajectoire['cg'])
+            resultat.poids_total = np.concatenate(trajectoire['poids_total'])
+        return resultat
@@ -0,0 +1,195 @@
+"""
+Ce module regroupe les fonctions de génération de la géométrie des profils NACA à 4 et 5 chiffres.
+Les calculs sont vectorisés : épaisseurs, cambrures et cordes peuvent être des tableaux de formes compatibles
+(règles de broadcasting numpy) et les coordonnées de toute une famille de profils sont obtenues en un seul appel.
+Les grilles le long de la corde et les polynômes de base associés sont mémorisés par grille.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+# Coefficients de la loi d'épaisseur NACA (bord de fuite fermé) pour sqrt(x), x, x², x³, x⁴
+COEFFICIENTS_EPAISSEUR = np.array([0.2969, -0.1260, -0.3516, 0.2843, -0.1036])
+
+# Profils NACA à 5 chiffres standard (sans réflexion) : position du maximum de cambrure p,
+# paramètres m et k1 de la ligne moyenne pour un coefficient de portance de conception de 0.3
+NACA5_P = np.array([0.05, 0.10, 0.15, 0.20, 0.25])
+NACA5_M = np.array([0.0580, 0.1260, 0.2025, 0.2900, 0.3910])
+NACA5_K1 = np.array([361.4, 51.640, 15.957, 6.643, 3.230])
+
+
+@lru_cache(maxsize=32)
+def grille(n_points=100, espacement='uniforme'):
+    """
+    Génère la répartition des points le long de la corde (valeurs de 0 à 1).
+
+    :param n_points: Nombre de points
+    :param espacement: 'uniforme' ou 'cosinus' (points resserrés au bord d'attaque et au bord de fuite)
+    :return: Tableau numpy en lecture seule de forme (n_points,)
+    """
+    if espacement == 'uniforme':
+        xc = np.linspace(0, 1, n_points)
+    elif espacement == 'cosinus':
+        xc = 0.5 * (1 - np.cos(np.linspace(0, np.pi, n_points)))
+    else:
+        raise ValueError("espacement must be 'uniforme' or 'cosinus'.")
+    xc.setflags(write=False)
+    return xc
+
+
+@lru_cache(maxsize=32)
+def base_polynomiale(n_points=100, espacement='uniforme'):
+    """
+    Calcule les polynômes de base sqrt(x), x, x², x³, x⁴ sur une grille, ainsi que la loi d'épaisseur unitaire.
+
+    :param n_points: Nombre de points
+    :param espacement: 'uniforme' ou 'cosinus'
+    :return: Tuple (base de forme (5, n_points), loi d'épaisseur de forme (n_points,)), en lecture seule
+    """
+    xc = grille(n_points, espacement)
+    base = np.vstack([np.sqrt(xc), xc, xc ** 2, xc ** 3, xc ** 4])
+    # yt = 5 t (0.2969 sqrt(x) - 0.1260 x - 0.3516 x² + 0.2843 x³ - 0.1036 x⁴)
+    epaisseur_unitaire = 5 * COEFFICIENTS_EPAISSEUR @ base
+    base.setflags(write=False)
+    epaisseur_unitaire.setflags(write=False)
+    return base, epaisseur_unitaire
+
+
+def _appliquer_cambrure(xc, yt, yc, dyc_dx, corde):
+    """
+    Place la loi d'épaisseur perpendiculairement à la ligne moyenne et met à l'échelle de la corde.
+
+    :return: Coordonnées x et y pour l'extrados et l'intrados
+    """
+    theta = np.arctan(dyc_dx)
+    sin_theta, cos_theta = np.sin(theta), np.cos(theta)
+    corde = corde[..., np.newaxis]
+    xup = (xc - yt * sin_theta) * corde
+    yup = (yc + yt * cos_theta) * corde
+    xdown = (xc + yt * sin_theta) * corde
+    ydown = (yc - yt * cos_theta) * corde
+    return xup, yup, xdown, ydown
+
+
+def coordonnees_symetriques(t, corde, n_points=100, espacement='uniforme'):
+    """
+    Calcule les coordonnées de profils NACA symétriques 00XX.
+
+    :param t: Épaisseur(s) relative(s), scalaire ou tableau
+    :param corde: Corde(s), scalaire ou tableau compatible avec t
+    :param n_points: Nombre de points le long de la corde
+    :param espacement: 'uniforme' ou 'cosinus'
+    :return: Coordonnées x et y pour l'extrados et l'intrados, de forme broadcast(t, corde) + (n_points,)
+    """
+    xc = grille(n_points, espacement)
+    _, epaisseur_unitaire = base_polynomiale(n_points, espacement)
+    t, corde = np.broadcast_arrays(np.asarray(t, dtype=np.float64), np.asarray(corde, dtype=np.float64))
+    yt = t[..., np.newaxis] * epaisseur_unitaire
+    x = xc * corde[..., np.newaxis]
+    y = yt * corde[..., np.newaxis]
+    return x, y, x.copy(), -y
+
+
+def coordonnees_naca4(m, p, t, corde, n_points=100, espacement='uniforme'):
+    """
+    Calcule les coordonnées de profils NACA à 4 chiffres (MPTT), cambrés ou non.
+
+    :param m: Cambrure maximale en fraction de corde (premier chiffre / 100)
+    :param p: Position de la cambrure maximale en fraction de corde (deuxième chiffre / 10)
+    :param t: Épaisseur relative (deux derniers chiffres / 100)
+    :param corde: Corde
+    :param n_points: Nombre de points le long de la corde
+    :param espacement: 'uniforme' ou 'cosinus'
+    :return: Coordonnées x et y pour l'extrados et l'intrados, de forme broadcast(m, p, t, corde) + (n_points,)
+    """
+    xc = grille(n_points, espacement)
+    base, epaisseur_unitaire = base_polynomiale(n_points, espacement)
+    x, x2 = base[1], base[2]
+    m, p, t, corde = (a[..., np.newaxis] for a in np.broadcast_arrays(*(np.asarray(v, dtype=np.float64)
+                                                                         for v in (m, p, t, corde))))
+
+    # Ligne moyenne : deux arcs de parabole raccordés en x = p (p = 0 pour un profil symétrique)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avant = x < p
+        p_avant = np.where(p > 0, p, 1.0)
+        p_arriere = np.where(p < 1, 1 - p, 1.0)
+        yc = np.where(avant, m / p_avant ** 2 * (2 * p * x - x2),
+                      m / p_arriere ** 2 * ((1 - 2 * p) + 2 * p * x - x2))
+        dyc_dx = np.where(avant, 2 * m / p_avant ** 2 * (p - x), 2 * m / p_arriere ** 2 * (p - x))
+    yt = t * epaisseur_unitaire
+    return _appliquer_cambrure(xc, yt, yc, dyc_dx, corde[..., 0])
+
+
+def coordonnees_naca5(cl_conception, p, t, corde, n_points=100, espacement='uniforme'):
+    """
+    Calcule les coordonnées de profils NACA à 5 chiffres standard (LPSTT avec S = 0).
+
+    :param cl_conception: Coefficient de portance de conception (premier chiffre × 0.15)
+    :param p: Position de la cambrure maximale en fraction de corde (deuxième chiffre / 20), entre 0.05 et 0.25
+    :param t: Épaisseur relative (deux derniers chiffres / 100)
+    :param corde: Corde
+    :param n_points: Nombre de points le long de la corde
+    :param espacement: 'uniforme' ou 'cosinus'
+    :return: Coordonnées x et y pour l'extrados et l'intrados, de forme broadcast(cl_conception, p, t, corde) + (n_points,)
+    """
+    xc = grille(n_points, espacement)
+    base, epaisseur_unitaire = base_polynomiale(n_points, espacement)
+    x, x2, x3 = base[1], base[2], base[3]
+    cl_conception, p, t, corde = (a[..., np.newaxis] for a in np.broadcast_arrays(
+        *(np.asarray(v, dtype=np.float64) for v in (cl_conception, p, t, corde))))
+    if np.any((p < NACA5_P[0] - 1e-9) | (p > NACA5_P[-1] + 1e-9)):
+        raise ValueError("p must be between 0.05 and 0.25 for standard 5-digit NACA sections.")
+
+    m = np.interp(p, NACA5_P, NACA5_M)
+    k1 = np.interp(p, NACA5_P, NACA5_K1) * cl_conception / 0.3
+    avant = x < m
+    yc = np.where(avant, k1 / 6 * (x3 - 3 * m * x2 + m ** 2 * (3 - m) * x), k1 * m ** 3 / 6 * (1 - x))
+    dyc_dx = np.where(avant, k1 / 6 * (3 * x2 - 6 * m * x + m ** 2 * (3 - m)), -k1 * m ** 3 / 6)
+    yt = t * epaisseur_unitaire
+    return _appliquer_cambrure(xc, yt, yc, dyc_dx, corde[..., 0])
+
+
+def parametres_naca(designation):
+    """
+    Décode une désignation NACA à 2, 4 ou 5 chiffres. Deux chiffres désignent un profil symétrique 00XX,
+    comme dans le reste du programme.
+
+    :param designation: Désignation, par exemple '12', '2412' ou '23012'
+    :return: Tuple (série, premier paramètre, p, t) : (4, m, p, t) ou (5, cl_conception, p, t)
+    """
+    chiffres = str(designation).strip().upper().removeprefix('NACA')
+    if not chiffres.isdigit():
+        raise ValueError(f"Invalid NACA designation: {designation!r}")
+    if len(chiffres) <= 2:
+        chiffres = chiffres.zfill(4)
+    if len(chiffres) == 4:
+        return 4, int(chiffres[0]) / 100, int(chiffres[1]) / 10, int(chiffres[2:]) / 100
+    if len(chiffres) == 5:
+        if chiffres[2] != '0':
+            raise ValueError("Reflexed 5-digit NACA sections are not supported.")
+        return 5, int(chiffres[0]) * 0.15, int(chiffres[1]) / 20, int(chiffres[3:]) / 100
+    raise ValueError(f"Invalid NACA designation: {designation!r}")
+
+
+def coordonnees_famille(designations, cordes, n_points=100, espacement='uniforme'):
+    """
+    Calcule les coordonnées d'une famille de profils NACA (4 et 5 chiffres mélangés) en un appel vectorisé par série.
+
+    :param designations: Séquence de désignations NACA
+    :param cordes: Corde de chaque profil (scalaire ou séquence de même longueur)
+    :param n_points: Nombre de points le long de la corde
+    :param espacement: 'uniforme' ou 'cosinus'
+    :return: Coordonnées x et y pour l'extrados et l'intrados, chacune de forme (len(designations), n_points)
+    """
+    parametres = np.array([parametres_naca(d) for d in designations], dtype=np.float64).reshape(-1, 4)
+    cordes = np.broadcast_to(np.asarray(cordes, dtype=np.float64), (len(parametres),))
+    resultats = tuple(np.empty((len(parametres), n_points)) for _ in range(4))
+
+    for serie, fonction in ((4, coordonnees_naca4), (5, coordonnees_naca5)):
+        masque = parametres[:, 0] == serie
+        if masque.any():
+            a, p, t = parametres[masque, 1:].T
+            for resultat, valeurs in zip(resultats, fonction(a, p, t, cordes[masque], n_points, espacement)):
+                resultat[masque] = valeurs
+    return resultats
@@ -0,0 +1,192 @@
+"""
+Ce module relie le centre de gravité et la polaire de l'aile : pour une configuration de masse donnée, il calcule
+l'équilibre (trim) en vol rectiligne horizontal sur une grille de vitesses et d'altitudes, en un seul passage
+vectorisé.
+
+Modèle aile + empennage horizontal, positions selon X croissant vers l'arrière :
+- atmosphère standard ISA (troposphère et basse stratosphère, jusqu'à 20 km) ;
+- équilibre des forces L_aile + L_empennage = W et des moments autour du centre de gravité
+  L_aile (x_cg - x_aile) + L_empennage (x_cg - x_empennage) + M_0 = 0, avec M_0 = q S c C_m0 ;
+- incidence de l'aile déduite de la polaire (branche avant décrochage), traînée de l'aile lue sur la polaire,
+  traînée induite de l'empennage et traînée parasite supplémentaire rapportée à la surface de l'aile ;
+- marge statique à partir du point neutre manche bloqué.
+"""
+
+import numpy as np
+
+from center_of_gravity import CenterOfGravityCalculator
+
+G = 9.80665  # Accélération de la pesanteur (m/s²)
+R_AIR = 287.05287  # Constante spécifique de l'air sec (J/(kg·K))
+GAMMA = 1.4  # Rapport des capacités thermiques de l'air
+
+
+def atmosphere_isa(altitude):
+    """
+    Atmosphère standard ISA : troposphère (gradient -6,5 K/km) jusqu'à 11 km, puis isotherme jusqu'à 20 km.
+
+    :param altitude: Altitude(s) géopotentielle(s) en mètres, scalaire ou tableau
+    :return: Tuple (température (K), pression (Pa), masse volumique (kg/m³), vitesse du son (m/s))
+    """
+    altitude = np.asarray(altitude, dtype=np.float64)
+    if np.any((altitude < -610) | (altitude > 20000)):
+        raise ValueError("ISA model is valid between -610 m and 20000 m.")
+    t0, p0, gradient, h11 = 288.15, 101325.0, -0.0065, 11000.0
+    t11 = t0 + gradient * h11
+    p11 = p0 * (t11 / t0) ** (-G / (gradient * R_AIR))
+    troposphere = altitude <= h11
+    temperature = np.where(troposphere, t0 + gradient * altitude, t11)
+    pression = np.where(troposphere, p0 * (temperature / t0) ** (-G / (gradient * R_AIR)),
+                        p11 * np.exp(-G * (altitude - h11) / (R_AIR * t11)))
+    masse_volumique = pression / (R_AIR * temperature)
+    return temperature, pression, masse_volumique, np.sqrt(GAMMA * R_AIR * temperature)
+
+
+class PerformanceTable:
+    def __init__(self, **colonnes):
+        """
+        Table des performances : chaque grandeur est un tableau de forme (altitudes, vitesses), ou diffusable
+        vers cette forme lorsque les poids et centres de gravité sont eux aussi balayés.
+
+        Grandeurs : altitude, vitesse, mach, pression_dynamique, cl_requis (avion), cl_aile, alpha (deg, NaN au-delà
+        du décrochage), decroche (True si l'équilibre est impossible sur la polaire : alpha, incidence_empennage,
+        cd, trainee, finesse et puissance y valent NaN), cl_empennage, incidence_empennage (deg), cd, trainee (N),
+        finesse, puissance (W), ainsi que les scalaires marge_statique, point_neutre et cg_x.
+        """
+        self.__dict__.update(colonnes)
+
+    def to_records(self):
+        """
+        Met la table à plat, une ligne par point (altitude, vitesse), pour l'export JSON ou CSV.
+
+        :return: Liste de dictionnaires
+        """
+        grandeurs = {nom: np.asarray(valeur) for nom, valeur in self.__dict__.items()}
+        forme = np.broadcast_shapes(*(valeur.shape for valeur in grandeurs.values()))
+        colonnes = {nom: np.broadcast_to(valeur, forme).ravel().tolist() for nom, valeur in grandeurs.items()}
+        return [dict(zip(colonnes, ligne)) for ligne in zip(*colonnes.values())]
+
+
+class PerformanceSolver:
+    def __init__(self, data, polaire, surface_aile, corde_moyenne, surface_empennage, x_foyer_aile=None,
+                 x_foyer_empennage=None, cm0_aile=0.0, allongement_empennage=4.0, efficacite_empennage=0.9,
+                 gradient_deflexion=0.4, oswald_empennage=0.8, cd0_supplementaire=0.0, g=G):
+        """
+        Initialisation du modèle avion.
+
+        :param data: Dictionnaire ou ComponentTable des composants ; les poids sont des masses en kg (g=1 si ce
+                     sont déjà des forces en N)
+        :param polaire: PolarInterpolator ou AerodynamicsAnalyzer de l'aile
+        :param surface_aile: Surface de référence de l'aile (m²)
+        :param corde_moyenne: Corde aérodynamique moyenne (m)
+        :param surface_empennage: Surface de l'empennage horizontal (m²)
+        :param x_foyer_aile: Position X du foyer de l'aile (par défaut la position X du composant 'ailes')
+        :param x_foyer_empennage: Position X du foyer de l'empennage (par défaut celle du composant 'empennage')
+        :param cm0_aile: Coefficient de moment de l'aile autour de son foyer (nul pour un profil symétrique)
+        :param allongement_empennage: Allongement de l'empennage horizontal
+        :param efficacite_empennage: Rapport des pressions dynamiques empennage / aile
+        :param gradient_deflexion: Gradient de déflexion dε/dα de l'écoulement au niveau de l'empennage
+        :param oswald_empennage: Coefficient d'Oswald de l'empennage (traînée induite)
+        :param cd0_supplementaire: Traînée parasite du fuselage et des autres éléments, rapportée à surface_aile
+        :param g: Accélération de la pesanteur
+        """
+        self.polaire = polaire.interpolateur() if hasattr(polaire, 'interpolateur') else polaire
+        calculateur = CenterOfGravityCalculator(data)
+        noms, poids, positions = calculateur.to_arrays()
+        self.masse = float(np.sum(poids))
+        self.cg_x = float(calculateur.calculate()[0])
+        self.g = g
+
+        index = {nom: i for i, nom in enumerate(noms)}
+        for nom, valeur in (('ailes', x_foyer_aile), ('empennage', x_foyer_empennage)):
+            if valeur is None and nom not in index:
+                raise ValueError(f"Give the aerodynamic centre explicitly: no {nom!r} component.")
+        self.x_aile = float(positions[index['ailes']][0] if x_foyer_aile is None else x_foyer_aile)
+        self.x_empennage = float(positions[index['empennage']][0] if x_foyer_empennage is None else x_foyer_empennage)
+        if self.x_empennage <= self.x_aile:
+            raise ValueError("The tail must be aft of the wing.")
+
+        self.surface_aile = surface_aile
+        self.corde_moyenne = corde_moyenne
+        self.surface_empennage = surface_empennage
+        self.cm0_aile = cm0_aile
+        self.efficacite_empennage = efficacite_empennage
+        self.oswald_empennage = oswald_empennage
+        self.allongement_empennage = allongement_empennage
+        self.cd0_supplementaire = cd0_supplementaire
+
+        # Pentes de portance (par radian) : polaire de l'aile, formule d'aile finie pour l'empennage
+        self.pente_aile = self.polaire.pente_portance * 180 / np.pi
+        self.pente_empennage = 2 * np.pi * allongement_empennage / (2 + allongement_empennage)
+        self.gradient_deflexion = gradient_deflexion
+        # Point neutre manche bloqué : barycentre des foyers pondéré par les gradients de portance
+        contribution_empennage = (efficacite_empennage * surface_empennage / surface_aile * self.pente_empennage
+                                  * (1 - gradient_deflexion))
+        self.point_neutre = ((self.pente_aile * self.x_aile + contribution_empennage * self.x_empennage)
+                             / (self.pente_aile + contribution_empennage))
+
+    def static_margin(self, cg_x=None):
+        """
+        Marge statique en fraction de corde moyenne (positive : avion stable).
+
+        :param cg_x: Position(s) X du centre de gravité (par défaut celle de la configuration)
+        :return: Marge statique
+        """
+        cg_x = self.cg_x if cg_x is None else np.asarray(cg_x, dtype=np.float64)
+        return (self.point_neutre - cg_x) / self.corde_moyenne
+
+    def solve(self, vitesses, altitudes, masse=None, cg_x=None):
+        """
+        Calcule l'équilibre et les performances sur la grille vitesses × altitudes.
+
+        :param vitesses: Vitesses vraies (m/s), forme (V,)
+        :param altitudes: Altitudes (m), forme (H,)
+        :param masse: Masse(s) à utiliser à la place de celle de la configuration, diffusable vers (H, V)
+        :param cg_x: Position(s) X du centre de gravité à utiliser, diffusable vers (H, V)
+        :return: PerformanceTable de forme (H, V)
+        """
+        vitesses = np.asarray(vitesses, dtype=np.float64)[np.newaxis, :]
+        altitudes = np.asarray(altitudes, dtype=np.float64)[:, np.newaxis]
+        masse = self.masse if masse is None else np.asarray(masse, dtype=np.float64)
+        cg_x = self.cg_x if cg_x is None else np.asarray(cg_x, dtype=np.float64)
+        _, _, masse_volumique, vitesse_son = atmosphere_isa(altitudes)
+
+        poids = masse * self.g
+        q = 0.5 * masse_volumique * vitesses ** 2
+        q_s = q * self.surface_aile
+        # Équilibre en forces et en moments autour du centre de gravité (système 2×2 résolu explicitement)
+        moment_aile = q_s * self.corde_moyenne * self.cm0_aile
+        portance_empennage = (moment_aile + poids * (cg_x - self.x_aile)) / (self.x_empennage - self.x_aile)
+        portance_aile = poids - portance_empennage
+
+        cl_aile = portance_aile / q_s
+        alpha = self.polaire.alpha(cl_aile)  # NaN au-delà de C_L max : vitesse inférieure à la vitesse de décrochage
+        q_s_empennage = q * self.efficacite_empennage * self.surface_empennage
+        cl_empennage = portance_empennage / q_s_empennage
+        # Calage de l'empennage nécessaire : α_empennage = α (1 - dε/dα) + calage
+        incidence_empennage = np.degrees(cl_empennage / self.pente_empennage) - alpha * (1 - self.gradient_deflexion)
+
+        cd_empennage = cl_empennage ** 2 / (np.pi * self.oswald_empennage * self.allongement_empennage)
+        cd = (self.polaire.cd(cl_aile) + self.cd0_supplementaire
+              + cd_empennage * q_s_empennage / q_s)
+        trainee = cd * q_s
+
+        return PerformanceTable(
+            altitude=altitudes,
+            vitesse=vitesses,
+            mach=vitesses / vitesse_son,
+            pression_dynamique=q,
+            cl_requis=poids / q_s,
+            cl_aile=cl_aile,
+            alpha=alpha,
+            decroche=np.isnan(alpha),
+            cl_empennage=cl_empennage,
+            incidence_empennage=incidence_empennage,
+            cd=cd,
+            trainee=trainee,
+            finesse=poids / trainee,
+            puissance=trainee * vitesses,
+            marge_statique=self.static_margin(cg_x),
+            point_neutre=self.point_neutre,
+            cg_x=cg_x,
+        )
@@ -0,0 +1,256 @@
+"""
+Ce module contient la classe PolarDatabase qui charge en une seule passe toutes les polaires d'un fichier CSV
+(plusieurs profils d'aile et plusieurs nombres de Reynolds) dans des tableaux numpy complétés par des NaN.
+
+Deux formats de fichier sont acceptés :
+- le format historique, une ligne par profil avec des listes sous forme de texte
+  (colonnes profil_aile, corde, alpha_data, cl_data, cd_data) ;
+- le format long, une ligne par point de polaire (colonnes profil_aile, reynolds, corde, alpha, cl, cd),
+  lu directement en colonnes numériques.
+
+Conversion du format historique vers le format long :
+    python polar_database.py convert aerodynamics_data.csv aerodynamics_long.csv
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from instrumentation import profiled
+
+# Types explicites des colonnes du format long
+LONG_DTYPES = {
+    'profil_aile': np.int64,
+    'reynolds': np.float64,
+    'corde': np.float64,
+    'alpha': np.float64,
+    'cl': np.float64,
+    'cd': np.float64,
+}
+
+
+@profiled
+def parse_list_column(colonne):
+    """
+    Convertit une colonne de listes écrites sous forme de texte ("[1, 2, 3]") en un tableau plat,
+    sans évaluer chaque cellule avec ast.literal_eval.
+
+    :param colonne: Série pandas de chaînes de caractères
+    :return: Tuple (valeurs, longueurs) : valeurs concaténées de toutes les lignes et nombre de valeurs par ligne
+    """
+    contenu = colonne.astype(str).str.strip().str.strip('[]')
+    longueurs = np.where(contenu.str.strip() == '', 0, contenu.str.count(',') + 1).astype(np.int64)
+    texte = ','.join(c for c in contenu if c.strip())
+    valeurs = np.array(texte.split(','), dtype=np.float64) if texte else np.empty(0)
+    return valeurs, longueurs
+
+
+def _reynolds_key(reynolds):
+    """
+    Normalise un nombre de Reynolds pour l'index (None lorsqu'il n'est pas renseigné).
+    """
+    return None if np.isnan(reynolds) else float(reynolds)
+
+
+class PolarDatabase:
+    def __init__(self, profil_aile, reynolds, corde, alpha, cl, cd, longueurs):
+        """
+        Initialisation de la base à partir de tableaux déjà alignés.
+
+        :param profil_aile: Profils d'aile, forme (N,)
+        :param reynolds: Nombres de Reynolds, forme (N,), NaN si non renseigné
+        :param corde: Cordes, forme (N,)
+        :param alpha: Angles d'attaque complétés par des NaN, forme (N, L)
+        :param cl: Coefficients de portance complétés par des NaN, forme (N, L)
+        :param cd: Coefficients de traînée complétés par des NaN, forme (N, L)
+        :param longueurs: Nombre de points de chaque polaire, forme (N,)
+        """
+        self.profil_aile = np.asarray(profil_aile, dtype=np.int64)
+        self.reynolds = np.asarray(reynolds, dtype=np.float64)
+        self.corde = np.asarray(corde, dtype=np.float64)
+        self.alpha = np.asarray(alpha, dtype=np.float64)
+        self.cl = np.asarray(cl, dtype=np.float64)
+        self.cd = np.asarray(cd, dtype=np.float64)
+        self.longueurs = np.asarray(longueurs, dtype=np.int64)
+
+        # Index (profil, Reynolds) -> ligne, et profil -> première ligne de ce profil
+        cles = zip(self.profil_aile.tolist(), map(_reynolds_key, self.reynolds.tolist()))
+        self._index = {cle: i for i, cle in enumerate(cles)}
+        self._par_profil = {}
+        for i, profil in enumerate(self.profil_aile.tolist()):
+            self._par_profil.setdefault(profil, i)
+
+    def __len__(self):
+        return len(self.profil_aile)
+
+    @staticmethod
+    def _padded(groupes, positions, valeurs, n_lignes, longueur_max):
+        """
+        Range des valeurs plates dans un tableau (n_lignes, longueur_max) complété par des NaN.
+        """
+        tableau = np.full((n_lignes, longueur_max), np.nan)
+        tableau[groupes, positions] = valeurs
+        return tableau
+
+    @classmethod
+    def from_long_dataframe(cls, df):
+        """
+        Construit la base à partir d'un DataFrame au format long (une ligne par point de polaire).
+
+        :param df: DataFrame avec les colonnes profil_aile, reynolds (optionnelle), corde, alpha, cl, cd
+        :return: Instance de PolarDatabase
+        """
+        if 'reynolds' not in df.columns:
+            df = df.assign(reynolds=np.nan)
+        groupby = df.groupby(['profil_aile', 'reynolds'], sort=False, dropna=False)
+        groupes = groupby.ngroup().to_numpy()
+        positions = groupby.cumcount().to_numpy()
+        n_lignes = int(groupes.max()) + 1 if len(groupes) else 0
+        longueurs = np.bincount(groupes, minlength=n_lignes)
+        longueur_max = int(longueurs.max()) if n_lignes else 0
+
+        # Première ligne de chaque groupe pour les grandeurs propres à la polaire
+        _, premieres = np.unique(groupes, return_index=True)
+
+        return cls(
+            df['profil_aile'].to_numpy()[premieres],
+            df['reynolds'].to_numpy()[premieres],
+            df['corde'].to_numpy()[premieres],
+            *(cls._padded(groupes, positions, df[col].to_numpy(), n_lignes, longueur_max)
+              for col in ('alpha', 'cl', 'cd')),
+            longueurs,
+        )
+
+    @classmethod
+    def from_stringified_dataframe(cls, df):
+        """
+        Construit la base à partir d'un DataFrame au format historique (listes sous forme de texte).
+
+        :param df: DataFrame avec les colonnes profil_aile, corde, alpha_data, cl_data, cd_data et reynolds (optionnelle)
+        :return: Instance de PolarDatabase
+        """
+        colonnes = {}
+        longueurs = None
+        for col in ('alpha_data', 'cl_data', 'cd_data'):
+            valeurs, longueurs_col = parse_list_column(df[col])
+            if longueurs is not None and not np.array_equal(longueurs, longueurs_col):
+                raise ValueError("alpha_data, cl_data and cd_data must have the same length on each row.")
+            longueurs = longueurs_col
+            colonnes[col] = valeurs
+
+        n_lignes = len(df)
+        groupes = np.repeat(np.arange(n_lignes), longueurs)
+        debuts = np.cumsum(longueurs) - longueurs
+        positions = np.arange(len(groupes)) - np.repeat(debuts, longueurs)
+        longueur_max = int(longueurs.max()) if n_lignes else 0
+        reynolds = df['reynolds'].to_numpy() if 'reynolds' in df.columns else np.full(n_lignes, np.nan)
+
+        return cls(
+            df['profil_aile'].to_numpy(),
+            reynolds,
+            df['corde'].to_numpy(),
+            *(cls._padded(groupes, positions, colonnes[col], n_lignes, longueur_max)
+              for col in ('alpha_data', 'cl_data', 'cd_data')),
+            longueurs,
+        )
+
+    @classmethod
+    def from_csv(cls, filepath):
+        """
+        Charge un fichier de polaires en détectant son format.
+
+        :param filepath: Chemin du fichier CSV
+        :return: Instance de PolarDatabase
+        """
+        colonnes = pd.read_csv(filepath, nrows=0).columns
+        if 'alpha_data' in colonnes:
+            return cls.from_stringified_dataframe(pd.read_csv(filepath))
+        dtypes = {col: dtype for col, dtype in LONG_DTYPES.items() if col in colonnes}
+        return cls.from_long_dataframe(pd.read_csv(filepath, dtype=dtypes))
+
+    def to_arrays(self):
+        """
+        Retourne les tableaux de la base, par exemple pour les enregistrer dans un DataCache.
+
+        :return: Dictionnaire {nom: tableau}
+        """
+        return {'profil_aile': self.profil_aile, 'reynolds': self.reynolds, 'corde': self.corde,
+                'alpha': self.alpha, 'cl': self.cl, 'cd': self.cd, 'longueurs': self.longueurs}
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        Reconstruit la base à partir des tableaux produits par to_arrays.
+
+        :param arrays: Dictionnaire {nom: tableau}
+        :return: Instance de PolarDatabase
+        """
+        return cls(**arrays)
+
+    def to_long_dataframe(self):
+        """
+        Convertit la base au format long (une ligne par point de polaire).
+
+        :return: DataFrame avec les colonnes profil_aile, reynolds, corde, alpha, cl, cd
+        """
+        masque = np.arange(self.alpha.shape[1]) < self.longueurs[:, np.newaxis]
+        lignes = np.repeat(np.arange(len(self)), self.longueurs)
+        return pd.DataFrame({
+            'profil_aile': self.profil_aile[lignes],
+            'reynolds': self.reynolds[lignes],
+            'corde': self.corde[lignes],
+            'alpha': self.alpha[masque],
+            'cl': self.cl[masque],
+            'cd': self.cd[masque],
+        })
+
+    def row_index(self, profil_aile, reynolds=None):
+        """
+        Retourne en O(1) la ligne d'une polaire.
+
+        :param profil_aile: Profil d'aile
+        :param reynolds: Nombre de Reynolds ; si None, la première polaire de ce profil est retournée
+        :return: Indice de la ligne
+        """
+        if reynolds is None:
+            return self._par_profil[int(profil_aile)]
+        return self._index[(int(profil_aile), float(reynolds))]
+
+    def row(self, i):
+        """
+        Retourne une polaire au format utilisé par DataImporter.data_profil.
+
+        :param i: Indice de la ligne
+        :return: Tuple contenant le profil d'aile, la corde, les angles d'attaque, les coefficients de portance et les coefficients de traînée
+        """
+        n = self.longueurs[i]
+        return (int(self.profil_aile[i]), float(self.corde[i]), self.alpha[i, :n].tolist(),
+                self.cl[i, :n].tolist(), self.cd[i, :n].tolist())
+
+    def get(self, profil_aile, reynolds=None):
+        """
+        Retourne la polaire d'un profil d'aile, pour un nombre de Reynolds donné.
+
+        :param profil_aile: Profil d'aile
+        :param reynolds: Nombre de Reynolds (optionnel)
+        :return: Tuple contenant le profil d'aile, la corde, les angles d'attaque, les coefficients de portance et les coefficients de traînée
+        """
+        return self.row(self.row_index(profil_aile, reynolds))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Outils pour les bases de polaires.")
+    sous_commandes = parser.add_subparsers(dest='commande', required=True)
+    convert = sous_commandes.add_parser('convert', help="Convertir un fichier de polaires au format long")
+    convert.add_argument('source', help="Fichier CSV source (format historique ou long)")
+    convert.add_argument('destination', help="Fichier CSV au format long à créer")
+    args = parser.parse_args()
+
+    base = PolarDatabase.from_csv(args.source)
+    base.to_long_dataframe().to_csv(args.destination, index=False)
+    print(f"{len(base)} polaire(s) converties dans {args.destination}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Ce module contient la classe PolarInterpolator qui permet d'interroger une polaire aérodynamique en des points
+quelconques : C_L(α), C_D(C_L), C_D(α) et finesse L/D. Les tables d'interpolation (linéaires ou splines
+monotones de type PCHIP) sont construites une seule fois par polaire, puis chaque requête évalue un tableau
+entier de points en un seul appel vectorisé. Les grandeurs dérivées (C_L max, pente de portance, finesse
+maximale, C_L de traînée minimale) sont calculées à la construction.
+"""
+
+import numpy as np
+
+# Nombre de points de la grille fine utilisée pour rechercher la finesse maximale et la traînée minimale
+N_POINTS_RECHERCHE = 2001
+
+
+def _pentes_pchip(x, y):
+    """
+    Calcule les dérivées aux nœuds d'une spline cubique d'Hermite monotone (méthode de Fritsch-Carlson),
+    qui ne crée pas d'oscillation entre les points de la polaire.
+
+    :param x: Abscisses strictement croissantes
+    :param y: Ordonnées
+    :return: Dérivées aux nœuds, de même forme que x
+    """
+    h = np.diff(x)
+    delta = np.diff(y) / h
+    if len(x) == 2:
+        return np.full(2, delta[0])
+
+    d = np.zeros_like(y)
+    # Nœuds intérieurs : moyenne harmonique pondérée, nulle en cas de changement de sens de variation
+    w1 = 2 * h[1:] + h[:-1]
+    w2 = h[1:] + 2 * h[:-1]
+    meme_signe = delta[:-1] * delta[1:] > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        moyenne = (w1 + w2) / (w1 / delta[:-1] + w2 / delta[1:])
+    d[1:-1] = np.where(meme_signe, moyenne, 0.0)
+
+    # Extrémités : formule à trois points non centrée, corrigée pour préserver la monotonie
+    for extremite, (h0, h1, d0, d1) in ((0, (h[0], h[1], delta[0], delta[1])),
+                                        (-1, (h[-1], h[-2], delta[-1], delta[-2]))):
+        pente = ((2 * h0 + h1) * d0 - h0 * d1) / (h0 + h1)
+        if np.sign(pente) != np.sign(d0):
+            pente = 0.0
+        elif np.sign(d0) != np.sign(d1) and abs(pente) > abs(3 * d0):
+            pente = 3 * d0
+        d[extremite] = pente
+    return d
+
+
+class _Table:
+    def __init__(self, x, y, methode):
+        """
+        Table d'interpolation 1D sur des abscisses strictement croissantes.
+
+        :param x: Abscisses strictement croissantes
+        :param y: Ordonnées
+        :param methode: 'pchip' (spline monotone) ou 'lineaire'
+        """
+        if len(x) < 2:
+            raise ValueError("At least two points are required to interpolate a polar.")
+        if np.any(np.diff(x) <= 0):
+            raise ValueError("Interpolation abscissae must be strictly increasing.")
+        if methode not in ('pchip', 'lineaire'):
+            raise ValueError("methode must be 'pchip' or 'lineaire'.")
+        self.x = x
+        self.y = y
+        self.methode = methode
+        self.d = _pentes_pchip(x, y) if methode == 'pchip' else None
+
+    def __call__(self, xq):
+        """
+        Évalue la table en un ou plusieurs points ; NaN en dehors du domaine de la table.
+        """
+        xq = np.asarray(xq, dtype=np.float64)
+        if self.methode == 'lineaire':
+            resultat = np.interp(xq, self.x, self.y)
+        else:
+            i = np.clip(np.searchsorted(self.x, xq, side='right') - 1, 0, len(self.x) - 2)
+            h = self.x[i + 1] - self.x[i]
+            t = (xq - self.x[i]) / h
+            t2, t3 = t * t, t * t * t
+            # Polynômes de base d'Hermite
+            resultat = ((2 * t3 - 3 * t2 + 1) * self.y[i] + (t3 - 2 * t2 + t) * h * self.d[i]
+                        + (-2 * t3 + 3 * t2) * self.y[i + 1] + (t3 - t2) * h * self.d[i + 1])
+        return np.where((xq >= self.x[0]) & (xq <= self.x[-1]), resultat, np.nan)
+
+
+class PolarInterpolator:
+    def __init__(self, alpha_data, cl_data, cd_data, methode='pchip'):
+        """
+        Construit les tables d'interpolation d'une polaire et calcule ses grandeurs dérivées.
+
+        :param alpha_data: Liste des angles d'attaque (deg) ; les valeurs NaN (polaires complétées) sont ignorées
+        :param cl_data: Liste des coefficients de portance correspondants à alpha_data
+        :param cd_data: Liste des coefficients de traînée correspondants à alpha_data
+        :param methode: 'pchip' (spline monotone) ou 'lineaire'
+        """
+        alpha = np.asarray(alpha_data, dtype=np.float64)
+        cl = np.asarray(cl_data, dtype=np.float64)
+        cd = np.asarray(cd_data, dtype=np.float64)
+        if not len(alpha) == len(cl) == len(cd):
+            raise ValueError("alpha_data, cl_data and cd_data must have the same length.")
+        valides = ~(np.isnan(alpha) | np.isnan(cl) | np.isnan(cd))
+        ordre = np.argsort(alpha[valides], kind='stable')
+        alpha, cl, cd = alpha[valides][ordre], cl[valides][ordre], cd[valides][ordre]
+
+        self.methode = methode
+        self._cl_alpha = _Table(alpha, cl, methode)
+        self._cd_alpha = _Table(alpha, cd, methode)
+
+        # Branche avant décrochage : du C_L min (décrochage aux incidences négatives des polaires complètes)
+        # jusqu'au C_L max, où C_L est strictement croissant ; C_L(α) reste défini sur toute la table
+        i_max = int(np.argmax(cl))
+        i_min = i_max - int(np.argmin(cl[i_max::-1]))  # Dernier minimum avant C_L max
+        if not (np.diff(cl[i_min:i_max + 1]) > 0).all():
+            raise ValueError("cl_data must increase strictly with alpha from CLmin to CLmax.")
+        pre_decrochage = slice(i_min, i_max + 1)
+        self._alpha_cl = _Table(cl[pre_decrochage], alpha[pre_decrochage], methode)
+        self._cd_cl = _Table(cl[pre_decrochage], cd[pre_decrochage], methode)
+
+        # Grandeurs dérivées
+        self.cl_max = float(cl[i_max])
+        self.alpha_cl_max = float(alpha[i_max])
+        # Pente de portance (par degré) : moindres carrés sur la branche avant décrochage
+        self.pente_portance = (float(np.polyfit(alpha[pre_decrochage], cl[pre_decrochage], 1)[0]) if i_max > i_min
+                               else np.nan)
+        self.alpha_portance_nulle = float(self.alpha(0.0)) if cl[i_min] <= 0 <= self.cl_max else np.nan
+
+        alpha_fin = np.linspace(alpha[0], alpha[-1], N_POINTS_RECHERCHE)
+        cl_fin, cd_fin = self.cl(alpha_fin), self.cd_alpha(alpha_fin)
+        finesse = cl_fin / cd_fin
+        i_finesse = int(np.nanargmax(finesse))
+        self.finesse_max = float(finesse[i_finesse])
+        self.alpha_finesse_max = float(alpha_fin[i_finesse])
+        self.cl_finesse_max = float(cl_fin[i_finesse])
+        i_cd_min = int(np.nanargmin(cd_fin))
+        self.cd_min = float(cd_fin[i_cd_min])
+        self.cl_trainee_min = float(cl_fin[i_cd_min])
+
+    def cl(self, alpha):
+        """
+        Coefficient de portance pour un ou plusieurs angles d'attaque.
+
+        :param alpha: Angle(s) d'attaque (deg)
+        :return: C_L, NaN en dehors de la polaire
+        """
+        return self._cl_alpha(alpha)
+
+    def cd_alpha(self, alpha):
+        """
+        Coefficient de traînée pour un ou plusieurs angles d'attaque.
+
+        :param alpha: Angle(s) d'attaque (deg)
+        :return: C_D, NaN en dehors de la polaire
+        """
+        return self._cd_alpha(alpha)
+
+    def cd(self, cl):
+        """
+        Coefficient de traînée pour un ou plusieurs coefficients de portance (branche avant décrochage).
+
+        :param cl: Coefficient(s) de portance
+        :return: C_D, NaN en dehors de la polaire
+        """
+        return self._cd_cl(cl)
+
+    def alpha(self, cl):
+        """
+        Angle d'attaque donnant un ou plusieurs coefficients de portance (branche avant décrochage).
+
+        :param cl: Coefficient(s) de portance
+        :return: Angle(s) d'attaque (deg), NaN en dehors de [C_L min, C_L max]
+        """
+        return self._alpha_cl(cl)
+
+    def finesse(self, alpha):
+        """
+        Finesse L/D pour un ou plusieurs angles d'attaque.
+
+        :param alpha: Angle(s) d'attaque (deg)
+        :return: C_L / C_D
+        """
+        return self.cl(alpha) / self.cd_alpha(alpha)
+
+    def derived(self):
+        """
+        Retourne les grandeurs dérivées de la polaire.
+
+        :return: Dictionnaire des grandeurs dérivées
+        """
+        return {
+            'cl_max': self.cl_max,
+            'alpha_cl_max': self.alpha_cl_max,
+            'pente_portance': self.pente_portance,
+            'alpha_portance_nulle': self.alpha_portance_nulle,
+            'finesse_max': self.finesse_max,
+            'alpha_finesse_max': self.alpha_finesse_max,
+            'cl_finesse_max': self.cl_finesse_max,
+            'cd_min': self.cd_min,
+            'cl_trainee_min': self.cl_trainee_min,
+        }
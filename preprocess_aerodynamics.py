@@ -3,8 +3,10 @@ Permet de nettoyer une base de données existante afin de pouvoir l'utiliser dan
 S'applique pour les données relatives aux caractéristiques des ailes.
 """
 
+import numpy as np
 import pandas as pd
-import ast
+
+from polar_database import parse_list_column
 
 # On définit les paramètres pour la lecture du fichier CSV
 # delimiter: délimiteur utilisé dans le fichier CSV
@@ -30,10 +32,11 @@ for col in df.columns:
 print('\n')
 
 # Conversion des colonnes de type liste (alpha_data, cl_data, cd_data) de string à liste
-# ast.literal_eval permet de convertir une chaîne de caractères en liste Python
+# parse_list_column analyse toute la colonne en une seule passe, sans évaluer chaque cellule
 print('Conversion des colonnes de type liste\n')
 for col in ['alpha_data', 'cl_data', 'cd_data']:
-    df[col] = df[col].apply(lambda x: ast.literal_eval(x))
+    valeurs, longueurs = parse_list_column(df[col])
+    df[col] = [ligne.tolist() for ligne in np.split(valeurs, np.cumsum(longueurs)[:-1])]
 
 # Affichage des types de données de chaque colonne après la conversion
 print('dtype des différentes colonnes après traitement\n')
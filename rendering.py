@@ -0,0 +1,283 @@
+"""
+Ce module permet de générer en série, sans affichage, les graphiques du programme : visualisation 3D des
+composants et du centre de gravité, profil d'aile et polaires C_L vs α et C_L vs C_D.
+
+Contrairement à Visualization3D et AerodynamicsAnalyzer, qui créent une nouvelle figure pyplot et bloquent sur
+plt.show(), les classes de rendu utilisent directement le moteur Agg (sans pyplot) et créent une seule fois
+leur figure et leurs tracés : chaque nouvelle configuration ne fait que mettre à jour les données des tracés.
+Les fichiers PNG/SVG peuvent être écrits par plusieurs processus, et un lot complet peut être réuni dans un
+seul PDF de plusieurs pages.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from naca_geometry import coordonnees_symetriques
+
+
+class CGRenderer:
+    def __init__(self, figsize=(6.4, 4.8), dpi=100):
+        """
+        Crée la figure 3D réutilisée pour toutes les configurations.
+
+        :param figsize: Taille de la figure en pouces
+        :param dpi: Résolution des images matricielles
+        """
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot(111, projection='3d')
+        self.ax.set_xlabel('X')
+        self.ax.set_ylabel('Y')
+        self.ax.set_zlabel('Z')
+        # Nom du composant -> marqueur (Line3D), créé à la première apparition et retiré à la disparition
+        self._composants = {}
+        # Marqueurs sans trait : même taille par défaut que les nuages de points de Visualization3D
+        self._cg, = self.ax.plot([0], [0], [0], marker='o', linestyle='', color='green', markersize=10,
+                                 label='Centre de Gravité')
+        self._legende = None  # Noms des composants présents dans la légende affichée
+
+    def update(self, data, cg, titre=None):
+        """
+        Met à jour les tracés avec une nouvelle configuration.
+
+        :param data: Dictionnaire ou ComponentTable contenant les positions et poids des composants de l'avion
+        :param cg: Tuple contenant les coordonnées du centre de gravité (X, Y, Z)
+        :param titre: Titre de la figure (optionnel)
+        """
+        # Les composants absents de la nouvelle configuration sont retirés de la figure
+        for component in [nom for nom in self._composants if nom not in data]:
+            self._composants.pop(component).remove()
+        positions = []
+        visibles = []
+        for component, properties in data.items():
+            x, y, z = properties['position']
+            marqueur = self._composants.get(component)
+            if marqueur is None:
+                marqueur, = self.ax.plot([x], [y], [z], marker='o', linestyle='', label=component.capitalize())
+                self._composants[component] = marqueur
+            else:
+                marqueur.set_data_3d([x], [y], [z])
+            positions.append((x, y, z))
+            visibles.append(component)
+        self._cg.set_data_3d([cg[0]], [cg[1]], [cg[2]])
+
+        # Mêmes limites que Visualization3D pour X, limites ajustées aux données pour Y et Z
+        positions = np.array(positions + [tuple(cg)], dtype=np.float64)
+        x_max = float(np.abs(positions[:-1, 0]).max()) if len(positions) > 1 else 1.0
+        self.ax.set_xlim3d([0, x_max or 1.0])
+        for axe, set_lim in ((1, self.ax.set_ylim3d), (2, self.ax.set_zlim3d)):
+            bas, haut = positions[:, axe].min(), positions[:, axe].max()
+            marge = max(haut - bas, 1.0) * 0.1
+            set_lim([bas - marge, haut + marge])
+
+        # La légende ne reprend que les composants de la configuration courante ; elle n'est reconstruite
+        # que lorsque cet ensemble change
+        if visibles != self._legende:
+            self.ax.legend(handles=[self._composants[nom] for nom in visibles] + [self._cg])
+            self._legende = visibles
+        self.ax.set_title(titre or '')
+
+    def save(self, chemin, **kwargs):
+        """
+        Écrit la figure courante, au format déduit de l'extension.
+
+        :param chemin: Chemin du fichier
+        """
+        self.figure.savefig(chemin, **kwargs)
+
+
+class AeroRenderer:
+    def __init__(self, figsize=(8, 6), dpi=100):
+        """
+        Crée les trois figures réutilisées : profil d'aile, polaire C_L vs α et polaire C_L vs C_D.
+
+        :param figsize: Taille des figures en pouces
+        :param dpi: Résolution des images matricielles
+        """
+        self.figures = {}
+        self._lignes = {}
+        self._axes = {}
+
+        fig, ax = self._nouvelle_figure('profil', (10, 5), dpi)
+        self._lignes['extrados'], = ax.plot([], [], label='Extrados')
+        self._lignes['intrados'], = ax.plot([], [], label='Intrados')
+        ax.set_xlabel('x (mètres)')
+        ax.set_ylabel('y (mètres)')
+        ax.axhline(0, color='black', linewidth=0.5)
+        ax.axvline(0, color='black', linewidth=0.5)
+        ax.grid(color='gray', linestyle='--', linewidth=0.5)
+        ax.legend()
+
+        fig, ax = self._nouvelle_figure('cl_alpha', figsize, dpi)
+        self._lignes['cl_alpha'], = ax.plot([], [], label='Polaire C_L vs α')
+        ax.set_xlabel('Angle d\'attaque (deg)')
+        ax.set_ylabel('Coefficient de portance C_L')
+        ax.grid(True)
+        ax.legend()
+
+        fig, ax = self._nouvelle_figure('cl_cd', figsize, dpi)
+        self._lignes['cl_cd'], = ax.plot([], [], label='Polaire C_D vs C_L')
+        ax.set_xlabel('Coefficient de trainée C_D')
+        ax.set_ylabel('Coefficient de portance C_L')
+        ax.grid(True)
+        ax.legend()
+
+    def _nouvelle_figure(self, nom, figsize, dpi):
+        """
+        Crée une figure Agg et ses axes.
+        """
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        self.figures[nom] = fig
+        self._axes[nom] = ax
+        return fig, ax
+
+    def update(self, profil_aile, corde, alpha_data, cl_data, cd_data):
+        """
+        Met à jour les trois figures avec un nouveau profil et sa polaire.
+
+        :param profil_aile: Derniers chiffres du profil NACA de l'aile
+        :param corde: Longueur de la corde de l'aile
+        :param alpha_data: Liste des angles d'attaque
+        :param cl_data: Liste des coefficients de portance
+        :param cd_data: Liste des coefficients de traînée
+        """
+        if len(alpha_data) != len(cl_data):
+            raise ValueError("alpha_data and cl_data must have the same length.")
+        if len(cl_data) != len(cd_data):
+            raise ValueError("cl_data and cd_data must have the same length.")
+        xup, yup, xdown, ydown = coordonnees_symetriques(int(profil_aile) / 100, corde)
+        self._lignes['extrados'].set_data(xup, yup)
+        self._lignes['intrados'].set_data(xdown, ydown)
+        self._lignes['cl_alpha'].set_data(alpha_data, cl_data)
+        self._lignes['cl_cd'].set_data(cd_data, cl_data)
+
+        self._axes['profil'].set_title(f'Profil NACA00{profil_aile}')
+        self._axes['cl_alpha'].set_title(f'Polaire C_L vs α pour le profil d\'aile NACA00{profil_aile}')
+        self._axes['cl_cd'].set_title(f'Polaire C_D vs C_L pour le profil d\'aile NACA00{profil_aile}')
+        for ax in self._axes.values():
+            ax.relim()
+            ax.autoscale_view()
+
+    def save(self, nom, chemin, **kwargs):
+        """
+        Écrit l'une des figures ('profil', 'cl_alpha' ou 'cl_cd').
+
+        :param nom: Nom de la figure
+        :param chemin: Chemin du fichier, ou objet PdfPages
+        """
+        if isinstance(chemin, PdfPages):
+            chemin.savefig(self.figures[nom], **kwargs)
+        else:
+            self.figures[nom].savefig(chemin, **kwargs)
+
+
+def _rendre_bloc_cg(configurations, dossier, fmt):
+    """
+    Rend un bloc de configurations de centre de gravité avec une seule figure (exécuté dans un processus).
+    """
+    renderer = CGRenderer()
+    chemins = []
+    for nom, data, cg in configurations:
+        renderer.update(data, cg, titre=nom)
+        chemin = os.path.join(dossier, f"{nom}.{fmt}")
+        renderer.save(chemin)
+        chemins.append(chemin)
+    return chemins
+
+
+def _rendre_bloc_aero(polaires, dossier, fmt):
+    """
+    Rend un bloc de polaires avec un seul jeu de figures (exécuté dans un processus).
+    """
+    renderer = AeroRenderer()
+    chemins = []
+    for nom, polaire in polaires:
+        renderer.update(*polaire)
+        for figure in renderer.figures:
+            chemin = os.path.join(dossier, f"{nom}_{figure}.{fmt}")
+            renderer.save(figure, chemin)
+            chemins.append(chemin)
+    return chemins
+
+
+def _repartir(fonction, elements, dossier, fmt, workers):
+    """
+    Découpe les éléments en autant de blocs que de processus et concatène les chemins produits.
+    """
+    os.makedirs(dossier, exist_ok=True)
+    if workers <= 1 or len(elements) <= 1:
+        return fonction(elements, dossier, fmt)
+    blocs = [elements[i::workers] for i in range(workers) if elements[i::workers]]
+    with ProcessPoolExecutor(max_workers=len(blocs)) as executor:
+        resultats = executor.map(fonction, blocs, [dossier] * len(blocs), [fmt] * len(blocs))
+        return [chemin for chemins in resultats for chemin in chemins]
+
+
+def render_cg_batch(configurations, dossier, fmt='png', workers=1):
+    """
+    Écrit une image par configuration de centre de gravité.
+
+    :param configurations: Liste de tuples (nom, data, cg)
+    :param dossier: Répertoire de sortie
+    :param fmt: 'png' ou 'svg'
+    :param workers: Nombre de processus
+    :return: Liste des fichiers écrits
+    """
+    return _repartir(_rendre_bloc_cg, list(configurations), dossier, fmt, workers)
+
+
+def render_aero_batch(polaires, dossier, fmt='png', workers=1):
+    """
+    Écrit trois images (profil, C_L vs α, C_L vs C_D) par polaire.
+
+    :param polaires: Liste de tuples (nom, (profil_aile, corde, alpha_data, cl_data, cd_data))
+    :param dossier: Répertoire de sortie
+    :param fmt: 'png' ou 'svg'
+    :param workers: Nombre de processus
+    :return: Liste des fichiers écrits
+    """
+    return _repartir(_rendre_bloc_aero, list(polaires), dossier, fmt, workers)
+
+
+def render_cg_pdf(configurations, chemin):
+    """
+    Réunit toutes les configurations de centre de gravité dans un PDF, une page par configuration.
+
+    :param configurations: Liste de tuples (nom, data, cg)
+    :param chemin: Chemin du fichier PDF
+    :return: Nombre de pages écrites
+    """
+    renderer = CGRenderer()
+    n = 0
+    with PdfPages(chemin) as pdf:
+        for nom, data, cg in configurations:
+            renderer.update(data, cg, titre=nom)
+            pdf.savefig(renderer.figure)
+            n += 1
+    return n
+
+
+def render_aero_pdf(polaires, chemin):
+    """
+    Réunit toutes les polaires dans un PDF, trois pages par polaire.
+
+    :param polaires: Liste de tuples (nom, (profil_aile, corde, alpha_data, cl_data, cd_data))
+    :param chemin: Chemin du fichier PDF
+    :return: Nombre de pages écrites
+    """
+    renderer = AeroRenderer()
+    n = 0
+    with PdfPages(chemin) as pdf:
+        for _, polaire in polaires:
+            renderer.update(*polaire)
+            for figure in renderer.figures:
+                renderer.save(figure, pdf)
+                n += 1
+    return n
@@ -0,0 +1,457 @@
+"""
+Service HTTP/JSON local exposant le calcul du centre de gravité, l'interrogation des polaires et la géométrie des
+profils, pour éviter de payer le démarrage de Python, pandas et matplotlib à chaque appel depuis d'autres outils.
+
+Le serveur repose uniquement sur asyncio (bibliothèque standard) et numpy. Les requêtes simultanées sont
+regroupées en lots (micro-batching) : pendant une courte fenêtre, les requêtes compatibles (mêmes composants et
+positions, même polaire, même grille de profil) sont accumulées puis traitées par un seul appel vectorisé. Les
+réponses aux requêtes déjà vues sont servies depuis un cache LRU, indexé par le JSON canonique de la requête.
+
+Points d'accès :
+- POST /cg         {"components": {"nom": {"position": [x, y, z], "poids": w}, ...}}
+- POST /polar      {"alpha": [...], "cl": [...], "cd": [...], "methode": "pchip",
+                    "requetes": {"alpha": [...], "cl": [...]}}
+- POST /geometrie  {"designation": "2412", "corde": 1.5, "n_points": 100, "espacement": "uniforme"}
+- GET  /metrics    latences p50/p99, débit, taux de succès du cache et taille moyenne des lots par point d'accès
+- GET  /health
+
+Exemple :
+    python server.py --port 8080
+    curl -s -X POST localhost:8080/cg -d '{"components": {"ailes": {"position": [5.5, 0, 0], "poids": 500}}}'
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import OrderedDict, deque
+
+import numpy as np
+
+from center_of_gravity import calculate_batch
+from naca_geometry import coordonnees_famille, parametres_naca
+from polar_interpolation import PolarInterpolator
+
+# Taille maximale du corps d'une requête (octets)
+MAX_BODY = 16 * 2 ** 20
+# Nombre de latences conservées par point d'accès pour le calcul des percentiles
+METRICS_WINDOW = 10000
+# Durée (s) de la fenêtre glissante utilisée pour le débit instantané
+THROUGHPUT_WINDOW = 60.0
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large',
+           500: 'Internal Server Error'}
+
+
+def _liste(tableau):
+    """
+    Convertit un tableau numpy en liste JSON (NaN -> null).
+    """
+    return [None if v != v else v for v in np.asarray(tableau, dtype=np.float64).tolist()]
+
+
+def _tableau(valeurs, nom):
+    """
+    Convertit une liste JSON de nombres en tableau numpy 1D.
+    """
+    try:
+        tableau = np.asarray(valeurs, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError(f"{nom} must be a list of numbers.") from None
+    if tableau.ndim != 1:
+        raise ValueError(f"{nom} must be a list of numbers.")
+    return tableau
+
+
+class LRUCache:
+    def __init__(self, taille_max=4096):
+        """
+        Cache des réponses, éliminant l'entrée la moins récemment utilisée au-delà de taille_max entrées.
+
+        :param taille_max: Nombre maximal d'entrées
+        """
+        self.taille_max = taille_max
+        self._entrees = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cle):
+        """
+        :return: Valeur associée à la clé, ou None
+        """
+        valeur = self._entrees.get(cle)
+        if valeur is None:
+            self.misses += 1
+            return None
+        self._entrees.move_to_end(cle)
+        self.hits += 1
+        return valeur
+
+    def put(self, cle, valeur):
+        self._entrees[cle] = valeur
+        self._entrees.move_to_end(cle)
+        while len(self._entrees) > self.taille_max:
+            self._entrees.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entrees)
+
+
+class MicroBatcher:
+    def __init__(self, traiter, fenetre=0.002, taille_max=1024):
+        """
+        Regroupe les requêtes arrivant pendant une courte fenêtre et les traite par lots.
+
+        :param traiter: Fonction (clé de regroupement, liste de charges) -> liste de résultats, un par charge
+        :param fenetre: Durée d'accumulation (s) après la première requête d'un lot
+        :param taille_max: Nombre de requêtes en attente déclenchant le traitement sans attendre la fin de la fenêtre
+        """
+        self.traiter = traiter
+        self.fenetre = fenetre
+        self.taille_max = taille_max
+        self._attente = {}  # Clé de regroupement -> liste de (charge, future)
+        self._n_attente = 0
+        self._minuteur = None
+        self.n_lots = 0  # Nombre d'appels à traiter
+        self.n_requetes = 0
+
+    async def submit(self, cle, charge):
+        """
+        Ajoute une requête au lot courant et attend son résultat.
+
+        :param cle: Clé de regroupement (hachable) : seules les requêtes de même clé sont traitées ensemble
+        :param charge: Données de la requête, déjà validées
+        :return: Résultat de la requête
+        """
+        boucle = asyncio.get_running_loop()
+        future = boucle.create_future()
+        self._attente.setdefault(cle, []).append((charge, future))
+        self._n_attente += 1
+        if self._n_attente >= self.taille_max:
+            self._vider()
+        elif self._minuteur is None:
+            self._minuteur = boucle.call_later(self.fenetre, self._vider)
+        return await future
+
+    def _vider(self):
+        """
+        Traite tous les lots en attente.
+        """
+        if self._minuteur is not None:
+            self._minuteur.cancel()
+            self._minuteur = None
+        lots, self._attente, self._n_attente = self._attente, {}, 0
+        for cle, elements in lots.items():
+            self.n_lots += 1
+            self.n_requetes += len(elements)
+            try:
+                resultats = self.traiter(cle, [charge for charge, _ in elements])
+            except Exception as erreur:  # L'erreur est transmise à chaque requête du lot
+                for _, future in elements:
+                    if not future.done():
+                        future.set_exception(erreur)
+                continue
+            for (_, future), resultat in zip(elements, resultats):
+                if not future.done():
+                    future.set_result(resultat)
+
+
+class EndpointMetrics:
+    def __init__(self):
+        """
+        Mesures d'un point d'accès : latences récentes, nombre de requêtes et d'erreurs, instants de fin.
+        """
+        self.n_requetes = 0
+        self.n_erreurs = 0
+        self.latences = deque(maxlen=METRICS_WINDOW)
+        self.instants = deque(maxlen=METRICS_WINDOW)
+
+    def record(self, latence, erreur):
+        self.n_requetes += 1
+        self.n_erreurs += erreur
+        self.latences.append(latence)
+        self.instants.append(time.monotonic())
+
+    def summary(self, duree_service):
+        """
+        :param duree_service: Durée depuis le démarrage du serveur (s)
+        :return: Dictionnaire des mesures (latences en millisecondes, débits en requêtes par seconde)
+        """
+        maintenant = time.monotonic()
+        recents = sum(1 for instant in self.instants if instant >= maintenant - THROUGHPUT_WINDOW)
+        p50, p99 = (np.percentile(self.latences, [50, 99]) * 1000).tolist() if self.latences else (None, None)
+        return {'requetes': self.n_requetes, 'erreurs': self.n_erreurs, 'latence_p50_ms': p50, 'latence_p99_ms': p99,
+                'debit_moyen': self.n_requetes / duree_service if duree_service > 0 else None,
+                'debit_recent': recents / min(THROUGHPUT_WINDOW, max(duree_service, 1e-9))}
+
+
+class CGServer:
+    def __init__(self, host='127.0.0.1', port=8080, fenetre_batch=0.002, taille_lot_max=1024, taille_cache=4096):
+        """
+        Initialisation du service.
+
+        :param host: Adresse d'écoute
+        :param port: Port d'écoute (0 : port libre choisi par le système)
+        :param fenetre_batch: Durée d'accumulation des lots (s)
+        :param taille_lot_max: Nombre de requêtes en attente déclenchant le traitement immédiat d'un lot
+        :param taille_cache: Nombre de réponses conservées dans le cache LRU
+        """
+        self.host = host
+        self.port = port
+        self.cache = LRUCache(taille_cache)
+        self.interpolateurs = LRUCache(256)  # Polaire -> PolarInterpolator, dont la construction est la plus coûteuse
+        self.batchers = {
+            '/cg': MicroBatcher(self._lot_cg, fenetre_batch, taille_lot_max),
+            '/polar': MicroBatcher(self._lot_polar, fenetre_batch, taille_lot_max),
+            '/geometrie': MicroBatcher(self._lot_geometrie, fenetre_batch, taille_lot_max),
+        }
+        self.metrics = {chemin: EndpointMetrics() for chemin in list(self.batchers) + ['/metrics', '/health']}
+        self._debut = time.monotonic()
+        self._serveur = None
+
+    # Validation des requêtes : clé de regroupement et charge, ou ValueError
+
+    @staticmethod
+    def _preparer_cg(requete):
+        composants = requete.get('components')
+        if not isinstance(composants, dict) or not composants:
+            raise ValueError("'components' must be a non-empty object.")
+        noms, positions, poids = [], [], []
+        for nom, proprietes in composants.items():
+            if not isinstance(proprietes, dict):
+                raise ValueError(f"{nom} must be an object with 'position' and 'poids'.")
+            position = _tableau(proprietes.get('position'), f"{nom}.position")
+            if position.shape != (3,):
+                raise ValueError(f"{nom}.position must have 3 coordinates.")
+            noms.append(nom)
+            positions.append(tuple(position.tolist()))
+            poids.append(float(proprietes['poids']))
+        if sum(poids) == 0:
+            raise ValueError("Total weight is zero, the center of gravity is undefined.")
+        return (tuple(noms), tuple(positions)), poids
+
+    def _preparer_polar(self, requete):
+        alpha, cl, cd = (_tableau(requete.get(nom), nom) for nom in ('alpha', 'cl', 'cd'))
+        methode = requete.get('methode', 'pchip')
+        cle = (tuple(alpha.tolist()), tuple(cl.tolist()), tuple(cd.tolist()), methode)
+        if self.interpolateurs.get(cle) is None:
+            self.interpolateurs.put(cle, PolarInterpolator(alpha, cl, cd, methode=methode))
+        requetes = requete.get('requetes') or {}
+        if not isinstance(requetes, dict):
+            raise ValueError("'requetes' must be an object with 'alpha' and/or 'cl'.")
+        return cle, (_tableau(requetes.get('alpha', []), 'requetes.alpha'),
+                     _tableau(requetes.get('cl', []), 'requetes.cl'))
+
+    @staticmethod
+    def _preparer_geometrie(requete):
+        designation = str(requete.get('designation', '12'))
+        parametres_naca(designation)  # Vérifie la désignation avant de l'ajouter au lot
+        corde = float(requete.get('corde', 1.0))
+        n_points = int(requete.get('n_points', 100))
+        espacement = requete.get('espacement', 'uniforme')
+        if espacement not in ('uniforme', 'cosinus') or n_points < 2:
+            raise ValueError("n_points must be >= 2 and espacement 'uniforme' or 'cosinus'.")
+        return (n_points, espacement), (designation, corde)
+
+    # Traitement vectorisé d'un lot de requêtes compatibles
+
+    @staticmethod
+    def _lot_cg(cle, charges):
+        _, positions = cle
+        cg, poids_total = calculate_batch(np.array(charges), np.array(positions))
+        return [{'cg': ligne, 'poids_total': total} for ligne, total in zip(cg.tolist(), poids_total.tolist())]
+
+    def _lot_polar(self, cle, charges):
+        interpolateur = self.interpolateurs.get(cle)
+        if interpolateur is None:
+            interpolateur = PolarInterpolator(*(np.array(v) for v in cle[:3]), methode=cle[3])
+            self.interpolateurs.put(cle, interpolateur)
+        # Toutes les requêtes du lot sont évaluées par un seul appel par grandeur, puis redécoupées
+        alphas = np.concatenate([alpha for alpha, _ in charges])
+        cls = np.concatenate([cl for _, cl in charges])
+        cl_alpha, cd_alpha = interpolateur.cl(alphas), interpolateur.cd_alpha(alphas)
+        alpha_cl, cd_cl = interpolateur.alpha(cls), interpolateur.cd(cls)
+        coupes_alpha = np.cumsum([len(alpha) for alpha, _ in charges])[:-1]
+        coupes_cl = np.cumsum([len(cl) for _, cl in charges])[:-1]
+        derivees = {nom: (None if valeur != valeur else valeur) for nom, valeur in interpolateur.derived().items()}
+        resultats = []
+        for cl_a, cd_a, alpha_c, cd_c in zip(np.split(cl_alpha, coupes_alpha), np.split(cd_alpha, coupes_alpha),
+                                            np.split(alpha_cl, coupes_cl), np.split(cd_cl, coupes_cl)):
+            resultats.append({'derivees': derivees,
+                              'alpha': {'cl': _liste(cl_a), 'cd': _liste(cd_a), 'finesse': _liste(cl_a / cd_a)},
+                              'cl': {'alpha': _liste(alpha_c), 'cd': _liste(cd_c)}})
+        return resultats
+
+    @staticmethod
+    def _lot_geometrie(cle, charges):
+        n_points, espacement = cle
+        designations = [designation for designation, _ in charges]
+        cordes = [corde for _, corde in charges]
+        xup, yup, xdown, ydown = coordonnees_famille(designations, cordes, n_points, espacement)
+        return [{'x_extrados': _liste(xup[i]), 'y_extrados': _liste(yup[i]),
+                 'x_intrados': _liste(xdown[i]), 'y_intrados': _liste(ydown[i])} for i in range(len(charges))]
+
+    # Routage
+
+    async def handle(self, methode, chemin, corps):
+        """
+        Traite une requête HTTP déjà décodée.
+
+        :param methode: Méthode HTTP
+        :param chemin: Chemin de la requête (la chaîne de requête éventuelle est ignorée)
+        :param corps: Corps de la requête (octets)
+        :return: Tuple (code HTTP, corps JSON de la réponse en octets)
+        """
+        debut = time.perf_counter()
+        chemin = chemin.split('?', 1)[0].rstrip('/') or '/'
+        try:
+            statut, reponse = await self._router(methode, chemin, corps)
+        except Exception as erreur:
+            # Toute requête reçoit une réponse et est comptée dans les métriques
+            statut, reponse = 500, self._erreur(f"{type(erreur).__name__}: {erreur}")
+        if chemin in self.metrics:
+            self.metrics[chemin].record(time.perf_counter() - debut, statut != 200)
+        return statut, reponse
+
+    async def _router(self, methode, chemin, corps):
+        if chemin == '/metrics' or chemin == '/health':
+            if methode != 'GET':
+                return 405, self._erreur("Use GET.")
+            contenu = self.metrics_summary() if chemin == '/metrics' else {'status': 'ok'}
+            return 200, json.dumps(contenu).encode()
+        if chemin not in self.batchers:
+            return 404, self._erreur(f"Unknown endpoint {chemin!r}")
+        if methode != 'POST':
+            return 405, self._erreur("Use POST with a JSON body.")
+
+        try:
+            requete = json.loads(corps or b'{}')
+            if not isinstance(requete, dict):
+                raise ValueError("The request body must be a JSON object.")
+            cle_cache = chemin + json.dumps(requete, sort_keys=True, separators=(',', ':'))
+        except ValueError as erreur:
+            return 400, self._erreur(str(erreur))
+        reponse = self.cache.get(cle_cache)
+        if reponse is not None:
+            return 200, reponse
+
+        preparer = {'/cg': self._preparer_cg, '/polar': self._preparer_polar,
+                    '/geometrie': self._preparer_geometrie}[chemin]
+        try:
+            cle, charge = preparer(requete)
+        except (ValueError, KeyError, TypeError) as erreur:
+            return 400, self._erreur(str(erreur))
+        try:
+            resultat = await self.batchers[chemin].submit(cle, charge)
+            # Un résultat non fini (débordement, par exemple avec un poids de 1e308) n'est pas du JSON valide
+            reponse = json.dumps(resultat, allow_nan=False).encode()
+        except (ValueError, ZeroDivisionError) as erreur:
+            return 400, self._erreur(str(erreur))
+        except Exception as erreur:
+            return 500, self._erreur(f"{type(erreur).__name__}: {erreur}")
+        self.cache.put(cle_cache, reponse)
+        return 200, reponse
+
+    @staticmethod
+    def _erreur(message):
+        return json.dumps({'error': message}).encode()
+
+    def metrics_summary(self):
+        """
+        :return: Mesures de chaque point d'accès, du cache et des lots
+        """
+        duree = time.monotonic() - self._debut
+        resultat = {'uptime_s': duree,
+                    'cache': {'entrees': len(self.cache), 'hits': self.cache.hits, 'misses': self.cache.misses},
+                    'endpoints': {chemin: metrique.summary(duree) for chemin, metrique in self.metrics.items()}}
+        for chemin, batcher in self.batchers.items():
+            resultat['endpoints'][chemin]['lots'] = batcher.n_lots
+            resultat['endpoints'][chemin]['taille_moyenne_lot'] = (batcher.n_requetes / batcher.n_lots
+                                                                   if batcher.n_lots else None)
+        return resultat
+
+    # Protocole HTTP/1.1 minimal (connexions persistantes, corps de longueur connue)
+
+    async def _connexion(self, reader, writer):
+        try:
+            while True:
+                ligne = await reader.readline()
+                if not ligne:
+                    break
+                try:
+                    methode, chemin, version = ligne.decode('latin-1').split()
+                except ValueError:
+                    await self._repondre(writer, 400, self._erreur("Malformed request line."), False)
+                    break
+                entetes = {}
+                while True:
+                    ligne = await reader.readline()
+                    if ligne in (b'\r\n', b'\n', b''):
+                        break
+                    nom, _, valeur = ligne.decode('latin-1').partition(':')
+                    entetes[nom.strip().lower()] = valeur.strip()
+                # Connexion persistante par défaut en HTTP/1.1, sur demande explicite en HTTP/1.0
+                garder = entetes.get('connection', '').lower() == 'keep-alive' or (
+                    version == 'HTTP/1.1' and entetes.get('connection', '').lower() != 'close')
+                try:
+                    longueur = int(entetes.get('content-length', 0) or 0)
+                    if longueur < 0:
+                        raise ValueError
+                except ValueError:
+                    await self._repondre(writer, 400, self._erreur("Invalid Content-Length."), False)
+                    break
+                if longueur > MAX_BODY:
+                    await self._repondre(writer, 413, self._erreur("Request body too large."), False)
+                    break
+                corps = await reader.readexactly(longueur) if longueur else b''
+                statut, reponse = await self.handle(methode, chemin, corps)
+                await self._repondre(writer, statut, reponse, garder)
+                if not garder:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _repondre(writer, statut, corps, garder):
+        entetes = (f"HTTP/1.1 {statut} {REASONS.get(statut, '')}\r\n"
+                   f"Content-Type: application/json\r\nContent-Length: {len(corps)}\r\n"
+                   f"Connection: {'keep-alive' if garder else 'close'}\r\n\r\n")
+        writer.write(entetes.encode('latin-1') + corps)
+        await writer.drain()
+
+    async def start(self):
+        """
+        Ouvre le port d'écoute ; self.port contient ensuite le port effectif.
+        """
+        self._serveur = await asyncio.start_server(self._connexion, self.host, self.port)
+        self.port = self._serveur.sockets[0].getsockname()[1]
+        return self._serveur
+
+    async def serve_forever(self):
+        """
+        Démarre le service et traite les requêtes jusqu'à l'interruption.
+        """
+        serveur = await self.start()
+        async with serveur:
+            await serveur.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Service HTTP/JSON de calcul du centre de gravité et des polaires.")
+    parser.add_argument('--host', default='127.0.0.1', help="Adresse d'écoute")
+    parser.add_argument('--port', type=int, default=8080, help="Port d'écoute")
+    parser.add_argument('--batch-window', type=float, default=0.002, help="Durée d'accumulation des lots (s)")
+    parser.add_argument('--max-batch', type=int, default=1024, help="Taille maximale d'un lot")
+    parser.add_argument('--cache-size', type=int, default=4096, help="Nombre de réponses en cache")
+    args = parser.parse_args(argv)
+    serveur = CGServer(args.host, args.port, args.batch_window, args.max_batch, args.cache_size)
+    print(f"Service à l'écoute sur http://{args.host}:{args.port}")
+    try:
+        asyncio.run(serveur.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""
+Ce module contient la classe SweepRunner qui explore sans interaction un espace de conception :
+positions et poids des composants (centre de gravité) ainsi que corde et épaisseur du profil (aérodynamique).
+
+Les configurations sont issues du produit cartésien de listes de valeurs, ou d'un échantillonnage par
+hypercube latin reproductible. Elles sont découpées en blocs répartis sur plusieurs processus
+(ProcessPoolExecutor). Les résultats sont écrits dans un fichier CSV au fur et à mesure que les blocs se terminent,
+ce qui permet de reprendre un balayage interrompu à partir du fichier partiel. La description du balayage
+(paramètres, nombre de configurations, valeurs de la grille ou bornes et graine de l'hypercube latin, profil et
+empreinte des composants de référence) est enregistrée à côté du fichier ('<output>.meta.json') : une reprise
+avec un balayage différent est refusée.
+
+Noms de paramètres acceptés :
+- '<composant>.poids', '<composant>.position_x', '<composant>.position_y', '<composant>.position_z'
+- 'corde', 'epaisseur' (épaisseur relative, par exemple 0.12)
+"""
+
+import csv
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from center_of_gravity import CenterOfGravityCalculator
+from naca_geometry import base_polynomiale, grille
+
+# Colonnes des positions dans le tableau (N, 3) des composants
+AXES = {'position_x': 0, 'position_y': 1, 'position_z': 2}
+# Colonnes de résultats ajoutées après les paramètres
+RESULT_COLUMNS = ['poids_total', 'cg_x', 'cg_y', 'cg_z', 'epaisseur_max', 'aire_section']
+
+
+def latin_hypercube(bornes, n_echantillons, seed=0):
+    """
+    Tire un échantillon par hypercube latin : chaque paramètre est découpé en n_echantillons intervalles
+    de même largeur et chaque intervalle est utilisé exactement une fois.
+
+    :param bornes: Dictionnaire {paramètre: (min, max)}
+    :param n_echantillons: Nombre de configurations
+    :param seed: Graine du générateur aléatoire
+    :return: Tableau de forme (n_echantillons, len(bornes))
+    """
+    rng = np.random.default_rng(seed)
+    bas = np.array([b[0] for b in bornes.values()], dtype=np.float64)
+    haut = np.array([b[1] for b in bornes.values()], dtype=np.float64)
+    strates = (rng.random((n_echantillons, len(bornes))) + np.arange(n_echantillons)[:, np.newaxis]) / n_echantillons
+    for j in range(len(bornes)):
+        rng.shuffle(strates[:, j])
+    return bas + strates * (haut - bas)
+
+
+def _evaluer_bloc(noms_composants, poids_base, positions_base, poids_nominal, moments_nominaux, corde_base,
+                  epaisseur_base, parametres, debut, valeurs):
+    """
+    Évalue un bloc de configurations (fonction exécutée dans les processus de travail).
+    Seuls les composants balayés interviennent : le poids total et les moments de référence sont corrigés de
+    leurs écarts, le coût ne dépend donc pas du nombre total de composants.
+
+    :param noms_composants: Noms des composants, dans l'ordre des lignes de positions_base
+    :param poids_base: Poids de référence des composants, forme (N,)
+    :param positions_base: Positions de référence des composants, forme (N, 3)
+    :param poids_nominal: Poids total de référence
+    :param moments_nominaux: Moments de référence autour des axes x, y, z, forme (3,)
+    :param corde_base: Corde de référence
+    :param epaisseur_base: Épaisseur relative de référence
+    :param parametres: Noms des paramètres balayés
+    :param debut: Indice de la première configuration du bloc
+    :param valeurs: Valeurs des paramètres, forme (B, len(parametres))
+    :return: Liste de lignes [indice, paramètres..., résultats...]
+    """
+    n_configs = len(valeurs)
+    index_composants = {nom: i for i, nom in enumerate(noms_composants)}
+    corde = np.full(n_configs, corde_base, dtype=np.float64)
+    epaisseur = np.full(n_configs, epaisseur_base, dtype=np.float64)
+
+    # Composants balayés : indice -> [poids (B,) ou None, {axe: positions (B,)}]
+    balayes = {}
+    for j, parametre in enumerate(parametres):
+        if parametre == 'corde':
+            corde = valeurs[:, j]
+        elif parametre == 'epaisseur':
+            epaisseur = valeurs[:, j]
+        else:
+            composant, grandeur = parametre.rsplit('.', 1)
+            balaye = balayes.setdefault(index_composants[composant], [None, {}])
+            if grandeur == 'poids':
+                balaye[0] = valeurs[:, j]
+            else:
+                balaye[1][AXES[grandeur]] = valeurs[:, j]
+
+    # Centre de gravité de toutes les configurations du bloc : référence + (w'·p' - w·p) des composants balayés
+    poids_total = np.full(n_configs, poids_nominal, dtype=np.float64)
+    moments = np.tile(moments_nominaux, (n_configs, 1))
+    for i, (poids, axes) in balayes.items():
+        poids = np.full(n_configs, poids_base[i]) if poids is None else poids
+        positions = np.tile(positions_base[i], (n_configs, 1))
+        for axe, valeurs_axe in axes.items():
+            positions[:, axe] = valeurs_axe
+        poids_total += poids - poids_base[i]
+        moments += poids[:, np.newaxis] * positions - poids_base[i] * positions_base[i]
+    cg = moments / poids_total[:, np.newaxis]
+
+    # Géométrie du profil symétrique : épaisseur maximale et aire de la section
+    xc = grille(100, 'uniforme')
+    _, epaisseur_unitaire = base_polynomiale(100, 'uniforme')
+    integrale = np.sum((epaisseur_unitaire[1:] + epaisseur_unitaire[:-1]) / 2 * np.diff(xc))
+    epaisseur_max = epaisseur * epaisseur_unitaire.max() * 2 * corde
+    aire_section = 2 * epaisseur * integrale * corde ** 2
+
+    resultats = np.column_stack([valeurs, poids_total, cg, epaisseur_max, aire_section])
+    return [[debut + k] + ligne for k, ligne in enumerate(resultats.tolist())]
+
+
+class SweepRunner:
+    def __init__(self, data, corde=1.5, epaisseur=0.12, workers=None, chunk_size=1000, progress=True):
+        """
+        Initialisation du balayage autour d'une configuration de référence.
+
+        :param data: Dictionnaire ou ComponentTable contenant les propriétés de référence des composants
+        :param corde: Corde de référence de l'aile
+        :param epaisseur: Épaisseur relative de référence du profil
+        :param workers: Nombre de processus (par défaut le nombre de cœurs)
+        :param chunk_size: Nombre de configurations par bloc envoyé à un processus
+        :param progress: Afficher la progression sur la sortie d'erreur
+        """
+        self.noms, poids, positions = CenterOfGravityCalculator(data).to_arrays()
+        self.poids = np.array(poids)
+        self.positions = np.array(positions)
+        self.poids_nominal = float(self.poids.sum())
+        self.moments_nominaux = self.poids @ self.positions
+        self.corde = corde
+        self.epaisseur = epaisseur
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.progress = progress
+
+    def _verifier_parametres(self, parametres):
+        """
+        Vérifie que chaque paramètre balayé est connu.
+        """
+        for parametre in parametres:
+            if parametre in ('corde', 'epaisseur'):
+                continue
+            composant, _, grandeur = parametre.rpartition('.')
+            if composant not in self.noms or (grandeur != 'poids' and grandeur not in AXES):
+                raise ValueError(f"Unknown sweep parameter: {parametre!r}")
+
+    @staticmethod
+    def _verifier_entete(output, entete):
+        """
+        Vérifie qu'un fichier de résultats partiel a bien l'en-tête attendu (lecture seule).
+
+        :param output: Chemin du fichier CSV de résultats
+        :param entete: En-tête attendu ; un fichier partiel avec un autre en-tête lève ValueError
+        """
+        if not os.path.exists(output):
+            return
+        with open(output, newline='', encoding='utf-8') as f:
+            entete_fichier = next(csv.reader(f), None)
+        if entete_fichier is not None and entete_fichier != entete:
+            raise ValueError(f"Cannot resume {output!r}: its columns {entete_fichier} do not match "
+                             f"this sweep {entete}.")
+
+    @staticmethod
+    def _indices_termines(output):
+        """
+        Lit les indices des configurations déjà présentes dans un fichier de résultats partiel.
+        Une dernière ligne incomplète (interruption pendant l'écriture) est supprimée du fichier.
+
+        :param output: Chemin du fichier CSV de résultats
+        """
+        if not os.path.exists(output):
+            return set()
+        with open(output, 'rb+') as f:
+            taille = f.seek(0, os.SEEK_END)
+            f.seek(max(taille - 65536, 0))
+            fin = f.read()
+            if fin and not fin.endswith(b'\n'):
+                f.truncate(taille - len(fin) + fin.rfind(b'\n') + 1)
+        with open(output, newline='', encoding='utf-8') as f:
+            lecteur = csv.reader(f)
+            next(lecteur, None)
+            return {int(ligne[0]) for ligne in lecteur}
+
+    def _empreinte_composants(self):
+        """
+        Empreinte des composants de référence (noms, poids et positions), pour refuser la reprise d'un balayage
+        calculé sur un autre avion.
+
+        :return: Dictionnaire {'nombre': N, 'sha256': empreinte hexadécimale}
+        """
+        empreinte = hashlib.sha256('\0'.join(self.noms).encode('utf-8'))
+        empreinte.update(np.ascontiguousarray(self.poids, dtype=np.float64).tobytes())
+        empreinte.update(np.ascontiguousarray(self.positions, dtype=np.float64).tobytes())
+        return {'nombre': len(self.noms), 'sha256': empreinte.hexdigest()}
+
+    @staticmethod
+    def _verifier_description(output, description):
+        """
+        Compare la description du balayage à celle enregistrée lors du premier lancement, ou l'enregistre.
+
+        :param output: Chemin du fichier CSV de résultats
+        :param description: Dictionnaire sérialisable en JSON décrivant les configurations
+        """
+        chemin = output + '.meta.json'
+        description = json.loads(json.dumps(description))  # Tuples -> listes, pour la comparaison
+        if os.path.exists(output) and os.path.getsize(output) > 0 and os.path.exists(chemin):
+            with open(chemin, encoding='utf-8') as f:
+                enregistree = json.load(f)
+            if enregistree != description:
+                raise ValueError(f"Cannot resume {output!r}: it was produced by a different sweep "
+                                 f"(see {chemin!r}).")
+            return
+        with open(chemin, 'w', encoding='utf-8') as f:
+            json.dump(description, f, indent=2)
+
+    def run_grid(self, grille_parametres, output):
+        """
+        Évalue le produit cartésien de listes de valeurs.
+
+        :param grille_parametres: Dictionnaire {paramètre: liste de valeurs}
+        :param output: Chemin du fichier CSV de résultats
+        :return: Nombre de configurations évaluées lors de cet appel
+        """
+        parametres = list(grille_parametres)
+        axes = [np.asarray(v, dtype=np.float64) for v in grille_parametres.values()]
+        formes = tuple(len(a) for a in axes)
+
+        def valeurs(debut, fin):
+            # Les configurations d'un bloc sont décodées à partir de leur indice, sans construire tout le produit
+            indices = np.unravel_index(np.arange(debut, fin), formes)
+            return np.column_stack([a[i] for a, i in zip(axes, indices)])
+
+        description = {'type': 'grid', 'grille': {p: a.tolist() for p, a in zip(parametres, axes)}}
+        return self._run(parametres, int(np.prod(formes)), valeurs, output, description)
+
+    def run_latin_hypercube(self, bornes, n_echantillons, output, seed=0):
+        """
+        Évalue un échantillon par hypercube latin. La graine fixe l'échantillon, ce qui permet la reprise.
+
+        :param bornes: Dictionnaire {paramètre: (min, max)}
+        :param n_echantillons: Nombre de configurations
+        :param output: Chemin du fichier CSV de résultats
+        :param seed: Graine du générateur aléatoire
+        :return: Nombre de configurations évaluées lors de cet appel
+        """
+        echantillon = latin_hypercube(bornes, n_echantillons, seed)
+        description = {'type': 'latin_hypercube', 'bornes': {p: [float(b) for b in bornes[p]] for p in bornes},
+                       'seed': seed}
+        return self._run(list(bornes), n_echantillons, lambda debut, fin: echantillon[debut:fin], output,
+                         description)
+
+    def _run(self, parametres, n_total, valeurs, output, description):
+        """
+        Répartit les blocs non encore évalués sur les processus et écrit les résultats au fil de l'eau.
+        """
+        self._verifier_parametres(parametres)
+        entete = ['index'] + parametres + RESULT_COLUMNS
+        # Vérifications avant toute écriture : une reprise refusée laisse le fichier de résultats intact
+        self._verifier_entete(output, entete)
+        self._verifier_description(output, dict(description, parametres=parametres, n_total=n_total,
+                                                corde=self.corde, epaisseur=self.epaisseur,
+                                                composants=self._empreinte_composants()))
+        termines = self._indices_termines(output)
+        blocs = [(debut, min(debut + self.chunk_size, n_total)) for debut in range(0, n_total, self.chunk_size)]
+        blocs = [(debut, fin) for debut, fin in blocs if not all(i in termines for i in range(debut, fin))]
+
+        nouveau_fichier = not os.path.exists(output) or os.path.getsize(output) == 0
+        n_evalues = 0
+        debut_chrono = time.perf_counter()
+        workers = self.workers or os.cpu_count() or 1
+        with open(output, 'a', newline='', encoding='utf-8') as f, \
+                ProcessPoolExecutor(max_workers=workers) as executor:
+            writer = csv.writer(f)
+            if nouveau_fichier:
+                writer.writerow(entete)
+
+            # Nombre limité de blocs en attente, pour garder une mémoire bornée quelle que soit la taille du balayage
+            en_attente = set()
+            max_en_attente = 2 * workers
+            blocs = iter(blocs)
+            while True:
+                for debut, fin in blocs:
+                    en_attente.add(executor.submit(_evaluer_bloc, self.noms, self.poids, self.positions,
+                                                   self.poids_nominal, self.moments_nominaux, self.corde,
+                                                   self.epaisseur, parametres, debut, valeurs(debut, fin)))
+                    if len(en_attente) >= max_en_attente:
+                        break
+                if not en_attente:
+                    break
+                termines_lot, en_attente = wait(en_attente, return_when=FIRST_COMPLETED)
+                for future in termines_lot:
+                    lignes = [ligne for ligne in future.result() if ligne[0] not in termines]
+                    writer.writerows(lignes)
+                    n_evalues += len(lignes)
+                f.flush()
+                if self.progress:
+                    fait = len(termines) + n_evalues
+                    debit = n_evalues / (time.perf_counter() - debut_chrono)
+                    print(f"\r{fait}/{n_total} configurations ({debit:.0f}/s)", end='', file=sys.stderr)
+        if self.progress:
+            print(file=sys.stderr)
+        return n_evalues
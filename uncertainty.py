@@ -0,0 +1,392 @@
+"""
+Ce module propage par la méthode de Monte-Carlo les tolérances sur les poids et positions des composants
+jusqu'au centre de gravité, pour en estimer la dispersion (moyenne, écart type, covariance, percentiles).
+
+Les tirages sont faits par blocs vectorisés avec un numpy.random.Generator : le bloc i utilise toujours le i-ème
+descendant de numpy.random.SeedSequence(seed), si bien que le résultat ne dépend que de la graine, du nombre
+d'échantillons et de la taille des blocs, et non du nombre de processus. Les statistiques sont cumulées en continu
+(moyenne et co-moments par la méthode de Welford / Chan, quantiles par t-digest) : la mémoire ne croît pas avec
+le nombre d'échantillons.
+
+Tolérances : dictionnaire {paramètre: loi} où les paramètres sont nommés comme pour le balayage
+('<composant>.poids', '<composant>.position_x', ...) et les lois sont des écarts à la valeur nominale :
+- ('normal', ecart_type)
+- ('uniform', demi_largeur) ou ('uniform', bas, haut)
+- ('triangular', demi_largeur) ou ('triangular', bas, haut), de mode la valeur nominale
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from center_of_gravity import CenterOfGravityCalculator
+
+# Colonnes des positions dans le tableau (N, 3) des composants
+AXES = {'position_x': 0, 'position_y': 1, 'position_z': 2}
+# Grandeurs suivies, dans l'ordre des colonnes des statistiques
+OUTPUTS = ['cg_x', 'cg_y', 'cg_z', 'poids_total']
+# Percentiles calculés par défaut (enveloppes à 95 % et 99 %)
+DEFAULT_PERCENTILES = (0.5, 2.5, 50.0, 97.5, 99.5)
+
+
+class StreamingStats:
+    def __init__(self, n_colonnes):
+        """
+        Moyenne, co-moments d'ordre 2, minimum et maximum cumulés bloc par bloc (méthode de Welford / Chan).
+
+        :param n_colonnes: Nombre de grandeurs suivies
+        """
+        self.n = 0
+        self.moyenne = np.zeros(n_colonnes)
+        self.m2 = np.zeros((n_colonnes, n_colonnes))  # Somme des produits des écarts à la moyenne
+        self.minimum = np.full(n_colonnes, np.inf)
+        self.maximum = np.full(n_colonnes, -np.inf)
+
+    def update(self, valeurs):
+        """
+        Ajoute un bloc d'échantillons.
+
+        :param valeurs: Tableau de forme (B, n_colonnes)
+        """
+        valeurs = np.asarray(valeurs, dtype=np.float64)
+        if len(valeurs) == 0:
+            return
+        bloc = StreamingStats(valeurs.shape[1])
+        bloc.n = len(valeurs)
+        bloc.moyenne = valeurs.mean(axis=0)
+        ecarts = valeurs - bloc.moyenne
+        bloc.m2 = ecarts.T @ ecarts
+        bloc.minimum = valeurs.min(axis=0)
+        bloc.maximum = valeurs.max(axis=0)
+        self.merge(bloc)
+
+    def merge(self, autre):
+        """
+        Fusionne les statistiques d'un autre ensemble d'échantillons (formule de Chan).
+
+        :param autre: StreamingStats
+        """
+        if autre.n == 0:
+            return
+        n = self.n + autre.n
+        delta = autre.moyenne - self.moyenne
+        self.m2 = self.m2 + autre.m2 + np.outer(delta, delta) * (self.n * autre.n / n)
+        self.moyenne = self.moyenne + delta * (autre.n / n)
+        self.n = n
+        self.minimum = np.minimum(self.minimum, autre.minimum)
+        self.maximum = np.maximum(self.maximum, autre.maximum)
+
+    @property
+    def covariance(self):
+        """
+        Matrice de covariance (estimateur sans biais).
+        """
+        return self.m2 / (self.n - 1) if self.n > 1 else np.full_like(self.m2, np.nan)
+
+    @property
+    def ecart_type(self):
+        """
+        Écart type de chaque grandeur.
+        """
+        return np.sqrt(np.diag(self.covariance))
+
+
+class TDigest:
+    def __init__(self, compression=500):
+        """
+        Résumé compact d'une distribution (t-digest) permettant d'estimer ses quantiles.
+        Les centroïdes sont petits près des extrémités de la distribution et gros au centre, ce qui garde une bonne
+        précision sur les percentiles extrêmes avec environ compression / 2 centroïdes.
+
+        :param compression: Paramètre de compression (nombre de centroïdes et précision croissent avec lui)
+        """
+        self.compression = compression
+        self.moyennes = np.empty(0)
+        self.poids = np.empty(0)
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+    def _compresser(self, moyennes, poids):
+        """
+        Regroupe des centroïdes triés selon la fonction d'échelle k(q) = compression / 2π · arcsin(2q - 1) :
+        chaque centroïde couvre au plus une unité de k.
+        """
+        ordre = np.argsort(moyennes, kind='stable')
+        moyennes, poids = moyennes[ordre], poids[ordre]
+        cumul = np.cumsum(poids)
+        q = (cumul - poids / 2) / cumul[-1]
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q - 1)
+        groupes = np.floor(k - k[0]).astype(np.int64)
+        debuts = np.flatnonzero(np.r_[True, np.diff(groupes) != 0])
+        self.poids = np.add.reduceat(poids, debuts)
+        self.moyennes = np.add.reduceat(moyennes * poids, debuts) / self.poids
+
+    def update(self, valeurs):
+        """
+        Ajoute un bloc de valeurs.
+
+        :param valeurs: Tableau de forme (B,)
+        """
+        valeurs = np.asarray(valeurs, dtype=np.float64).ravel()
+        if len(valeurs) == 0:
+            return
+        self.minimum = min(self.minimum, float(valeurs.min()))
+        self.maximum = max(self.maximum, float(valeurs.max()))
+        # Les centroïdes étant déjà triés, le tri stable de _compresser se réduit à la fusion de deux suites triées
+        self._compresser(np.concatenate([self.moyennes, np.sort(valeurs)]),
+                         np.concatenate([self.poids, np.ones(len(valeurs))]))
+
+    def merge(self, autre):
+        """
+        Fusionne un autre t-digest dans celui-ci.
+
+        :param autre: TDigest
+        """
+        if len(autre.poids) == 0:
+            return
+        self.minimum = min(self.minimum, autre.minimum)
+        self.maximum = max(self.maximum, autre.maximum)
+        self._compresser(np.concatenate([self.moyennes, autre.moyennes]), np.concatenate([self.poids, autre.poids]))
+
+    def quantile(self, q):
+        """
+        Estime les quantiles par interpolation linéaire entre les centroïdes.
+
+        :param q: Probabilité(s) entre 0 et 1, scalaire ou tableau
+        :return: Quantile(s) estimé(s)
+        """
+        if len(self.poids) == 0:
+            raise ValueError("Cannot compute quantiles of an empty digest.")
+        cumul = np.cumsum(self.poids)
+        rangs = np.concatenate([[0.0], cumul - self.poids / 2, [cumul[-1]]])
+        valeurs = np.concatenate([[self.minimum], self.moyennes, [self.maximum]])
+        return np.interp(np.asarray(q, dtype=np.float64) * cumul[-1], rangs, valeurs)
+
+
+class _Accumulateur:
+    def __init__(self, compression):
+        """
+        Statistiques cumulées des grandeurs de OUTPUTS.
+        """
+        self.stats = StreamingStats(len(OUTPUTS))
+        self.digests = [TDigest(compression) for _ in OUTPUTS]
+
+    def update(self, valeurs):
+        self.stats.update(valeurs)
+        for j, digest in enumerate(self.digests):
+            digest.update(valeurs[:, j])
+
+    def merge(self, autre):
+        self.stats.merge(autre.stats)
+        for digest, autre_digest in zip(self.digests, autre.digests):
+            digest.merge(autre_digest)
+
+
+class MonteCarloResult:
+    def __init__(self, accumulateur, percentiles):
+        """
+        Dispersion du centre de gravité et du poids total.
+
+        :param accumulateur: Statistiques cumulées
+        :param percentiles: Percentiles à tabuler (en %)
+        """
+        stats = accumulateur.stats
+        self._digests = accumulateur.digests
+        self.n_echantillons = stats.n
+        self.cg_moyen = stats.moyenne[:3]  # Centre de gravité moyen (x, y, z)
+        self.cg_ecart_type = stats.ecart_type[:3]
+        self.cg_covariance = stats.covariance[:3, :3]
+        self.cg_min = stats.minimum[:3]
+        self.cg_max = stats.maximum[:3]
+        self.poids_moyen = float(stats.moyenne[3])
+        self.poids_ecart_type = float(stats.ecart_type[3])
+        self.poids_min = float(stats.minimum[3])
+        self.poids_max = float(stats.maximum[3])
+        self.percentiles = {p: self.quantile(p / 100) for p in percentiles}  # Percentile -> (cg_x, cg_y, cg_z, poids)
+
+    def quantile(self, q):
+        """
+        Estime un quantile du centre de gravité et du poids total.
+
+        :param q: Probabilité entre 0 et 1
+        :return: Tableau (cg_x, cg_y, cg_z, poids_total)
+        """
+        return np.array([float(digest.quantile(q)) for digest in self._digests])
+
+    def to_records(self):
+        """
+        Résultats sous forme d'une ligne par grandeur, pour l'export JSON ou CSV.
+
+        :return: Liste de dictionnaires
+        """
+        moyenne = np.r_[self.cg_moyen, self.poids_moyen]
+        ecart_type = np.r_[self.cg_ecart_type, self.poids_ecart_type]
+        minimum = np.r_[self.cg_min, self.poids_min]
+        maximum = np.r_[self.cg_max, self.poids_max]
+        records = []
+        for j, grandeur in enumerate(OUTPUTS):
+            record = {'grandeur': grandeur, 'n_echantillons': self.n_echantillons, 'moyenne': float(moyenne[j]),
+                      'ecart_type': float(ecart_type[j]), 'min': float(minimum[j]), 'max': float(maximum[j])}
+            record.update({f"p{p:g}": float(valeurs[j]) for p, valeurs in self.percentiles.items()})
+            records.append(record)
+        return records
+
+
+def _lire_loi(parametre, loi):
+    """
+    Vérifie une loi de tolérance et la ramène à (type, a, b) : (écart type, 0) pour la loi normale,
+    (bas, haut) pour les lois uniforme et triangulaire.
+    """
+    nom, *valeurs = loi
+    if nom not in ('normal', 'uniform', 'triangular'):
+        raise ValueError(f"Unknown distribution {nom!r} for {parametre!r}")
+    valeurs = [float(v) for v in valeurs]
+    if nom == 'normal':
+        if len(valeurs) != 1 or valeurs[0] < 0:
+            raise ValueError(f"Normal distribution of {parametre!r} needs one non-negative standard deviation.")
+        return nom, valeurs[0], 0.0
+    if len(valeurs) == 1:
+        valeurs = [-abs(valeurs[0]), abs(valeurs[0])]
+    if len(valeurs) != 2 or valeurs[0] > valeurs[1]:
+        raise ValueError(f"Distribution of {parametre!r} needs a half-width or bounds low <= high.")
+    if nom == 'triangular' and not valeurs[0] <= 0 <= valeurs[1]:
+        raise ValueError(f"Triangular bounds of {parametre!r} must contain the nominal value (low <= 0 <= high).")
+    return nom, valeurs[0], valeurs[1]
+
+
+class CGUncertainty:
+    def __init__(self, data, tolerances):
+        """
+        Initialisation du modèle d'incertitude autour de la configuration nominale.
+
+        :param data: Dictionnaire ou ComponentTable contenant les valeurs nominales des composants
+        :param tolerances: Dictionnaire {paramètre: loi} (voir la description du module)
+        """
+        self.noms, poids, positions = CenterOfGravityCalculator(data).to_arrays()
+        self.poids = np.array(poids, dtype=np.float64)
+        self.positions = np.array(positions, dtype=np.float64)
+        self.poids_nominal = float(self.poids.sum())
+        self.moments_nominaux = self.poids @ self.positions
+        index = {nom: i for i, nom in enumerate(self.noms)}
+
+        # Chaque paramètre incertain devient une colonne des tirages ; les colonnes sont regroupées par loi
+        self.parametres = []
+        lois = {'normal': ([], [], []), 'uniform': ([], [], []), 'triangular': ([], [], [])}
+        for parametre, loi in tolerances.items():
+            composant, _, grandeur = parametre.rpartition('.')
+            if composant not in index or (grandeur != 'poids' and grandeur not in AXES):
+                raise ValueError(f"Unknown uncertain parameter: {parametre!r}")
+            nom, a, b = _lire_loi(parametre, loi)
+            colonnes, bas, haut = lois[nom]
+            colonnes.append(len(self.parametres))
+            bas.append(a)
+            haut.append(b)
+            self.parametres.append((index[composant], grandeur))
+        self._lois = {nom: (np.array(c, dtype=np.int64), np.array(a), np.array(b))
+                      for nom, (c, a, b) in lois.items() if c}
+
+        # Colonnes des poids incertains, et pour chaque position incertaine : composant, axe et colonne du poids
+        # du même composant s'il est lui aussi incertain
+        colonne_poids = {i: j for j, (i, grandeur) in enumerate(self.parametres) if grandeur == 'poids'}
+        self._colonnes_poids = np.array(list(colonne_poids.values()), dtype=np.int64)
+        self._positions_poids = self.positions[list(colonne_poids)].reshape(-1, 3)
+        positions = [(j, i, AXES[grandeur]) for j, (i, grandeur) in enumerate(self.parametres) if grandeur != 'poids']
+        self._colonnes_positions = np.array([j for j, _, _ in positions], dtype=np.int64)
+        self._poids_positions = self.poids[[i for _, i, _ in positions]]
+        self._axes_positions = np.zeros((len(positions), 3))
+        self._axes_positions[np.arange(len(positions)), [a for _, _, a in positions]] = 1.0
+        self._poids_lies = [(k, colonne_poids[i]) for k, (_, i, _) in enumerate(positions) if i in colonne_poids]
+
+    def sample_deviations(self, rng, n):
+        """
+        Tire les écarts à la valeur nominale de chaque paramètre incertain.
+
+        :param rng: numpy.random.Generator
+        :param n: Nombre d'échantillons
+        :return: Tableau de forme (n, nombre de paramètres incertains)
+        """
+        ecarts = np.empty((n, len(self.parametres)))
+        for nom in ('normal', 'uniform', 'triangular'):
+            if nom not in self._lois:
+                continue
+            colonnes, a, b = self._lois[nom]
+            u = rng.random((n, len(colonnes))) if nom != 'normal' else rng.standard_normal((n, len(colonnes)))
+            if nom == 'normal':
+                ecarts[:, colonnes] = u * a
+            elif nom == 'uniform':
+                ecarts[:, colonnes] = a + u * (b - a)
+            else:
+                # Inversion de la fonction de répartition de la loi triangulaire de mode 0
+                largeur = b - a
+                mode = np.divide(-a, largeur, out=np.zeros_like(largeur), where=largeur > 0)
+                ecarts[:, colonnes] = np.where(u < mode, a + np.sqrt(u * largeur * -a),
+                                               b - np.sqrt((1 - u) * largeur * b))
+        return ecarts
+
+    def sample_block(self, rng, n):
+        """
+        Tire n configurations et calcule leur centre de gravité. Seuls les composants incertains interviennent :
+        le coût ne dépend pas du nombre total de composants.
+
+        :param rng: numpy.random.Generator
+        :param n: Nombre d'échantillons
+        :return: Tuple (cg de forme (n, 3), poids_total de forme (n,))
+        """
+        ecarts = self.sample_deviations(rng, n)
+        ecarts_poids = ecarts[:, self._colonnes_poids]
+        poids_total = self.poids_nominal + ecarts_poids.sum(axis=1)
+        moments = self.moments_nominaux + ecarts_poids @ self._positions_poids
+        if len(self._colonnes_positions):
+            # Moment supplémentaire w_i · dp_i, avec le poids tiré du composant s'il est incertain
+            poids_deplaces = np.tile(self._poids_positions, (n, 1))
+            for k, j in self._poids_lies:
+                poids_deplaces[:, k] += ecarts[:, j]
+            moments += (poids_deplaces * ecarts[:, self._colonnes_positions]) @ self._axes_positions
+        return moments / poids_total[:, np.newaxis], poids_total
+
+    def _simuler_bloc(self, graine, n, compression):
+        """
+        Simule un bloc d'échantillons (exécuté éventuellement dans un processus de travail).
+        """
+        cg, poids_total = self.sample_block(np.random.default_rng(graine), n)
+        accumulateur = _Accumulateur(compression)
+        accumulateur.update(np.column_stack([cg, poids_total]))
+        return accumulateur
+
+    def run(self, n_echantillons, seed=0, taille_bloc=100_000, workers=1, percentiles=DEFAULT_PERCENTILES,
+            compression=500):
+        """
+        Propage les tolérances par Monte-Carlo.
+
+        :param n_echantillons: Nombre total d'échantillons
+        :param seed: Graine (entier) ou numpy.random.SeedSequence
+        :param taille_bloc: Nombre d'échantillons tirés à la fois
+        :param workers: Nombre de processus (1 : dans le processus courant)
+        :param percentiles: Percentiles à tabuler (en %)
+        :param compression: Paramètre de compression des t-digests
+        :return: MonteCarloResult
+        """
+        if n_echantillons <= 0:
+            raise ValueError("n_echantillons must be positive.")
+        sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        tailles = [min(taille_bloc, n_echantillons - debut) for debut in range(0, n_echantillons, taille_bloc)]
+        graines = sequence.spawn(len(tailles))
+
+        total = _Accumulateur(compression)
+        if workers <= 1:
+            for graine, n in zip(graines, tailles):
+                total.merge(self._simuler_bloc(graine, n, compression))
+            return MonteCarloResult(total, percentiles)
+
+        # Les blocs sont fusionnés dans leur ordre : le résultat ne dépend pas du nombre de processus.
+        # Le nombre de blocs en attente est limité pour garder une mémoire bornée.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            en_attente = deque()
+            for graine, n in zip(graines, tailles):
+                en_attente.append(executor.submit(self._simuler_bloc, graine, n, compression))
+                if len(en_attente) >= 2 * workers:
+                    total.merge(en_attente.popleft().result())
+            while en_attente:
+                total.merge(en_attente.popleft().result())
+        return MonteCarloResult(total, percentiles)
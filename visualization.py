@@ -3,7 +3,10 @@ Ce module contient la classe Visualization3D qui permet de visualiser en 3D les
 ainsi que le centre de gravité calculé.
 """
 
-import matplotlib.pyplot as plt
+import numpy as np
+
+from component_table import ComponentTable
+from instrumentation import profiled, stage
 
 
 class Visualization3D:
@@ -11,16 +14,18 @@ class Visualization3D:
         """
         Initialise la classe Visualization3D avec les données des composants de l'avion et le centre de gravité calculé.
 
-        :param data: Dictionnaire contenant les positions et poids des composants de l'avion
+        :param data: Dictionnaire ou ComponentTable contenant les positions et poids des composants de l'avion
         :param cg: Tuple contenant les coordonnées du centre de gravité (X, Y, Z)
         """
         self.data = data
         self.cg = cg
 
+    @profiled
     def plot_aircraft(self):
         """
         Affiche une visualisation 3D des composants de l'avion et du centre de gravité.
         """
+        import matplotlib.pyplot as plt  # Import différé : matplotlib n'est chargé que pour tracer
         fig = plt.figure()
         ax = fig.add_subplot(111, projection='3d')
 
@@ -32,8 +37,11 @@ class Visualization3D:
         ax.scatter(*self.cg, color='green', s=100, label='Centre de Gravité')
 
         # Fixer les limites des axes
-        x_max = max(abs(self.data[comp]['position'][0]) for comp in
-                    self.data)  # Trouver la valeur maximale de X parmi tous les composants
+        if isinstance(self.data, ComponentTable):
+            x_max = float(np.abs(self.data.x).max())  # Lecture directe de la colonne X, sans copie
+        else:
+            x_max = max(abs(self.data[comp]['position'][0]) for comp in
+                        self.data)  # Trouver la valeur maximale de X parmi tous les composants
         x_limits = [0, x_max]  # Limites pour X basées sur la valeur maximale de X des composants
 
         # Appliquer les limites à l'axe X
@@ -43,4 +51,5 @@ class Visualization3D:
         ax.set_ylabel('Y')
         ax.set_zlabel('Z')
         ax.legend()
-        plt.show()
+        with stage('Visualization3D.show'):  # Attente de la fermeture de la fenêtre
+            plt.show()